@@ -0,0 +1,197 @@
+"""Monte Carlo forecast of which players survive until my next pick.
+
+Every simulated continuation gives each available player a noisy draft slot,
+centred on their ADP with a spread taken from how much the ranking sources
+(Yahoo, Sleeper, RTSports) disagree. Opponents take the lowest slots in
+order, so a player survives a continuation when enough others land ahead of
+them. Only the top of the board is sampled; anyone far past the picks to go
+survives every time.
+"""
+
+import random
+import statistics
+import time
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from best_available import BestAvailable, RankedPlayer, get_best_available
+from draft_state import DraftState
+
+DEFAULT_SIMULATIONS = 2000
+# Rank spread floor, and the share of ADP added for later picks being noisier
+MIN_SPREAD = 1.5
+SPREAD_SHARE = 0.08
+# Players sampled beyond the number of picks before my next selection
+POOL_MARGIN = 40
+# A position can wait when one of its top WAIT_DEPTH players likely survives
+WAIT_DEPTH = 3
+CAN_WAIT = 0.75
+RISKY = 0.4
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
+# Each player's slot is drawn from a table of this many evenly spaced normal
+# quantiles (out to about 2.7 sigma), indexed by one random byte per draw,
+# which is far cheaper than calling random.gauss for every draw
+QUANTILES = 256
+
+
+@dataclass
+class AvailabilityForecast:
+    # Overall pick number of my next selection
+    next_pick_no: int
+    # Opponent picks made before it
+    picks_before: int
+    simulations: int
+    # sleeper_id -> share of continuations the player is still there
+    survival: Dict[str, float] = field(default_factory=dict)
+    # position -> share of continuations one of its top WAIT_DEPTH survives
+    position_survival: Dict[str, float] = field(default_factory=dict)
+
+    def chance(self, player_id: str) -> float:
+        """Survival odds for a player; anyone outside the sampled pool is safe."""
+        return self.survival.get(player_id, 1.0)
+
+    def wait_signal(self, position: str) -> str:
+        chance = self.position_survival.get(position, 1.0)
+        if chance >= CAN_WAIT:
+            return "CAN WAIT"
+        if chance >= RISKY:
+            return "RISKY"
+        return "TAKE NOW"
+
+
+@lru_cache(maxsize=1)
+def normal_quantiles() -> Tuple[float, ...]:
+    """Standard normal quantiles at the midpoints of QUANTILES equal bins."""
+    inv_cdf = statistics.NormalDist().inv_cdf
+    return tuple(inv_cdf((k + 0.5) / QUANTILES) for k in range(QUANTILES))
+
+
+def player_spread(player: RankedPlayer) -> float:
+    """Standard deviation of a player's draft slot, in picks."""
+    sources = [
+        rank
+        for rank in (player.yahoo_rank, player.sleeper_rank, player.rtsports_rank)
+        if rank < 999
+    ]
+    disagreement = statistics.pstdev(sources) if len(sources) > 1 else 0.0
+    return max(disagreement, MIN_SPREAD, SPREAD_SHARE * player.avg_rank)
+
+
+def picks_before_next(
+    draft_state: DraftState, user_id: str
+) -> Optional[Tuple[int, int]]:
+    """My next selection and how many opponent picks come before it.
+
+    On the clock, "next" means the selection after this one.
+    """
+    if not draft_state.draft:
+        return None
+    current = draft_state.next_pick_no
+    if draft_state.is_on_clock(user_id):
+        next_pick = draft_state.next_pick_for_user(user_id, after=current)
+        picks_before = next_pick - current - 1
+    else:
+        next_pick = draft_state.next_pick_for_user(user_id)
+        picks_before = next_pick - current
+    if not next_pick:
+        return None
+    return next_pick, picks_before
+
+
+def forecast_availability(
+    draft_state: DraftState,
+    user_id: str,
+    simulations: int = DEFAULT_SIMULATIONS,
+    seed: int = 0,
+    rankings: Optional[BestAvailable] = None,
+) -> Optional[AvailabilityForecast]:
+    """Simulate the picks before my next selection and count who survives.
+
+    The seed is fixed by default, so the same board gives the same forecast
+    (and the same prompt, which keeps inference results cacheable).
+    """
+    started = time.perf_counter()
+    horizon = picks_before_next(draft_state, user_id)
+    if horizon is None:
+        return None
+    next_pick, picks_before = horizon
+
+    index = draft_state.index_for(rankings or get_best_available())
+    pool = index.top(None, k=picks_before + POOL_MARGIN)
+    forecast = AvailabilityForecast(next_pick, picks_before, simulations)
+    if not pool:
+        return forecast
+
+    size = len(pool)
+    quantiles = normal_quantiles()
+    # Every slot each player can be drawn at, indexed by a random byte
+    slot_tables = [
+        [player.avg_rank + spread * q for q in quantiles]
+        for player, spread in zip(pool, map(player_spread, pool))
+    ]
+
+    # Which of its position's top WAIT_DEPTH players each pool entry is, if any
+    positions = list(dict.fromkeys(p.position for p in pool))
+    top_of = array("b", [-1] * size)
+    depth = [0] * len(positions)
+    for i, player in enumerate(pool):
+        p = positions.index(player.position)
+        if depth[p] < WAIT_DEPTH:
+            top_of[i] = p
+            depth[p] += 1
+
+    taken_counts = [0] * size
+    position_survived = [0] * len(positions)
+    if picks_before > 0:
+        # One batch of random bytes for every continuation, sliced per run
+        noise = random.Random(seed).randbytes(simulations * size)
+        slots = range(size)
+        for sim in range(simulations):
+            z = noise[sim * size : (sim + 1) * size]
+            drawn = [table[k] for table, k in zip(slot_tables, z)]
+            top_taken = [0] * len(positions)
+            for i in sorted(slots, key=drawn.__getitem__)[:picks_before]:
+                taken_counts[i] += 1
+                if top_of[i] >= 0:
+                    top_taken[top_of[i]] += 1
+            for p, taken in enumerate(top_taken):
+                if taken < depth[p]:
+                    position_survived[p] += 1
+    else:
+        position_survived = [simulations] * len(positions)
+
+    forecast.survival = {
+        player.sleeper_id: 1 - taken_counts[i] / simulations
+        for i, player in enumerate(pool)
+    }
+    forecast.position_survival = {
+        position: count / simulations
+        for position, count in zip(positions, position_survived)
+    }
+    # Positions with nobody near the top of the board all survive
+    for position in index.by_position:
+        if position not in forecast.position_survival and index.top(position, k=1):
+            forecast.position_survival[position] = 1.0
+    print(
+        f"🎲 Simulated {simulations:,} drafts to my pick #{next_pick} "
+        f"({picks_before} picks away) in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return forecast
+
+
+def format_wait_signals(forecast: AvailabilityForecast) -> str:
+    """Prompt section saying which positions can wait until my next pick."""
+    summary = (
+        f"\n\n## CAN I WAIT? (next pick #{forecast.next_pick_no}, "
+        f"{forecast.picks_before} picks away, {forecast.simulations:,} simulated drafts)\n\n"
+        f"| Position | Chance one of its top {WAIT_DEPTH} is still there | Signal |\n"
+        "|----------|------|--------|\n"
+    )
+    for position in POSITIONS:
+        if position not in forecast.position_survival:
+            continue
+        chance = forecast.position_survival[position]
+        summary += f"| {position} | {chance:.0%} | {forecast.wait_signal(position)} |\n"
+    return summary
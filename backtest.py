@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""Replay finished drafts through the recommendation pipeline.
+
+Each of my picks in a past draft is rebuilt as the board stood at that moment
+and sent through the usual prompt builder and consensus, with no pick timer.
+The model is replaced by a stub (best ADP among the players the prompt lists)
+unless results recorded by earlier live runs are replayed, or live calls are
+asked for. Drafts come from a local cache that never expires, so repeated
+backtests of prompt or strategy changes need no network at all.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import re
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import chopped
+import normal
+from best_available import BestAvailable, get_best_available
+from draft_common import InferenceOptions, load_player_bios, read_strategy
+from draft_state import DraftState
+from fast_pick import quick_pick
+from inference_client import (
+    ResultCache,
+    configure_inference,
+    estimate_tokens,
+    set_inference_client,
+)
+from sleeper_api import (
+    CACHE_TTLS,
+    AsyncSleeperAPI,
+    Draft,
+    DraftPick,
+    DraftPickData,
+    DraftStatus,
+    ResponseCache,
+)
+
+HISTORY_CACHE_DIR = ".draft_history"
+# Finished drafts never change, so their picks are kept for good
+HISTORY_TTLS = [
+    (r"^/draft/[^/]+(/picks|/traded_picks)?$", 10 * 365 * 24 * 60 * 60)
+] + CACHE_TTLS
+DEFAULT_CONCURRENCY = 8
+LLM_MODES = ["stub", "recorded", "live"]
+
+BEST_AVAILABLE_ROW = re.compile(r"^\| [A-Z]+\d+ \| (.+?) \| [A-Z]+ \|", re.M)
+
+
+@dataclass
+class ReplayResponse:
+    id: str
+    output_text: str
+    usage: None = None
+
+
+class RecordedResults(ResultCache):
+    """Results saved by earlier live runs, at any age, without storing stubs."""
+
+    def __init__(self):
+        super().__init__(max_age=float("inf"))
+
+    def set(self, key: str, result: dict):
+        pass
+
+
+class ReplayInferenceClient:
+    """Offline stand-in for InferenceClient.
+
+    Answers with the best-ranked player in the prompt's best available tables.
+    """
+
+    def __init__(
+        self, rankings: BestAvailable, result_cache: Optional[ResultCache] = None
+    ):
+        self.rankings = rankings
+        self.result_cache = result_cache
+        self.calls = 0
+        self.input_tokens = 0
+
+    def answer(self, prompt: str) -> str:
+        _, _, tables = prompt.partition("## BEST AVAILABLE PLAYERS")
+        listed = [
+            player
+            for name in BEST_AVAILABLE_ROW.findall(tables)
+            if (player := self.rankings.find_by_name(name)) is not None
+        ]
+        if not listed:
+            return "Stub: no listed players."
+        best = min(listed, key=lambda p: p.rank)
+        return f"Stub pick by ADP.\n\n[[{best.name}]]"
+
+    async def create_response(self, **kwargs) -> ReplayResponse:
+        prompt = str(kwargs.get("input", ""))
+        self.calls += 1
+        self.input_tokens += estimate_tokens(prompt)
+        return ReplayResponse(
+            id=f"replay-{self.calls}", output_text=self.answer(prompt)
+        )
+
+    async def stream_response(self, **kwargs) -> AsyncIterator[SimpleNamespace]:
+        response = await self.create_response(**kwargs)
+        yield SimpleNamespace(
+            type="response.output_text.delta", delta=response.output_text
+        )
+        yield SimpleNamespace(type="response.completed", response=response)
+
+
+@dataclass
+class Decision:
+    draft_id: str
+    pick_no: int
+    round: int
+    actual: str
+    actual_rank: Optional[int]
+    assistant: Optional[str]
+    assistant_rank: Optional[int]
+    fast: Optional[str]
+    fast_rank: Optional[int]
+    fallback: bool
+    cached_results: int
+    results: int
+
+
+async def load_history(
+    api: AsyncSleeperAPI, draft_id: str
+) -> Tuple[Draft, List[DraftPickData], List[DraftPick]]:
+    """Get a finished draft and its picks, from the local cache when possible."""
+    draft, picks, traded_picks = await asyncio.gather(
+        api.get_draft(draft_id),
+        api.get_draft_picks(draft_id),
+        api.get_draft_traded_picks(draft_id),
+    )
+    if draft.status != DraftStatus.COMPLETE:
+        # Don't keep an unfinished board around forever
+        if api.cache:
+            for endpoint in ("", "/picks", "/traded_picks"):
+                api.cache.invalidate(f"/draft/{draft_id}{endpoint}")
+        raise ValueError(f"draft is {draft.status.value}, not complete")
+    return draft, picks, traded_picks
+
+
+async def replay_draft(
+    draft: Draft,
+    picks: List[DraftPickData],
+    traded_picks: List[DraftPick],
+    user_id: str,
+    league_type: str,
+    player_bios: Dict[str, dict],
+    num_inferences: int,
+    options: InferenceOptions,
+) -> List[Decision]:
+    """Ask the pipeline for each of my picks, as the board stood before it."""
+    ba = get_best_available()
+    by_id = {p.sleeper_id: p for p in ba.adp_rankings}
+    # Without these the past pick timer would look expired at every pick
+    draft = draft.model_copy(update={"last_picked": None, "start_time": None})
+    state = DraftState.from_picks(
+        draft.draft_id, [], draft=draft, traded_picks=traded_picks
+    )
+
+    decisions = []
+    for pick in sorted(picks, key=lambda p: p.pick_no):
+        if pick.picked_by == user_id:
+            board = state.copy()
+            fast = quick_pick(board, user_id, player_bios, ba)
+            if league_type == "chopped":
+                analysis, results = await chopped.recommend_pick(
+                    board, user_id, player_bios, num_inferences, options
+                )
+            else:
+                analysis, results = await normal.recommend_pick(
+                    board,
+                    user_id,
+                    player_bios,
+                    read_strategy(normal.STRATEGY_FILE),
+                    num_inferences,
+                    options,
+                )
+
+            actual = by_id.get(pick.player_id or "")
+            assistant = ba.find_by_name(analysis["consensus_pick"] or "")
+            decisions.append(
+                Decision(
+                    draft_id=draft.draft_id,
+                    pick_no=pick.pick_no,
+                    round=pick.round,
+                    actual=(
+                        actual.name
+                        if actual
+                        else (
+                            f"{pick.metadata.first_name} {pick.metadata.last_name}"
+                            if pick.metadata
+                            else str(pick.player_id)
+                        )
+                    ),
+                    actual_rank=actual.rank if actual else None,
+                    assistant=analysis["consensus_pick"],
+                    assistant_rank=assistant.rank if assistant else None,
+                    fast=fast.player.name if fast else None,
+                    fast_rank=fast.player.rank if fast else None,
+                    fallback=bool(analysis.get("fallback")),
+                    cached_results=sum(1 for r in results if r.get("cached")),
+                    results=len(results),
+                )
+            )
+        state.add_pick(pick)
+    return decisions
+
+
+def display_summary(
+    decisions: List[Decision],
+    drafts: int,
+    elapsed: float,
+    client: Optional[ReplayInferenceClient],
+):
+    print(
+        f"\n📼 Replayed {len(decisions)} of my picks from {drafts} drafts "
+        f"in {elapsed:.1f}s"
+    )
+    if not decisions:
+        return
+
+    def share(matches: int) -> str:
+        return f"{matches}/{len(decisions)} ({matches / len(decisions):.0%})"
+
+    def mean_rank(ranks: List[Optional[int]]) -> str:
+        known = [r for r in ranks if r is not None]
+        return f"{sum(known) / len(known):.1f}" if known else "-"
+
+    print(
+        f"Assistant matched my actual pick: "
+        f"{share(sum(d.assistant == d.actual for d in decisions))}"
+    )
+    print(
+        f"Fast pick matched my actual pick: {share(sum(d.fast == d.actual for d in decisions))}"
+    )
+    print(
+        f"Assistant matched the fast pick: "
+        f"{share(sum(d.assistant == d.fast for d in decisions))}"
+    )
+    print(
+        f"Mean ADP rank - actual: {mean_rank([d.actual_rank for d in decisions])}, "
+        f"assistant: {mean_rank([d.assistant_rank for d in decisions])}, "
+        f"fast: {mean_rank([d.fast_rank for d in decisions])}"
+    )
+    fallbacks = sum(d.fallback for d in decisions)
+    if fallbacks:
+        print(f"Fell back to a local pick: {share(fallbacks)}")
+
+    cached = sum(d.cached_results for d in decisions)
+    total = sum(d.results for d in decisions)
+    if cached:
+        print(f"Recorded results replayed: {cached}/{total}")
+    if client and client.calls:
+        print(
+            f"Stubbed model calls: {client.calls} "
+            f"(~{client.input_tokens // client.calls:,} input tokens each)"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Backtest the assistant on past drafts"
+    )
+    parser.add_argument("draft_ids", nargs="*", help="Finished Sleeper draft IDs")
+    parser.add_argument(
+        "--drafts-file", help="File with one draft ID per line, added to draft_ids"
+    )
+    parser.add_argument(
+        "--user", help="User whose picks to replay (default: $PLAYER_ID)"
+    )
+    parser.add_argument(
+        "--league",
+        choices=["standard", "chopped"],
+        default="standard",
+        help="League type the prompts are built for (default: standard)",
+    )
+    parser.add_argument(
+        "--llm",
+        choices=LLM_MODES,
+        default="stub",
+        help="stub answers offline; recorded replays cached results from live "
+        "runs (stub on a miss); live calls the model (default: stub)",
+    )
+    parser.add_argument(
+        "--inferences",
+        type=int,
+        default=1,
+        help="Number of parallel inferences per pick (default: 1)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Drafts replayed at once (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--focus-strategy",
+        action="store_true",
+        help="Send only the strategy sections relevant to each pick",
+    )
+    parser.add_argument(
+        "--forecast",
+        action="store_true",
+        help="Include the availability forecast in each prompt",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        help="Approximate input tokens per prompt; player bios are trimmed to fit",
+    )
+    parser.add_argument(
+        "--output", help="Write every decision to this file as JSON lines"
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Show the pipeline's own output while replaying",
+    )
+    args = parser.parse_args()
+
+    draft_ids = list(args.draft_ids)
+    if args.drafts_file:
+        with open(args.drafts_file, "r") as f:
+            draft_ids += [line.strip() for line in f if line.strip()]
+    if not draft_ids:
+        parser.error("give at least one draft ID or --drafts-file")
+
+    user_id = args.user or os.getenv("PLAYER_ID")
+    if not user_id:
+        print("ERROR: pass --user or set the PLAYER_ID environment variable")
+        return
+
+    rankings = get_best_available()
+    client = None
+    if args.llm == "live":
+        configure_inference()
+    else:
+        cache = RecordedResults() if args.llm == "recorded" else None
+        client = ReplayInferenceClient(rankings, cache)
+        set_inference_client(client)
+
+    options = InferenceOptions(
+        token_budget=args.token_budget,
+        focus_strategy=args.focus_strategy,
+        forecast=args.forecast,
+    )
+    player_bios = await asyncio.to_thread(load_player_bios)
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    report = sys.stdout
+
+    async with AsyncSleeperAPI(
+        cache=ResponseCache(HISTORY_CACHE_DIR, HISTORY_TTLS)
+    ) as api:
+
+        async def backtest(draft_id: str) -> List[Decision]:
+            async with semaphore:
+                try:
+                    draft, picks, traded_picks = await load_history(api, draft_id)
+                except Exception as e:
+                    print(f"Skipping {draft_id}: {e}", file=report)
+                    return []
+                if not any(p.picked_by == user_id for p in picks):
+                    print(f"Skipping {draft_id}: {user_id} made no picks", file=report)
+                    return []
+                decisions = await replay_draft(
+                    draft,
+                    picks,
+                    traded_picks,
+                    user_id,
+                    args.league,
+                    player_bios,
+                    args.inferences,
+                    options,
+                )
+                matches = sum(d.assistant == d.actual for d in decisions)
+                print(
+                    f"✓ {draft_id}: {len(decisions)} picks, "
+                    f"{matches} matched what I took",
+                    file=report,
+                )
+                return decisions
+
+        # The pipeline narrates every pick; keep it out of the report unless asked
+        with redirect_stdout(report if args.verbose else io.StringIO()):
+            replays = await asyncio.gather(*(backtest(d) for d in draft_ids))
+
+    decisions = [d for replay in replays for d in replay]
+    if args.output:
+        with open(args.output, "w") as f:
+            for decision in decisions:
+                f.write(json.dumps(asdict(decision)) + "\n")
+        print(f"Wrote {len(decisions)} decisions to {args.output}")
+
+    display_summary(
+        decisions,
+        sum(1 for replay in replays if replay),
+        time.perf_counter() - started,
+        client,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,12 +2,18 @@
 """Best available players analysis using ADP rankings."""
 
 import json
-import random
+import os
+from array import array
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
+from rankings_store import RankingsTable, binary_path
 
-@dataclass
+RANKINGS_FILE = "adp_rankings.json"
+
+
+@dataclass(slots=True)
 class RankedPlayer:
     sleeper_id: str
     name: str
@@ -17,16 +23,155 @@ class RankedPlayer:
     avg_rank: float
     position_rank: int
     bye_week: int = 0
+    yahoo_rank: int = 999
+    sleeper_rank: int = 999
+    rtsports_rank: int = 999
+
+
+class LazyRankings(Sequence[RankedPlayer]):
+    """Ranked players backed by a binary table, each built on first access."""
+
+    def __init__(self, table: RankingsTable):
+        self.table = table
+        self._players: List[Optional[RankedPlayer]] = [None] * len(table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        player = self._players[i]
+        if player is None:
+            player = self._players[i] = RankedPlayer(**self.table.row(i))
+        return player
+
+
+Rankings = Union[List[RankedPlayer], LazyRankings]
+
+
+def ranking_column(players: Rankings, field: str) -> Sequence:
+    """One field for every player, read straight from the table when lazy."""
+    if isinstance(players, LazyRankings):
+        return players.table.column(field)
+    return [getattr(p, field) for p in players]
+
+
+class BestAvailableIndex:
+    """Incremental best-available index that ingests picks one at a time.
+
+    Every ranked player is identified by its row in the rankings. The overall
+    and per-position orders are compact rank-sorted arrays of rows, each with
+    a cursor past its leading run of taken players, so top-k queries don't
+    rescan the drafted pool. Players are only built when a query returns them.
+    """
+
+    def __init__(self, players: Rankings):
+        self.source = players
+        self.players = players
+        ranks = ranking_column(players, "rank")
+        positions = ranking_column(players, "position")
+        self.index_of = {
+            player_id: i
+            for i, player_id in enumerate(ranking_column(players, "sleeper_id"))
+        }
+        self.taken = bytearray(len(players))
+        self.overall = array("I", sorted(range(len(players)), key=ranks.__getitem__))
+        self.by_position: Dict[str, array] = {}
+        for i in self.overall:
+            self.by_position.setdefault(positions[i], array("I")).append(i)
+        self.cursors: Dict[Optional[str], int] = {pos: 0 for pos in self.by_position}
+        self.cursors[None] = 0
+
+    def copy(self) -> "BestAvailableIndex":
+        """Copy the taken bitmap and cursors, sharing the read-only arrays."""
+        clone = object.__new__(BestAvailableIndex)
+        clone.source = self.source
+        clone.players = self.players
+        clone.index_of = self.index_of
+        clone.overall = self.overall
+        clone.by_position = self.by_position
+        clone.taken = bytearray(self.taken)
+        clone.cursors = dict(self.cursors)
+        return clone
+
+    def take(self, player_id: str) -> bool:
+        """Mark a player as drafted. Returns False for unranked players."""
+        i = self.index_of.get(player_id)
+        if i is None:
+            return False
+        self.taken[i] = 1
+        return True
+
+    def ingest(self, player_ids: Iterable[str]):
+        """Mark several players as drafted."""
+        for player_id in player_ids:
+            self.take(player_id)
+
+    def is_available(self, player_id: str) -> bool:
+        """Check whether a ranked player is still on the board."""
+        i = self.index_of.get(player_id)
+        return i is not None and not self.taken[i]
+
+    def top(self, position: Optional[str] = None, k: int = 5) -> List[RankedPlayer]:
+        """Get the k best available players at a position, or overall if None."""
+        ranked = self.overall if position is None else self.by_position.get(position)
+        if ranked is None:
+            return []
+
+        # Skip the drafted prefix once, so later queries start past it
+        cursor = self.cursors[position]
+        while cursor < len(ranked) and self.taken[ranked[cursor]]:
+            cursor += 1
+        self.cursors[position] = cursor
+
+        available = []
+        for i in ranked[cursor:]:
+            if not self.taken[i]:
+                available.append(self.players[i])
+                if len(available) >= k:
+                    break
+        return available
+
+    def best_available_by_position(
+        self, limit: int = 5
+    ) -> Dict[str, List[RankedPlayer]]:
+        """Get best available players for each position."""
+        best_by_pos = {}
+        for position in self.by_position:
+            available = self.top(position, limit)
+            if available:
+                best_by_pos[position] = available
+        return best_by_pos
 
 
 class BestAvailable:
-    def __init__(self):
+    def __init__(self, rankings_file: str = RANKINGS_FILE):
+        self.rankings_file = rankings_file
         self.adp_rankings = self._load_adp_rankings()
-        self.players_by_position = self._group_by_position()
 
-    def _load_adp_rankings(self) -> List[RankedPlayer]:
-        """Load ADP rankings from JSON file."""
-        with open("adp_rankings.json", "r") as f:
+    @cached_property
+    def players_by_position(self) -> Dict[str, List[RankedPlayer]]:
+        return self._group_by_position()
+
+    @cached_property
+    def bye_weeks(self) -> Dict[str, int]:
+        return dict(
+            zip(
+                ranking_column(self.adp_rankings, "sleeper_id"),
+                ranking_column(self.adp_rankings, "bye_week"),
+            )
+        )
+
+    def _load_adp_rankings(self) -> Rankings:
+        """Load ADP rankings, preferring the memory-mapped binary artifact."""
+        bin_file = binary_path(self.rankings_file)
+        if os.path.exists(bin_file) and os.path.getmtime(bin_file) >= os.path.getmtime(
+            self.rankings_file
+        ):
+            return self._load_binary_rankings(bin_file)
+
+        with open(self.rankings_file, "r") as f:
             data = json.load(f)
 
         rankings = []
@@ -41,11 +186,18 @@ class BestAvailable:
                     avg_rank=item["avg_rank"],
                     position_rank=item["position_rank"],
                     bye_week=item.get("bye_week", 0),
+                    yahoo_rank=item.get("yahoo_rank", 999),
+                    sleeper_rank=item.get("sleeper_rank", 999),
+                    rtsports_rank=item.get("rtsports_rank", 999),
                 )
             )
 
         return rankings
 
+    def _load_binary_rankings(self, bin_file: str) -> LazyRankings:
+        """Load ADP rankings from the columnar artifact, building players lazily."""
+        return LazyRankings(RankingsTable(bin_file))
+
     def _group_by_position(self) -> Dict[str, List[RankedPlayer]]:
         """Group players by position, sorted by rank."""
         by_position: Dict[str, List[RankedPlayer]] = {}
@@ -89,6 +241,20 @@ class BestAvailable:
 
         return best_by_pos
 
+    def build_index(self, taken_ids: Iterable[str] = ()) -> BestAvailableIndex:
+        """Build an incremental index with the given players already drafted."""
+        index = BestAvailableIndex(self.adp_rankings)
+        index.ingest(taken_ids)
+        return index
+
+    def find_by_name(self, name: str) -> Optional[RankedPlayer]:
+        """Find a ranked player by name, ignoring case and surrounding whitespace."""
+        target = name.strip().lower()
+        for i, player_name in enumerate(ranking_column(self.adp_rankings, "name")):
+            if player_name.lower() == target:
+                return self.adp_rankings[i]
+        return None
+
     def analyze_current_roster(self, current_picks) -> Dict[str, int]:
         """Analyze current roster composition."""
         position_counts = {"QB": 0, "RB": 0, "WR": 0, "TE": 0, "DST": 0, "K": 0}
@@ -102,55 +268,17 @@ class BestAvailable:
         return position_counts
 
 
-def format_best_available_summary(
-    draft_picks, player_slot: str, shuffle_seed: Optional[int] = None
-) -> str:
-    """Create a summary of best available players for the prompt."""
-
-    ba = BestAvailable()
-    taken_ids = ba.get_taken_player_ids(draft_picks)
-
-    # Get current player's picks
-    current_picks = [p for p in draft_picks if p.picked_by == player_slot]
-
-    # Analyze current roster
-    current_roster = ba.analyze_current_roster(current_picks)
-
-    # Get best available by position
-    best_by_position = ba.get_best_available_by_position(taken_ids, limit=5)
-
-    # Format the summary
-    summary = "\n## CURRENT ROSTER\n"
-    for pos, count in current_roster.items():
-        summary += f"{pos}: {count} | "
-    summary = summary.rstrip(" | ")
-
-    summary += "\n\n## BEST AVAILABLE PLAYERS\n\n"
+# Process-wide rankings keyed by file path, with the mtime they were loaded at
+_shared_rankings: Dict[str, Tuple[float, BestAvailable]] = {}
 
-    # Create tables for each position
-    priority_positions = ["QB", "RB", "WR", "TE", "K", "DST"]
-
-    # Shuffle positions if seed provided
-    if shuffle_seed is not None:
-        rng = random.Random(shuffle_seed)
-        priority_positions = priority_positions.copy()
-        rng.shuffle(priority_positions)
-
-    for pos in priority_positions:
-        if pos in best_by_position and best_by_position[pos]:
-            players = best_by_position[pos].copy()
-
-            # Shuffle players within position if seed provided
-            if shuffle_seed is not None:
-                rng.shuffle(players)
-
-            summary += f"### {pos}\n"
-            summary += "| Rank | Player | Team |\n"
-            summary += "|------|--------|------|\n"
-
-            for player in players:
-                summary += f"| {player.position}{player.position_rank} | {player.name} | {player.team} |\n"
 
-            summary += "\n"
+def get_best_available(rankings_file: str = RANKINGS_FILE) -> BestAvailable:
+    """Get the shared BestAvailable, reloading only when the file's mtime changes."""
+    mtime = os.path.getmtime(rankings_file)
+    cached = _shared_rankings.get(rankings_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
 
-    return summary
+    ba = BestAvailable(rankings_file)
+    _shared_rankings[rankings_file] = (mtime, ba)
+    return ba
@@ -4,39 +4,86 @@
 import argparse
 import asyncio
 import os
-from typing import List
+from dataclasses import dataclass, field
+from functools import partial
+from typing import List, Optional, Tuple
 
-from best_available import format_best_available_summary
+from availability import forecast_availability, format_wait_signals
+from conversation import DraftConversation, Lane
 from draft_common import (
-    analyze_inference_results,
+    FINAL_INSTRUCTION,
+    InferenceOptions,
+    add_governor_arguments,
+    add_inference_arguments,
+    add_watch_arguments,
     display_results,
-    format_best_available_with_bios,
+    format_available_order,
+    format_player_profiles,
+    gather_inferences,
     get_draft_recommendation,
+    inference_options,
     load_player_bios,
+    profile_token_budget,
+    read_strategy,
     render_draft_state,
+    report_shared_prefix,
+    resolve_consensus,
+    with_pick_deadline,
 )
-from sleeper_api import SleeperAPI
+from draft_state import DraftState
+from draft_watch import DraftWatcher
+from fast_pick import announce_fast_pick
+from inference_client import configure_inference
+from sleeper_api import AsyncSleeperAPI
+from speculation import Speculator
+from strategy_index import focus_sections
+
+
+@dataclass
+class StrategyLane:
+    """One inference: a conversation to continue, or a strategy to start with."""
+
+    index: int
+    previous: Optional[Lane] = None
+    strategy_file: str = ""
+    strategy_content: str = ""
+    # The focused sections strategy_content is made of, with --focus-strategy
+    strategy_sections: List[str] = field(default_factory=list)
 
 
 async def run_multiple_strategies(
-    base_message_template: str, num_inferences: int, picks, player_id: str, player_bios
+    base_message: str,
+    num_inferences: int,
+    draft_state: DraftState,
+    player_id: str,
+    player_bios,
+    options: Optional[InferenceOptions] = None,
+    conversation: Optional[DraftConversation] = None,
 ) -> List[dict]:
     """Run multiple inferences using different strategy files and shuffled player orders."""
     print(
         f"\nRunning {num_inferences} inference{'s' if num_inferences > 1 else ''} with different strategies..."
     )
 
-    # Create tasks for all inferences, cycling through strategy files
-    tasks = []
+    # Load each fresh lane's strategy up front so the prompt budget can
+    # reserve room for the longest one. A continued lane only needs its
+    # strategy when focusing, to send the sections it hasn't seen yet
+    player_bios = player_bios or {}
+    focus = options is not None and options.focus_strategy
+    lanes: List[StrategyLane] = []
     for i in range(num_inferences):
+        previous = conversation.previous(i + 1, draft_state) if conversation else None
+        if previous and not focus:
+            lanes.append(StrategyLane(i, previous=previous))
+            continue
+
         # Cycle through strategies 1-10
         strategy_num = i + 11
         strategy_file = f"chopped_strategy_{strategy_num}.md"
 
         # Try to load the strategy file
         try:
-            with open(strategy_file, "r") as f:
-                strategy_content = f.read()
+            strategy_content = read_strategy(strategy_file)
             print(f"[Inference {i+1}] Using strategy: {strategy_file}")
         except FileNotFoundError:
             print(
@@ -44,35 +91,91 @@ async def run_multiple_strategies(
             )
             # Fall back to default strategy
             try:
-                with open("chopped_league_strategy_v3.md", "r") as f:
-                    strategy_content = f.read()
+                strategy_content = read_strategy("chopped_league_strategy_v3.md")
                 strategy_file = "chopped_league_strategy_v3.md"
             except FileNotFoundError:
                 print(f"[Inference {i+1}] Error: No strategy files found")
+                if previous:
+                    lanes.append(StrategyLane(i, previous=previous))
                 continue
+        sections: List[str] = []
+        if focus:
+            sections = focus_sections(strategy_content, draft_state, player_id)
+            strategy_content = "\n\n".join(sections)
+        lanes.append(
+            StrategyLane(i, previous, strategy_file, strategy_content, sections)
+        )
 
-        # Generate shuffled best available summary with unique seed per inference
-        shuffle_seed = i + 1000  # Unique seed for each inference
-        if player_bios:
-            best_available_summary = format_best_available_with_bios(
-                picks, player_id, player_bios, shuffle_seed=shuffle_seed
+    # Instructions, roster and bios are identical for every lane; strategies
+    # differ, so they follow this shared prefix
+    head = (
+        "# CHOPPED LEAGUE DRAFT - ELIMINATION FORMAT\n\n"
+        "## CRITICAL: This is a SURVIVAL league where the LOWEST scoring team each week is ELIMINATED.\n\n"
+    )
+    forecast = (
+        forecast_availability(draft_state, player_id)
+        if options and options.forecast
+        else None
+    )
+    wait_signals = format_wait_signals(forecast) if forecast else ""
+    longest_strategy = max(
+        (lane.strategy_content for lane in lanes if not lane.previous),
+        key=len,
+        default="",
+    )
+    token_budget = profile_token_budget(
+        options,
+        head,
+        base_message,
+        "\n\n" + longest_strategy,
+        wait_signals,
+        format_available_order(draft_state, player_bios, None, forecast),
+        FINAL_INSTRUCTION,
+    )
+    shared_prefix = (
+        head
+        + base_message
+        + format_player_profiles(draft_state, player_id, player_bios, token_budget)
+        + wait_signals
+    )
+
+    # Create tasks for all inferences, cycling through strategy files
+    tasks = []
+    messages = []
+    for lane in lanes:
+        i, previous = lane.index, lane.previous
+        if conversation and previous:
+            message = conversation.delta_message(
+                previous,
+                draft_state,
+                player_bios,
+                lane.strategy_sections,
+                wait_signals,
             )
-        else:
-            best_available_summary = format_best_available_summary(
-                picks, player_id, shuffle_seed=shuffle_seed
+            print(
+                f"[Inference {i+1}] Continuing conversation "
+                f"(turn {previous.turns + 1}, {len(message):,} chars)"
+            )
+            tasks.append(
+                partial(
+                    get_draft_recommendation,
+                    message,
+                    i + 1,
+                    previous_response_id=previous.response_id,
+                )
             )
+            continue
 
-        # Build the full message with this strategy and shuffled players
-        base_message = base_message_template.replace(
-            "{BEST_AVAILABLE}", best_available_summary
-        )
+        # The lane's strategy and the shuffled ordering go after the shared part
+        shuffle_seed = i + 1000  # Unique seed for each inference
         full_message = (
-            "# CHOPPED LEAGUE DRAFT - ELIMINATION FORMAT\n\n"
-            "## CRITICAL: This is a SURVIVAL league where the LOWEST scoring team each week is ELIMINATED.\n\n"
-            + strategy_content
+            shared_prefix
             + "\n\n"
-            + base_message
+            + lane.strategy_content
+            + format_available_order(draft_state, player_bios, shuffle_seed, forecast)
+            + FINAL_INSTRUCTION
         )
+        messages.append(full_message)
 
         # Log the first inference's full message
         if i == 0:
@@ -83,88 +186,35 @@ async def run_multiple_strategies(
             print("=" * 80 + "\n")
 
         # Create the task
-        task = get_draft_recommendation(full_message, i + 1, strategy_file)
+        task = partial(
+            get_draft_recommendation, full_message, i + 1, lane.strategy_file
+        )
         tasks.append(task)
 
     if not tasks:
         return []
 
-    # Run all inferences concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Handle any exceptions
-    processed_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            processed_results.append(
-                {
-                    "inference_id": i + 1,
-                    "full_response": f"Exception: {result}",
-                    "parsed_selection": None,
-                    "success": False,
-                    "error": str(result),
-                    "strategy_used": f"chopped_strategy_{(i % 10) + 1}.md",
-                }
-            )
-        else:
-            processed_results.append(result)  # type: ignore[arg-type]
-
-    return processed_results
-
-
-async def main():
-    """Main async function to handle draft recommendations for chopped leagues."""
-    parser = argparse.ArgumentParser(
-        description="AI Fantasy Football Draft Assistant - Chopped League"
-    )
-    parser.add_argument("draft_id", help="Sleeper draft ID")
-    parser.add_argument(
-        "--inferences",
-        type=int,
-        default=1,
-        help="Number of parallel inferences to run (default: 1)",
-    )
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Show all inference responses, not just consensus",
-    )
-    parser.add_argument(
-        "--strategy",
-        type=str,
-        default="chopped_league_strategy_v3.md",
-        help="Path to strategy markdown file (default: chopped_league_strategy_v3.md)",
-    )
-
-    args = parser.parse_args()
-
-    draft_id = args.draft_id
-    num_inferences = args.inferences
-    verbose = args.verbose
-    player_id = os.getenv("PLAYER_ID")
-
-    if not player_id:
-        print("ERROR: PLAYER_ID environment variable not set")
-        return
-
-    # Load player bios
-    player_bios = load_player_bios()
+    report_shared_prefix(messages)
+    results = await gather_inferences(tasks, options)
+    if conversation:
+        conversation.record(
+            results,
+            draft_state,
+            player_bios,
+            {lane.index + 1: lane.strategy_sections for lane in lanes},
+        )
+    return results
 
-    # Get draft state
-    api = SleeperAPI()
-    picks = api.get_draft_picks(draft_id)
-    state = render_draft_state(player_id, draft_id, "chopped")
 
-    # Create base message template with placeholder
-    base_message_template = (
+def build_message_template(team_table: str) -> str:
+    """Create the static instructions that follow the strategy in every prompt."""
+    return (
         "# 🚨 LIVE DRAFT - MY PICK IS NOW! 🚨\n\n"
         + "I am currently on the clock in a LIVE DRAFT. I need to make my selection IMMEDIATELY.\n"
         + "All players shown as available ARE currently available - no one else can pick before me.\n"
         + "This is MY TURN to pick RIGHT NOW.\n\n"
         + "# Current Team:\n\n"
-        + state.get(player_id, "")
-        + "{BEST_AVAILABLE}"  # Placeholder for shuffled best available
+        + team_table
         + "\n\n## IMMEDIATE DRAFT DECISION REQUIRED\n\n"
         + "**IMPORTANT: Please use web search to find the most current 2025 NFL information including:**\n"
         + "- Recent injuries, suspensions, or player status updates\n"
@@ -172,7 +222,7 @@ async def main():
         + "- Recent training camp and preseason reports\n"
         + "- Week 1-4 matchup analysis and defensive rankings\n"
         + "- Any breaking news that affects player value\n\n"
-        + "Based on the CHOPPED LEAGUE ELIMINATION strategy above, the detailed player analyses, "
+        + "Based on the CHOPPED LEAGUE ELIMINATION strategy below, the detailed player analyses, "
         + "and CURRENT WEB INFORMATION, who should I draft with THIS PICK?\n\n"
         + "**SURVIVAL CRITICAL FACTORS:**\n"
         + "1. Will this player help AVOID ELIMINATION in Weeks 1-4?\n"
@@ -185,17 +235,138 @@ async def main():
         + "- All listed players ARE available for me to pick\n"
         + "- In Chopped leagues, one bad week = ELIMINATION. Prioritize SURVIVAL over upside!\n\n"
         + "Use web search to quickly verify current player situations, then give me the BEST PICK "
-        + "from the AVAILABLE PLAYERS shown above. "
-        + "Give your final selection in [[Player Name]] format."
+        + "from the BEST AVAILABLE PLAYERS listed at the end.\n"
     )
 
+
+async def recommend_pick(
+    draft_state: DraftState,
+    player_id: str,
+    player_bios,
+    num_inferences: int,
+    options: Optional[InferenceOptions] = None,
+    conversation: Optional[DraftConversation] = None,
+) -> Tuple[dict, List[dict]]:
+    """Run the recommendation pipeline for the current board."""
+    options = with_pick_deadline(options, draft_state)
+    fast_pick = (
+        announce_fast_pick(draft_state, player_id, player_bios or {})
+        if options.fast_pick
+        else None
+    )
+    state = render_draft_state(player_id, draft_state, "chopped")
+    base_message = build_message_template(state.get(player_id, ""))
+
     # Run multiple inferences with different strategies
     results = await run_multiple_strategies(
-        base_message_template, num_inferences, picks, player_id, player_bios
+        base_message,
+        num_inferences,
+        draft_state,
+        player_id,
+        player_bios,
+        options,
+        conversation,
+    )
+
+    # Analyze results, falling back to ADP if the pick timer ran out
+    analysis = resolve_consensus(results, draft_state, player_id, options, fast_pick)
+
+    return analysis, results
+
+
+async def main():
+    """Main async function to handle draft recommendations for chopped leagues."""
+    parser = argparse.ArgumentParser(
+        description="AI Fantasy Football Draft Assistant - Chopped League"
+    )
+    parser.add_argument("draft_id", help="Sleeper draft ID")
+    add_inference_arguments(parser)
+    add_watch_arguments(parser)
+    add_governor_arguments(parser)
+    parser.add_argument(
+        "--strategy",
+        type=str,
+        default="chopped_league_strategy_v3.md",
+        help="Path to strategy markdown file (default: chopped_league_strategy_v3.md)",
+    )
+
+    args = parser.parse_args()
+    configure_inference(
+        max_concurrency=args.max_concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        refresh=args.refresh,
     )
 
-    # Analyze results
-    analysis = analyze_inference_results(results)
+    draft_id = args.draft_id
+    num_inferences = args.inferences
+    verbose = args.verbose
+    options = inference_options(args)
+    player_id = os.getenv("PLAYER_ID")
+
+    if not player_id:
+        print("ERROR: PLAYER_ID environment variable not set")
+        return
+
+    async with AsyncSleeperAPI() as api:
+        if args.watch:
+            player_bios = await asyncio.to_thread(load_player_bios)
+            conversation = (
+                DraftConversation(player_id, "chopped") if args.chain else None
+            )
+
+            def recommend(draft_state: DraftState):
+                return recommend_pick(
+                    draft_state,
+                    player_id,
+                    player_bios,
+                    num_inferences,
+                    options,
+                    conversation,
+                )
+
+            def announce(draft_state: DraftState) -> Optional[str]:
+                return announce_fast_pick(draft_state, player_id, player_bios)
+
+            speculator = (
+                Speculator(
+                    player_id,
+                    recommend,
+                    safety_margin=args.safety_margin,
+                    fast_pick=announce if args.fast else None,
+                )
+                if args.speculate
+                else None
+            )
+
+            async def on_my_turn(draft_state: DraftState):
+                if speculator:
+                    analysis, results = await speculator.recommend(draft_state)
+                else:
+                    analysis, results = await recommend(draft_state)
+                display_results(analysis, results, verbose)
+
+            watcher = DraftWatcher(api, draft_id, player_id, interval=args.interval)
+            await watcher.watch(
+                on_my_turn, on_update=speculator.update if speculator else None
+            )
+            return
+
+        # Fetch the draft and its picks while player bios load from disk
+        draft, picks, traded_picks, player_bios = await asyncio.gather(
+            api.get_draft(draft_id),
+            api.get_draft_picks(draft_id),
+            api.get_draft_traded_picks(draft_id),
+            asyncio.to_thread(load_player_bios),
+        )
+
+    # Get draft state
+    draft_state = DraftState.from_picks(
+        draft_id, picks, draft=draft, traded_picks=traded_picks
+    )
+    analysis, results = await recommend_pick(
+        draft_state, player_id, player_bios, num_inferences, options
+    )
 
     # Display results
     display_results(analysis, results, verbose)
@@ -0,0 +1,166 @@
+"""Per-inference response chains so later picks only send what changed.
+
+Each inference lane (seed or strategy) keeps the ID of its last response. On
+my next pick the lane continues that conversation with previous_response_id
+and a short update instead of resending the strategy, bios and full board.
+The update still carries this pick's wait signals and any focused strategy
+sections the lane has not been sent yet.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Set
+
+from best_available import RankedPlayer, get_best_available
+from draft_common import format_player_bio, make_team_table
+from draft_state import DraftState
+from draft_watch import format_pick
+
+# Start a fresh conversation after this many picks so context stays bounded
+MAX_TURNS = 6
+
+DELTA_INSTRUCTIONS = (
+    "\n\n## IMMEDIATE DRAFT DECISION REQUIRED\n\n"
+    "It is MY PICK again in the same LIVE DRAFT. Follow the same strategy and "
+    "rules as before. Every player from the earlier best available lists that "
+    "is not listed as gone above is still available. Use web search to verify "
+    "anything that may have changed, then give me the BEST PICK now.\n\n"
+    "Give your final selection in [[Player Name]] format."
+)
+
+
+@dataclass
+class Lane:
+    response_id: str
+    last_pick_no: int
+    taken_ids: Set[str]
+    shown_ids: Set[str]
+    turns: int = 1
+    # Focused strategy sections already sent; empty when the whole strategy was
+    strategy_sections: Set[str] = field(default_factory=set)
+
+
+def shown_players(
+    draft_state: DraftState, player_bios: Dict[str, dict]
+) -> List[RankedPlayer]:
+    """Players the full prompt lists, matching its best-available formatter."""
+    best_by_position = draft_state.best_available_by_position(
+        get_best_available(), limit=10 if player_bios else 5
+    )
+    positions = ["QB", "RB", "WR", "TE"]
+    if not player_bios:
+        positions += ["K", "DST"]
+    return [p for pos in positions for p in best_by_position.get(pos, [])]
+
+
+class DraftConversation:
+    def __init__(self, player_id: str, league_type: str, max_turns: int = MAX_TURNS):
+        self.player_id = player_id
+        self.league_type = league_type
+        self.max_turns = max_turns
+        self.lanes: Dict[int, Lane] = {}
+
+    def previous(self, lane_id: int, draft_state: DraftState) -> Optional[Lane]:
+        """Get the lane to continue, or None if this pick needs a full prompt."""
+        lane = self.lanes.get(lane_id)
+        if lane is None or draft_state.speculative:
+            return None
+        # A rolled-back board or a long chain starts over
+        if lane.turns >= self.max_turns or not lane.taken_ids <= draft_state.taken_ids:
+            del self.lanes[lane_id]
+            return None
+        return lane
+
+    def delta_message(
+        self,
+        lane: Lane,
+        draft_state: DraftState,
+        player_bios: Dict[str, dict],
+        strategy_sections: Sequence[str] = (),
+        wait_signals: str = "",
+    ) -> str:
+        """Describe what changed on the board since the lane's last answer.
+
+        Focused strategy sections the lane hasn't seen yet (such as the next
+        round's) and this pick's wait signals are added as well.
+        """
+        message = f"# DRAFT UPDATE - PICK {draft_state.next_pick_no}\n\n"
+
+        new_picks = [p for p in draft_state.picks if p.pick_no > lane.last_pick_no]
+        message += "## Picks made since my last decision\n\n"
+        message += "".join(f"- {format_pick(p)}\n" for p in new_picks) or "- None\n"
+
+        shown = shown_players(draft_state, player_bios)
+        ba = get_best_available()
+        gone = [
+            p.name
+            for p in ba.adp_rankings
+            if p.sleeper_id in lane.shown_ids and p.sleeper_id in draft_state.taken_ids
+        ]
+        if gone:
+            message += f"\n## No longer available\n\n{', '.join(gone)}\n"
+
+        message += "\n# Current Team:\n\n"
+        message += make_team_table(
+            draft_state.team_picks(self.player_id), self.league_type
+        )
+
+        newly_shown = [p for p in shown if p.sleeper_id not in lane.shown_ids]
+        if newly_shown:
+            message += "\n\n## NEWLY LISTED AVAILABLE PLAYERS\n\n"
+            for player in newly_shown:
+                if player.sleeper_id in player_bios:
+                    message += format_player_bio(player_bios[player.sleeper_id])
+                else:
+                    message += (
+                        f"**{player.name} ({player.position}, {player.team})** "
+                        f"*ADP Rank: {player.rank}*\n"
+                    )
+                message += "\n"
+
+        new_sections = [s for s in strategy_sections if s not in lane.strategy_sections]
+        if new_sections:
+            message += "\n\n## MORE STRATEGY FOR THIS PICK\n\n"
+            message += "\n\n".join(new_sections) + "\n"
+
+        return message + wait_signals + DELTA_INSTRUCTIONS
+
+    def record(
+        self,
+        results: List[dict],
+        draft_state: DraftState,
+        player_bios: Dict[str, dict],
+        strategy_sections: Optional[Mapping[int, Sequence[str]]] = None,
+    ):
+        """Remember each lane's response so the next pick can continue it.
+
+        Lanes are keyed by inference_id. Failed or cut-short lanes start over.
+        strategy_sections gives the focused sections each lane's prompt held.
+        """
+        if draft_state.speculative:
+            return
+
+        shown_ids = {p.sleeper_id for p in shown_players(draft_state, player_bios)}
+        for result in results:
+            lane_id = result["inference_id"]
+            previous = self.lanes.pop(lane_id, None)
+            if not result["success"] or not result.get("response_id"):
+                continue
+
+            sections = set((strategy_sections or {}).get(lane_id, ()))
+            # A continued lane already knows about everything shown earlier
+            if previous and result.get("continued"):
+                seen = previous.shown_ids | shown_ids
+                sections |= previous.strategy_sections
+                turns = previous.turns + 1
+            else:
+                seen = shown_ids
+                turns = 1
+
+            self.lanes[lane_id] = Lane(
+                response_id=result["response_id"],
+                last_pick_no=draft_state.last_pick_no,
+                taken_ids=set(draft_state.taken_ids),
+                shown_ids=seen,
+                turns=turns,
+                strategy_sections=sections,
+            )
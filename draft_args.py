@@ -0,0 +1,125 @@
+"""Command-line flags shared by the draft scripts, the daemon and its client.
+
+Only uses the standard library, so draft_client.py can import it without the
+heavy imports it exists to skip. draft_common re-exports these.
+"""
+
+import argparse
+from typing import Any, Dict
+
+
+def add_inference_arguments(parser: argparse.ArgumentParser):
+    """Add the flags that shape one recommendation, shared by every front end."""
+    parser.add_argument(
+        "--inferences",
+        type=int,
+        default=1,
+        help="Number of parallel inferences to run (default: 1)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Show all inference responses, not just consensus",
+    )
+    parser.add_argument(
+        "--chain",
+        action="store_true",
+        help="Continue each inference's conversation across picks "
+        "and send only what changed",
+    )
+    parser.add_argument(
+        "--early-stop",
+        action="store_true",
+        help="Cancel remaining inferences once the consensus pick is locked in",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        help="With --early-stop, also stop once the leader has this vote share "
+        "(e.g. 0.6) after at least 3 votes",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses and count each pick as soon as it appears",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Show an instant local pick while the model consensus runs",
+    )
+    parser.add_argument(
+        "--safety-margin",
+        type=float,
+        default=10.0,
+        help="Seconds before the pick timer expires to stop waiting (default: 10)",
+    )
+    parser.add_argument(
+        "--forecast",
+        action="store_true",
+        help="Simulate the picks before my next one and show each player's odds "
+        "of lasting, plus which positions can wait",
+    )
+    parser.add_argument(
+        "--focus-strategy",
+        action="store_true",
+        help="Send only the strategy sections for the current round, roster needs "
+        "and scarce positions",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        help="Approximate input tokens per prompt; player bios are dropped or "
+        "shortened to fit",
+    )
+
+
+def add_watch_arguments(parser: argparse.ArgumentParser):
+    """Add the flags for following a live draft."""
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Poll the draft and run automatically whenever it's my pick",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls in watch mode (default: 1.0)",
+    )
+    parser.add_argument(
+        "--speculate",
+        action="store_true",
+        help="In watch mode, pre-compute my next pick while opponents are drafting",
+    )
+
+
+def add_governor_arguments(parser: argparse.ArgumentParser):
+    """Add the flags for the process-wide OpenAI client, see configure_inference."""
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        help="Max OpenAI requests in flight (default: $INFERENCE_MAX_CONCURRENCY or 8)",
+    )
+    parser.add_argument("--rpm", type=int, help="OpenAI requests-per-minute budget")
+    parser.add_argument("--tpm", type=int, help="OpenAI tokens-per-minute budget")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached inference results for identical prompts",
+    )
+
+
+def inference_option_values(args: argparse.Namespace) -> Dict[str, Any]:
+    """InferenceOptions fields from the flags add_inference_arguments adds."""
+    return {
+        "early_stop": args.early_stop,
+        "min_confidence": args.min_confidence,
+        "safety_margin": args.safety_margin,
+        "stream": args.stream,
+        "fast_pick": args.fast,
+        "token_budget": args.token_budget,
+        "focus_strategy": args.focus_strategy,
+        "forecast": args.forecast,
+    }
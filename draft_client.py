@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Thin client for the draft daemon.
+
+Only uses the standard library so each pick skips the heavy imports and data
+loading that the daemon keeps warm. Start the daemon with draft_daemon.py.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Callable, Optional
+
+from draft_args import add_inference_arguments, inference_option_values
+
+DEFAULT_SOCKET_PATH = os.getenv("DRAFT_DAEMON_SOCKET", ".draft_daemon.sock")
+
+
+def send_request(
+    request: dict,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    on_progress: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """Send one JSON request to the daemon and wait for its JSON reply.
+
+    Progress messages sent ahead of the reply, such as the fast pick, are
+    passed to on_progress as they arrive.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+
+        with sock.makefile("rb") as lines:
+            for line in lines:
+                message = json.loads(line)
+                if "progress" not in message:
+                    return message
+                if on_progress:
+                    on_progress(message["progress"])
+    raise ConnectionError("Draft daemon closed the connection without replying")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ask the draft daemon for a pick")
+    parser.add_argument(
+        "command",
+        choices=["standard", "chopped", "ping", "reload", "shutdown"],
+        help="League type to recommend for, or a daemon control command",
+    )
+    parser.add_argument("draft_id", nargs="?", help="Sleeper draft ID")
+    add_inference_arguments(parser)
+    parser.add_argument(
+        "--socket", default=DEFAULT_SOCKET_PATH, help="Daemon socket path"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command in ("standard", "chopped"):
+        player_id = os.getenv("PLAYER_ID")
+        if not player_id:
+            print("ERROR: PLAYER_ID environment variable not set")
+            return 1
+        if not args.draft_id:
+            parser.error("draft_id is required for recommendations")
+        request = {
+            "command": "recommend",
+            "league_type": args.command,
+            "draft_id": args.draft_id,
+            "player_id": player_id,
+            "inferences": args.inferences,
+            "verbose": args.verbose,
+            "chain": args.chain,
+            "options": inference_option_values(args),
+        }
+    else:
+        request = {"command": args.command}
+
+    try:
+        response = send_request(
+            request, args.socket, lambda output: print(output, flush=True)
+        )
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"ERROR: No draft daemon listening on {args.socket}")
+        print("Start one with: python draft_daemon.py")
+        return 1
+
+    if not response.get("ok"):
+        print(f"ERROR: {response.get('error', 'unknown daemon error')}")
+        return 1
+
+    print(response.get("output", "").rstrip("\n") or "ok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,45 @@
 """Common functions for draft assistants."""
 
+import argparse
 import asyncio
 import glob
+import hashlib
 import json
 import os
 import random
 import re
-from typing import Dict, List, Optional
-
-from openai import AsyncOpenAI
-
-from sleeper_api import DraftPickData, SleeperAPI
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from draft_args import (  # noqa: F401 - shared by the draft scripts
+    add_governor_arguments,
+    add_inference_arguments,
+    add_watch_arguments,
+    inference_option_values,
+)
+from draft_state import DraftState
+from inference_client import estimate_tokens, get_inference_client
+from sleeper_api import DraftPickData
+
+if TYPE_CHECKING:
+    from availability import AvailabilityForecast
+    from best_available import RankedPlayer
+
+
+# Bump when render_player_bio's output changes so saved snippets are redone
+SNIPPET_VERSION = 2
 
 
 def load_player_bios() -> Dict[str, dict]:
@@ -36,8 +65,9 @@ def load_player_bios() -> Dict[str, dict]:
             latest_file = sorted(analysis_files)[-1]
 
     try:
-        with open(latest_file, "r") as f:
-            analyses = json.load(f)
+        with open(latest_file, "rb") as f:
+            raw = f.read()
+        analyses = json.loads(raw)
 
         # Create a lookup by sleeper_id
         bios = {}
@@ -45,6 +75,7 @@ def load_player_bios() -> Dict[str, dict]:
             if "sleeper_id" in analysis and "error" not in analysis:
                 bios[analysis["sleeper_id"]] = analysis
 
+        attach_bio_snippets(latest_file, hashlib.sha256(raw).hexdigest(), bios)
         print(f"Loaded {len(bios)} player bios from {latest_file}")
         return bios
     except Exception as e:
@@ -52,52 +83,129 @@ def load_player_bios() -> Dict[str, dict]:
         return {}
 
 
+def snippet_path(analysis_file: str) -> str:
+    """Get the rendered-snippet file that sits next to an analysis file."""
+    return os.path.splitext(analysis_file)[0] + ".snippets.json"
+
+
+def attach_bio_snippets(analysis_file: str, source_hash: str, bios: Dict[str, dict]):
+    """Give every bio pre-rendered full and short snippets, reusing saved ones.
+
+    Snippets are saved next to the analysis file with the hash of its contents,
+    so they are rendered again only when the analyses (or SNIPPET_VERSION) change.
+    """
+    path = snippet_path(analysis_file)
+    # sleeper_id -> [full snippet, short snippet]
+    snippets: Optional[Dict[str, List[str]]] = None
+    try:
+        with open(path, "r") as f:
+            saved = json.load(f)
+        if saved["source_hash"] == source_hash and saved["version"] == SNIPPET_VERSION:
+            snippets = saved["snippets"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    if snippets is None:
+        snippets = {
+            pid: [render_player_bio(bio), render_player_bio(bio, short=True)]
+            for pid, bio in bios.items()
+        }
+        # Saving is only a speed-up, so a read-only checkout still gets its bios
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "source_hash": source_hash,
+                        "version": SNIPPET_VERSION,
+                        "snippets": snippets,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not save bio snippets to {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    for pid, bio in bios.items():
+        if pid in snippets:
+            bio["snippet"], bio["short_snippet"] = snippets[pid]
+        else:
+            bio["snippet"] = render_player_bio(bio)
+            bio["short_snippet"] = render_player_bio(bio, short=True)
+
+
+# Strategy markdown keyed by path, with the mtime it was read at
+_strategies: Dict[str, Tuple[float, str]] = {}
+
+
+def read_strategy(path: str) -> str:
+    """Read a strategy file, re-reading only when its mtime changes."""
+    mtime = os.path.getmtime(path)
+    cached = _strategies.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r") as f:
+        content = f.read()
+    _strategies[path] = (mtime, content)
+    return content
+
+
+# Source citations the bio generator leaves in its text
+MARKDOWN_CITATION = re.compile(r"\s*\(\[[\w\.-]+\]\([^)]+\)\)")
+DOMAIN_CITATION = re.compile(r"\s*\([^)]*(?:\.com|\.org|\.net)[^)]*\)")
+
+
 def remove_sources(text: str) -> str:
     """Remove source citations from text using regex."""
     # Remove markdown links like ([domain.com](url))
-    text = re.sub(r"\s*\(\[[\w\.-]+\]\([^)]+\)\)", "", text)
+    text = MARKDOWN_CITATION.sub("", text)
     # Remove any remaining parenthetical citations
-    text = re.sub(r"\s*\([^)]*(?:\.com|\.org|\.net)[^)]*\)", "", text)
+    text = DOMAIN_CITATION.sub("", text)
     return text.strip()
 
 
-def format_player_bio(analysis: dict) -> str:
-    """Format a single player's analysis into a readable bio."""
+def render_player_bio(analysis: dict, short: bool = False) -> str:
+    """Render a single player's analysis into a readable bio.
+
+    The short form keeps only the header and bottom line, for tight budgets.
+    """
     if "error" in analysis:
         return f"**{analysis['player_name']}** - Analysis unavailable"
 
-    bio = (
-        f"**{analysis['player_name']} ({analysis['position']}, {analysis['team']})**\n"
-    )
-    bio += f"*ADP Rank: {analysis['rank']} | Position Rank: {analysis['position']}{analysis['position_rank']}*\n\n"
+    parts = [
+        f"**{analysis['player_name']} ({analysis['position']}, {analysis['team']})**\n",
+        f"*ADP Rank: {analysis['rank']} | Position Rank: {analysis['position']}{analysis['position_rank']}*\n\n",
+    ]
+    if short:
+        if analysis.get("bottom_line"):
+            parts.append(f"{remove_sources(analysis['bottom_line'])}\n")
+        return "".join(parts)
 
     # Add summary (remove sources)
     if analysis.get("summary"):
-        clean_summary = remove_sources(analysis["summary"])
-        bio += f"{clean_summary}\n\n"
-
-    # Add bull case (limit to top 2 points for brevity)
-    if analysis.get("bull_case"):
-        bio += "**Strengths:**\n"
-        for point in analysis["bull_case"][:2]:
-            clean_point = remove_sources(point)
-            bio += f"• {clean_point}\n"
-        bio += "\n"
-
-    # Add bear case (limit to top 2 points for brevity)
-    if analysis.get("bear_case"):
-        bio += "**Concerns:**\n"
-        for point in analysis["bear_case"][:2]:
-            clean_point = remove_sources(point)
-            bio += f"• {clean_point}\n"
-        bio += "\n"
+        parts.append(f"{remove_sources(analysis['summary'])}\n\n")
+
+    # Add bull and bear cases (limit to top 2 points each for brevity)
+    for key, heading in (("bull_case", "Strengths"), ("bear_case", "Concerns")):
+        if analysis.get(key):
+            parts.append(f"**{heading}:**\n")
+            parts.extend(f"• {remove_sources(point)}\n" for point in analysis[key][:2])
+            parts.append("\n")
 
     # Add bottom line (remove sources)
     if analysis.get("bottom_line"):
-        clean_bottom_line = remove_sources(analysis["bottom_line"])
-        bio += f"**Bottom Line:** {clean_bottom_line}\n"
+        parts.append(f"**Bottom Line:** {remove_sources(analysis['bottom_line'])}\n")
+
+    return "".join(parts)
 
-    return bio
+
+def format_player_bio(analysis: dict, short: bool = False) -> str:
+    """Format a player's bio, using the snippet pre-rendered at load time."""
+    cached = analysis.get("short_snippet" if short else "snippet")
+    return cached or render_player_bio(analysis, short=short)
 
 
 def parse_draft_selection(response_content: str) -> Optional[str]:
@@ -110,27 +218,95 @@ def parse_draft_selection(response_content: str) -> Optional[str]:
     return None
 
 
+# Called with (inference_id, selection, response text so far)
+SelectionCallback = Callable[[int, str, str], None]
+InferenceRequest = Callable[..., Awaitable[dict]]
+
+
+async def stream_draft_response(
+    request: dict, inference_id: int, on_selection: Optional[SelectionCallback]
+) -> Tuple[str, Optional[str]]:
+    """Stream a response, reporting the [[Player]] selection as soon as it closes.
+
+    Returns the full text and the response ID.
+    """
+    started = time.monotonic()
+    text = ""
+    selection = None
+    response_id = None
+
+    async with aclosing(get_inference_client().stream_response(**request)) as events:
+        async for event in events:
+            if event.type == "response.completed":
+                response_id = event.response.id
+            if event.type != "response.output_text.delta":
+                continue
+            text += event.delta
+            if selection is None and "]]" in text[-len(event.delta) - 1 :]:
+                selection = parse_draft_selection(text)
+                if selection:
+                    print(
+                        f"[Inference {inference_id}] Early pick: {selection} "
+                        f"({time.monotonic() - started:.0f}s)"
+                    )
+                    if on_selection:
+                        on_selection(inference_id, selection, text)
+
+    return text, response_id
+
+
 async def get_draft_recommendation(
-    message: str, inference_id: int = 1, strategy_name: Optional[str] = None
+    message: str,
+    inference_id: int = 1,
+    strategy_name: Optional[str] = None,
+    stream: bool = False,
+    on_selection: Optional[SelectionCallback] = None,
+    previous_response_id: Optional[str] = None,
 ) -> dict:
-    """Get a single draft recommendation from the AI."""
+    """Get a single draft recommendation from the AI.
+
+    With stream, on_selection is called as soon as the pick appears. With
+    previous_response_id, message continues that response's conversation.
+    """
     try:
+        tokens = f"~{estimate_tokens(message):,} input tokens"
         if strategy_name:
             print(
-                f"[Inference {inference_id}] Starting analysis with {strategy_name}..."
+                f"[Inference {inference_id}] Starting analysis with {strategy_name} "
+                f"({tokens})..."
             )
         else:
-            print(f"[Inference {inference_id}] Starting analysis...")
-
-        client = AsyncOpenAI()
-        response = await client.responses.create(
-            model="gpt-5",
-            reasoning={"effort": "high"},
-            tools=[{"type": "web_search_preview"}],
-            input=message,
-        )
+            print(f"[Inference {inference_id}] Starting analysis ({tokens})...")
 
-        response_content = response.output_text
+        request = {
+            "model": "gpt-5",
+            "reasoning": {"effort": "high"},
+            "tools": [{"type": "web_search_preview"}],
+            "input": message,
+        }
+        if previous_response_id:
+            request["previous_response_id"] = previous_response_id
+
+        client = get_inference_client()
+        cache = client.result_cache
+        # Include the inference number so repeated identical prompts stay
+        # independent samples rather than all replaying one cached answer
+        cache_key = cache.key({**request, "sample": inference_id}) if cache else ""
+        cached = cache.get(cache_key) if cache else None
+        if cached is not None:
+            print(
+                f"[Inference {inference_id}] Cached - Pick: {cached['parsed_selection']}"
+            )
+            return {**cached, "inference_id": inference_id, "cached": True}
+
+        if stream:
+            response_content, response_id = await stream_draft_response(
+                request, inference_id, on_selection
+            )
+        else:
+            response = await client.create_response(**request)
+            response_content = response.output_text
+            response_id = response.id
         selection = parse_draft_selection(response_content)
 
         # Check if web search was used (look for citation patterns)
@@ -151,14 +327,19 @@ async def get_draft_recommendation(
             f" | Web Search: {'Yes' if used_web_search else 'No'}"
         )
 
-        return {
+        result = {
             "inference_id": inference_id,
             "full_response": response_content,
             "parsed_selection": selection,
             "success": selection is not None,
             "strategy_used": strategy_name,
             "used_web_search": used_web_search,
+            "response_id": response_id,
+            "continued": previous_response_id is not None,
         }
+        if cache and result["success"]:
+            cache.set(cache_key, result)
+        return result
 
     except Exception as e:
         print(f"[Inference {inference_id}] Error: {e}")
@@ -172,37 +353,230 @@ async def get_draft_recommendation(
         }
 
 
-async def run_multiple_inferences(message: str, num_inferences: int = 1) -> List[dict]:
-    """Run multiple AI inferences in parallel."""
-    print(f"\nRunning {num_inferences} inference{'s' if num_inferences > 1 else ''}...")
+@dataclass
+class InferenceOptions:
+    """How a batch of inferences is run and when it may stop early."""
+
+    early_stop: bool = False
+    min_confidence: Optional[float] = None
+    min_votes: int = 3
+    # Epoch seconds when the pick timer expires; results are due this many
+    # seconds earlier
+    deadline: Optional[float] = None
+    safety_margin: float = 10.0
+    stream: bool = False
+    # Show an instant local pick before the inferences finish
+    fast_pick: bool = False
+    # Approximate input tokens per prompt; bios are compacted to fit
+    token_budget: Optional[int] = None
+    # Send only the strategy sections relevant to this pick
+    focus_strategy: bool = False
+    # Simulate the picks before my next one and show who is likely to last
+    forecast: bool = False
+
+    def time_budget(self) -> Optional[float]:
+        """Seconds left before results are due, or None without a deadline."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self.safety_margin - time.time())
+
+
+def inference_options(args: argparse.Namespace) -> InferenceOptions:
+    """Build InferenceOptions from the flags add_inference_arguments adds."""
+    return InferenceOptions(**inference_option_values(args))
+
+
+class ConsensusTracker:
+    """Running vote count that knows when the leading pick is locked in."""
+
+    def __init__(self, total: int, options: InferenceOptions):
+        self.total = total
+        self.options = options
+        # A streamed pick is recorded early and may be replaced by the final parse
+        self.selections: Dict[int, Optional[str]] = {}
+
+    @property
+    def finished(self) -> int:
+        return len(self.selections)
+
+    def record(self, inference_id: int, selection: Optional[str]):
+        self.selections[inference_id] = selection
+
+    def votes(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for selection in self.selections.values():
+            if selection:
+                counts[selection] = counts.get(selection, 0) + 1
+        return counts
+
+    def is_locked(self) -> bool:
+        """Check whether the remaining inferences can no longer change the pick."""
+        counts = sorted(self.votes().values(), reverse=True)
+        if not counts:
+            return False
+
+        leader = counts[0]
+        runner_up = counts[1] if len(counts) > 1 else 0
+        if leader > runner_up + (self.total - self.finished):
+            return True
+
+        successful = sum(counts)
+        threshold = self.options.min_confidence
+        return (
+            threshold is not None
+            and successful >= self.options.min_votes
+            and leader / successful >= threshold
+        )
+
+
+def _failed_result(inference_id: int, error: str) -> dict:
+    return {
+        "inference_id": inference_id,
+        "full_response": f"Exception: {error}",
+        "parsed_selection": None,
+        "success": False,
+        "error": error,
+    }
 
-    # Create tasks for all inferences
-    tasks = [get_draft_recommendation(message, i + 1) for i in range(num_inferences)]
-
-    # Run all inferences concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Handle any exceptions
-    processed_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            processed_results.append(
-                {
-                    "inference_id": i + 1,
-                    "full_response": f"Exception: {result}",
-                    "parsed_selection": None,
-                    "success": False,
-                    "error": str(result),
-                }
+
+def estimate_time_saved(finish_times: List[float], cancelled: int) -> Optional[float]:
+    """Seconds the cancelled inferences would likely have taken to finish.
+
+    Inferences run concurrently, so the finished ones' spread of completion
+    times is extrapolated: each cancelled one is assumed to land one average
+    gap after the last. Needs two completions to measure a gap.
+    """
+    if len(finish_times) < 2 or not cancelled:
+        return None
+    finish_times = sorted(finish_times)
+    gap = (finish_times[-1] - finish_times[0]) / (len(finish_times) - 1)
+    return gap * cancelled
+
+
+async def gather_inferences(
+    requests: Sequence[InferenceRequest], options: Optional[InferenceOptions] = None
+) -> List[dict]:
+    """Run inferences concurrently, optionally stopping once consensus is locked.
+
+    Each request is called with stream and on_selection keyword arguments, as
+    get_draft_recommendation accepts. Results are returned in inference order.
+    Inferences cancelled by an early stop are included with ``cancelled`` set
+    so they are not counted as failures, unless their pick was already streamed.
+    """
+    options = options or InferenceOptions()
+    tracker = ConsensusTracker(len(requests), options)
+    streamed: Dict[int, dict] = {}
+    locked = asyncio.Event()
+
+    def on_selection(inference_id: int, selection: str, text: str):
+        tracker.record(inference_id, selection)
+        streamed[inference_id] = {
+            "inference_id": inference_id,
+            "full_response": text,
+            "parsed_selection": selection,
+            "success": True,
+        }
+        leader, count = max(tracker.votes().items(), key=lambda x: x[1])
+        print(
+            f"📊 {tracker.finished}/{tracker.total} picks in, "
+            f"leading: {leader} ({count} votes)"
+        )
+        if options.early_stop and tracker.is_locked():
+            locked.set()
+
+    # Plain futures, so the lock waiter can be awaited alongside them
+    tasks: Dict[asyncio.Future, int] = {
+        asyncio.ensure_future(
+            request(stream=options.stream, on_selection=on_selection)
+        ): i
+        + 1
+        for i, request in enumerate(requests)
+    }
+    results: Dict[int, dict] = {}
+    started = time.monotonic()
+    finish_times: List[float] = []
+
+    budget = options.time_budget()
+    if budget is not None:
+        print(f"⏱ {budget:.0f}s until results are due")
+
+    deadline_hit = False
+    pending = set(tasks)
+    lock_waiter = asyncio.ensure_future(locked.wait())
+    while pending:
+        # A later final parse can unlock the consensus again
+        waiters = pending if lock_waiter.done() else pending | {lock_waiter}
+        done, _ = await asyncio.wait(
+            waiters,
+            timeout=options.time_budget(),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not done:
+            deadline_hit = True
+            break
+
+        pending -= done
+        for task in done - {lock_waiter}:
+            finish_times.append(time.monotonic() - started)
+            inference_id = tasks[task]
+            if task.exception():
+                results[inference_id] = _failed_result(
+                    inference_id, str(task.exception())
+                )
+            else:
+                results[inference_id] = task.result()
+            tracker.record(inference_id, results[inference_id]["parsed_selection"])
+
+        if pending and options.early_stop and tracker.is_locked():
+            break
+    lock_waiter.cancel()
+
+    if pending:
+        elapsed = time.monotonic() - started
+        reason = "deadline" if deadline_hit else "consensus"
+        for task in pending:
+            task.cancel()
+            inference_id = tasks[task]
+            results[inference_id] = streamed.get(inference_id) or {
+                **_failed_result(inference_id, f"cancelled at {reason}"),
+                "cancelled": True,
+            }
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if deadline_hit:
+            print(
+                f"\n⏱ Deadline reached after {elapsed:.0f}s with "
+                f"{tracker.finished}/{tracker.total} inferences, cancelled {len(pending)}"
             )
         else:
-            processed_results.append(result)  # type: ignore[arg-type]
+            saved = estimate_time_saved(finish_times, len(pending))
+            print(
+                f"\n⏹ Consensus locked after {tracker.finished}/{tracker.total} "
+                f"inferences in {elapsed:.0f}s, cancelled {len(pending)} in flight"
+                + (f" (~{saved:.0f}s saved)" if saved is not None else "")
+            )
 
-    return processed_results
+    return [results[i] for i in sorted(results)]
+
+
+async def run_multiple_inferences(
+    message: str,
+    num_inferences: int = 1,
+    options: Optional[InferenceOptions] = None,
+) -> List[dict]:
+    """Run multiple AI inferences in parallel."""
+    print(f"\nRunning {num_inferences} inference{'s' if num_inferences > 1 else ''}...")
+
+    requests = [
+        partial(get_draft_recommendation, message, i + 1) for i in range(num_inferences)
+    ]
+    return await gather_inferences(requests, options)
 
 
 def analyze_inference_results(results: List[dict]) -> dict:
     """Analyze results from multiple inferences."""
+    cancelled = sum(1 for r in results if r.get("cancelled"))
+    results = [r for r in results if not r.get("cancelled")]
     successful_results = [r for r in results if r["success"]]
 
     if not successful_results:
@@ -212,6 +586,7 @@ def analyze_inference_results(results: List[dict]) -> dict:
             "picks_count": {},
             "total_inferences": len(results),
             "successful_inferences": 0,
+            "cancelled_inferences": cancelled,
         }
 
     # Count occurrences of each pick
@@ -230,89 +605,299 @@ def analyze_inference_results(results: List[dict]) -> dict:
         "picks_count": picks_count,
         "total_inferences": len(results),
         "successful_inferences": len(successful_results),
+        "cancelled_inferences": cancelled,
     }
 
 
-def format_best_available_with_bios(
-    draft_picks,
+def with_pick_deadline(
+    options: Optional[InferenceOptions], draft_state: DraftState
+) -> InferenceOptions:
+    """Set the options' deadline from the current pick's timer."""
+    return replace(options or InferenceOptions(), deadline=draft_state.pick_deadline())
+
+
+def starter_needs(draft_state: DraftState, player_slot: str) -> Dict[str, int]:
+    """Unfilled starting slots per position (FLEX aside) on my roster."""
+    counts: Dict[str, int] = {}
+    for pick in draft_state.team_picks(player_slot):
+        if pick.metadata and pick.metadata.position:
+            # Sleeper calls defenses DEF, the rankings call them DST
+            pos = "DST" if pick.metadata.position == "DEF" else pick.metadata.position
+            counts[pos] = counts.get(pos, 0) + 1
+
+    starters = {"QB": 1, "RB": 2, "WR": 2, "TE": 1}
+    if draft_state.draft:
+        settings = draft_state.draft.settings
+        starters = {
+            "QB": settings.slots_qb or 0,
+            "RB": settings.slots_rb or 0,
+            "WR": settings.slots_wr or 0,
+            "TE": settings.slots_te or 0,
+            "K": settings.slots_k or 0,
+            "DST": settings.slots_def or 0,
+        }
+
+    return {pos: max(0, slots - counts.get(pos, 0)) for pos, slots in starters.items()}
+
+
+def fallback_pick(
+    draft_state: DraftState, player_slot: str
+) -> Optional["RankedPlayer"]:
+    """Top ADP player available at a starting position I haven't filled."""
+    from best_available import get_best_available
+
+    index = draft_state.index_for(get_best_available())
+    needs = starter_needs(draft_state, player_slot)
+    candidates = [p for pos, n in needs.items() if n for p in index.top(pos, k=1)]
+    if not candidates:
+        candidates = index.top(k=1)
+    return min(candidates, key=lambda p: p.rank) if candidates else None
+
+
+def resolve_consensus(
+    results: List[dict],
+    draft_state: DraftState,
+    player_slot: str,
+    options: InferenceOptions,
+    fast_pick: Optional[str] = None,
+) -> dict:
+    """Count votes, falling back to the fast pick or ADP if none came back in time."""
+    analysis = analyze_inference_results(results)
+    if fast_pick:
+        analysis["fast_pick"] = fast_pick
+    if analysis["consensus_pick"] or (options.deadline is None and not fast_pick):
+        return analysis
+
+    if fast_pick:
+        name = fast_pick
+        print(f"⚠️ No consensus, keeping the fast pick: {name}")
+    else:
+        player = fallback_pick(draft_state, player_slot)
+        if player is None:
+            return analysis
+        name = player.name
+        print(f"⚠️ No inference returned in time, falling back to ADP: {name}")
+
+    return {
+        **analysis,
+        "consensus_pick": name,
+        "picks_count": {name: 0},
+        "fallback": True,
+    }
+
+
+# Positions listed with bios; without bios every position gets a short table
+BIO_POSITIONS = ["QB", "RB", "WR", "TE"]
+ALL_POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
+# Bios kept at each position however tight the token budget
+MIN_BIOS_PER_POSITION = 3
+
+FINAL_INSTRUCTION = "\n\nGive your final selection in [[Player Name]] format."
+
+
+def _basic_player_info(player: "RankedPlayer") -> str:
+    return (
+        f"**{player.name} ({player.position}, {player.team})**\n"
+        f"*ADP Rank: {player.rank} | Position Rank: {player.position}{player.position_rank}*\n\n"
+    )
+
+
+def format_player_profiles(
+    draft_state: DraftState,
     player_slot: str,
     player_bios: Dict[str, dict],
-    shuffle_seed: Optional[int] = None,
+    token_budget: Optional[int] = None,
 ) -> str:
-    """Create a summary of best available players with detailed bios."""
-    from best_available import BestAvailable
+    """Roster counts and bios for every listed player, in a fixed order.
 
-    ba = BestAvailable()
-    taken_ids = ba.get_taken_player_ids(draft_picks)
+    Identical across shuffle seeds, so it belongs in the shared prompt prefix.
+    Over token_budget, the lowest-ranked players' bios are dropped first (the
+    top MIN_BIOS_PER_POSITION at each position are kept), then the remaining
+    bios are shortened from the bottom up.
+    """
+    from best_available import get_best_available
 
-    # Get current player's picks
-    current_picks = [p for p in draft_picks if p.picked_by == player_slot]
+    ba = get_best_available()
+    current_roster = ba.analyze_current_roster(draft_state.team_picks(player_slot))
 
-    # Analyze current roster
-    current_roster = ba.analyze_current_roster(current_picks)
+    summary = "\n## CURRENT ROSTER\n"
+    summary += " | ".join(f"{pos}: {count}" for pos, count in current_roster.items())
+    if not player_bios:
+        return summary + "\n"
+
+    best_by_position = draft_state.best_available_by_position(ba, limit=10)
+
+    def render(player: "RankedPlayer", level: str) -> str:
+        if level == "drop":
+            return ""
+        if player.sleeper_id not in player_bios:
+            return _basic_player_info(player) + "---\n\n"
+        bio = format_player_bio(player_bios[player.sleeper_id], short=level == "short")
+        return bio + "\n---\n\n"
+
+    # Bio level per player: full, short or drop
+    levels = {
+        p.sleeper_id: "full" for players in best_by_position.values() for p in players
+    }
 
-    # Get best available by position (limit to 3 for detailed bios)
-    best_by_position = ba.get_best_available_by_position(taken_ids, limit=10)
+    if token_budget is not None:
+        listed = [p for pos in BIO_POSITIONS for p in best_by_position.get(pos, [])]
+        total = estimate_tokens(summary) + sum(
+            estimate_tokens(render(p, "full")) for p in listed
+        )
+        start_total = total
+        worst_first = sorted(listed, key=lambda p: p.rank, reverse=True)
+
+        dropped = 0
+        for player in worst_first:
+            if total <= token_budget:
+                break
+            position_players = best_by_position[player.position]
+            if position_players.index(player) < MIN_BIOS_PER_POSITION:
+                continue
+            total -= estimate_tokens(render(player, "full"))
+            levels[player.sleeper_id] = "drop"
+            dropped += 1
+
+        shortened = 0
+        for player in worst_first:
+            if total <= token_budget:
+                break
+            if levels[player.sleeper_id] != "full":
+                continue
+            total -= estimate_tokens(render(player, "full")) - estimate_tokens(
+                render(player, "short")
+            )
+            levels[player.sleeper_id] = "short"
+            shortened += 1
 
-    # Format the summary
-    summary = "\n## CURRENT ROSTER\n"
-    for pos, count in current_roster.items():
-        summary += f"{pos}: {count} | "
-    summary = summary.rstrip(" | ")
+        if dropped or shortened:
+            print(
+                f"✂️ Player profiles compacted from ~{start_total:,} to ~{total:,} "
+                f"tokens (budget {token_budget:,}): {dropped} bios dropped, "
+                f"{shortened} shortened"
+            )
 
-    summary += "\n\n## BEST AVAILABLE PLAYERS\n\n"
+    parts = [summary, "\n\n## PLAYER PROFILES\n\n"]
+    for pos in BIO_POSITIONS:
+        if not best_by_position.get(pos):
+            continue
+        parts.append(f"### {pos}\n\n")
+        parts.extend(render(p, levels[p.sleeper_id]) for p in best_by_position[pos])
+    return "".join(parts)
 
-    # Create detailed sections for each position
-    priority_positions = ["QB", "RB", "WR", "TE"]
 
-    # Shuffle positions if seed provided
-    if shuffle_seed is not None:
-        rng = random.Random(shuffle_seed)
-        priority_positions = priority_positions.copy()
-        rng.shuffle(priority_positions)
+def profile_token_budget(
+    options: Optional[InferenceOptions], *fixed_parts: str
+) -> Optional[int]:
+    """Tokens left for player profiles once the rest of the prompt is counted."""
+    if options is None or options.token_budget is None:
+        return None
+    return max(0, options.token_budget - sum(estimate_tokens(p) for p in fixed_parts))
 
-    for pos in priority_positions:
-        if pos in best_by_position and best_by_position[pos]:
-            players = best_by_position[pos].copy()
 
-            # Shuffle players within position if seed provided
-            if shuffle_seed is not None:
-                rng.shuffle(players)
+def format_available_order(
+    draft_state: DraftState,
+    player_bios: Dict[str, dict],
+    shuffle_seed: Optional[int] = None,
+    forecast: Optional["AvailabilityForecast"] = None,
+) -> str:
+    """Best available players in this seed's shuffled order, for the prompt's end.
 
-            summary += f"### {pos}\n\n"
+    With a forecast, each row also shows the player's odds of lasting until
+    my next pick.
+    """
+    from best_available import get_best_available
 
-            for player in players:
-                # Try to get detailed bio, fall back to basic info
-                if player.sleeper_id in player_bios:
-                    summary += format_player_bio(player_bios[player.sleeper_id]) + "\n"
-                else:
-                    # Fallback to basic player info
-                    summary += f"**{player.name} ({player.position}, {player.team})**\n"
-                    summary += f"*ADP Rank: {player.rank} | Position Rank: {player.position}{player.position_rank}*\n\n"
+    best_by_position = draft_state.best_available_by_position(
+        get_best_available(), limit=10 if player_bios else 5
+    )
+    positions = BIO_POSITIONS if player_bios else ALL_POSITIONS
 
-                summary += "---\n\n"
-    return summary
+    # Shuffle positions if seed provided
+    rng = random.Random(shuffle_seed)
+    if shuffle_seed is not None:
+        positions = positions.copy()
+        rng.shuffle(positions)
 
+    summary = "\n\n## BEST AVAILABLE PLAYERS\n\n"
+    for pos in positions:
+        if not best_by_position.get(pos):
+            continue
+        players = best_by_position[pos].copy()
 
-def make_team_table(picks: List[DraftPickData], league_type: str = "standard") -> str:
-    # Load bye week data from ADP rankings
-    bye_weeks = {}
-    try:
-        with open("adp_rankings.json", "r") as f:
-            adp_data = json.load(f)
-            for player in adp_data:
-                bye_weeks[player["sleeper_id"]] = player.get("bye_week", 0)
-    except (FileNotFoundError, json.JSONDecodeError, KeyError):
-        pass
+        # Shuffle players within position if seed provided
+        if shuffle_seed is not None:
+            rng.shuffle(players)
 
-    team_table = "## Starters\n"
+        summary += f"### {pos}\n"
+        if forecast:
+            summary += "| Rank | Player | Team | Still there at my next pick |\n"
+            summary += "|------|--------|------|------|\n"
+        else:
+            summary += "| Rank | Player | Team |\n"
+            summary += "|------|--------|------|\n"
+        for player in players:
+            summary += f"| {player.position}{player.position_rank} | {player.name} | {player.team} |"
+            if forecast:
+                summary += f" {forecast.chance(player.sleeper_id):.0%} |"
+            summary += "\n"
+        summary += "\n"
+
+    return summary.rstrip("\n")
+
+
+def report_shared_prefix(messages: List[str]):
+    """Print how much of a batch's prompts is byte-identical (cacheable)."""
+    if len(messages) < 2:
+        return
+    prefix = os.path.commonprefix(messages)
+    share = len(prefix) / max(len(m) for m in messages)
+    print(
+        f"🧩 Shared prompt prefix: {len(prefix):,} chars "
+        f"(~{estimate_tokens(prefix):,} tokens, {share:.0%}) "
+        f"across {len(messages)} inferences"
+    )
 
-    if league_type == "chopped":
-        # Chopped: 1QB, 2RB, 3WR, 1TE, 2FLEX, no K/DEF
-        pos = ["QB", "RB1", "RB2", "WR1", "WR2", "WR3", "TE", "FLEX1", "FLEX2"]
-    else:
-        # Standard: 1QB, 2RB, 2WR, 1TE, 1FLEX, 1REC_FLEX, 1SUPER_FLEX, 1K, 1DEF
-        pos = [
+
+@dataclass(frozen=True)
+class RosterFormat:
+    # Starting slots in display order
+    slots: Tuple[str, ...]
+    # Slots each Sleeper position fills, in order of preference
+    fills: Dict[str, Tuple[str, ...]]
+    bench: int
+
+    def dedicated_slots(self, position: str) -> int:
+        """Starting slots that only this position can fill."""
+        others = {
+            slot
+            for pos, slots in self.fills.items()
+            if pos != position
+            for slot in slots
+        }
+        return sum(1 for slot in self.fills.get(position, ()) if slot not in others)
+
+    @property
+    def rounds(self) -> int:
+        return len(self.slots) + self.bench
+
+
+ROSTER_FORMATS: Dict[str, RosterFormat] = {
+    # Chopped: 1QB, 2RB, 3WR, 1TE, 2FLEX, no K/DEF
+    "chopped": RosterFormat(
+        slots=("QB", "RB1", "RB2", "WR1", "WR2", "WR3", "TE", "FLEX1", "FLEX2"),
+        fills={
+            "QB": ("QB",),
+            "RB": ("RB1", "RB2", "FLEX1", "FLEX2"),
+            "WR": ("WR1", "WR2", "WR3", "FLEX1", "FLEX2"),
+            "TE": ("TE", "FLEX1", "FLEX2"),
+        },
+        bench=6,
+    ),
+    # Standard: 1QB, 2RB, 2WR, 1TE, 1FLEX, 1REC_FLEX, 1SUPER_FLEX, 1K, 1DEF
+    "standard": RosterFormat(
+        slots=(
             "QB",
             "RB1",
             "RB2",
@@ -324,116 +909,63 @@ def make_team_table(picks: List[DraftPickData], league_type: str = "standard") -
             "SUPER_FLEX",
             "K",
             "DEF",
-        ]
+        ),
+        fills={
+            "QB": ("QB", "SUPER_FLEX"),
+            "RB": ("RB1", "RB2", "FLEX", "SUPER_FLEX"),
+            "WR": ("WR1", "WR2", "REC_FLEX", "FLEX", "SUPER_FLEX"),
+            "TE": ("TE", "REC_FLEX", "FLEX", "SUPER_FLEX"),
+            "K": ("K",),
+            "DEF": ("DEF",),
+        },
+        bench=5,
+    ),
+}
+
+
+def assign_slots(
+    positions: List[Optional[str]], league_type: str = "standard"
+) -> Tuple[Dict[str, Optional[int]], List[int]]:
+    """Place players, given by Sleeper position in pick order, into a lineup.
+
+    Returns each starting slot's index into positions (or None) and the
+    indices that end up on the bench.
+    """
+    roster = ROSTER_FORMATS.get(league_type, ROSTER_FORMATS["standard"])
+    lineup: Dict[str, Optional[int]] = dict.fromkeys(roster.slots)
+    bench: List[int] = []
+    for i, position in enumerate(positions):
+        slot = next(
+            (s for s in roster.fills.get(position or "", ()) if lineup[s] is None),
+            None,
+        )
+        if slot is None:
+            bench.append(i)
+        else:
+            lineup[slot] = i
+    return lineup, bench
 
-    bench: List[DraftPickData] = []
 
-    team_map: Dict[str, Optional[DraftPickData]] = {p: None for p in pos}
-    for p in picks:
-        if not p.metadata:
-            bench.append(p)
-            continue
+def make_team_table(picks: List[DraftPickData], league_type: str = "standard") -> str:
+    from best_available import get_best_available
 
-        position = p.metadata.position
-
-        if league_type == "chopped":
-            # Chopped league logic: 1QB, 2RB, 3WR, 1TE, 2FLEX
-            if position == "QB":
-                if not team_map["QB"]:
-                    team_map["QB"] = p
-                else:
-                    bench.append(p)
-            elif position == "RB":
-                if not team_map["RB1"]:
-                    team_map["RB1"] = p
-                elif not team_map["RB2"]:
-                    team_map["RB2"] = p
-                elif not team_map["FLEX1"]:
-                    team_map["FLEX1"] = p
-                elif not team_map["FLEX2"]:
-                    team_map["FLEX2"] = p
-                else:
-                    bench.append(p)
-            elif position == "WR":
-                if not team_map["WR1"]:
-                    team_map["WR1"] = p
-                elif not team_map["WR2"]:
-                    team_map["WR2"] = p
-                elif not team_map["WR3"]:
-                    team_map["WR3"] = p
-                elif not team_map["FLEX1"]:
-                    team_map["FLEX1"] = p
-                elif not team_map["FLEX2"]:
-                    team_map["FLEX2"] = p
-                else:
-                    bench.append(p)
-            elif position == "TE":
-                if not team_map["TE"]:
-                    team_map["TE"] = p
-                elif not team_map["FLEX1"]:
-                    team_map["FLEX1"] = p
-                elif not team_map["FLEX2"]:
-                    team_map["FLEX2"] = p
-                else:
-                    bench.append(p)
-            else:
-                bench.append(p)
-        else:
-            # Standard league logic: 1QB, 2RB, 2WR, 1TE, 1FLEX, 1REC_FLEX, 1SUPER_FLEX, 1K, 1DEF
-            if position == "QB":
-                if not team_map["QB"]:
-                    team_map["QB"] = p
-                elif not team_map["SUPER_FLEX"]:
-                    team_map["SUPER_FLEX"] = p
-                else:
-                    bench.append(p)
-            elif position == "RB":
-                if not team_map["RB1"]:
-                    team_map["RB1"] = p
-                elif not team_map["RB2"]:
-                    team_map["RB2"] = p
-                elif not team_map["FLEX"]:
-                    team_map["FLEX"] = p
-                elif not team_map["SUPER_FLEX"]:
-                    team_map["SUPER_FLEX"] = p
-                else:
-                    bench.append(p)
-            elif position == "WR":
-                if not team_map["WR1"]:
-                    team_map["WR1"] = p
-                elif not team_map["WR2"]:
-                    team_map["WR2"] = p
-                elif not team_map["REC_FLEX"]:
-                    team_map["REC_FLEX"] = p
-                elif not team_map["FLEX"]:
-                    team_map["FLEX"] = p
-                elif not team_map["SUPER_FLEX"]:
-                    team_map["SUPER_FLEX"] = p
-                else:
-                    bench.append(p)
-            elif position == "TE":
-                if not team_map["TE"]:
-                    team_map["TE"] = p
-                elif not team_map["REC_FLEX"]:
-                    team_map["REC_FLEX"] = p
-                elif not team_map["FLEX"]:
-                    team_map["FLEX"] = p
-                elif not team_map["SUPER_FLEX"]:
-                    team_map["SUPER_FLEX"] = p
-                else:
-                    bench.append(p)
-            elif position == "K":
-                if not team_map["K"]:
-                    team_map["K"] = p
-                else:
-                    bench.append(p)
-            elif position == "DEF":
-                if not team_map["DEF"]:
-                    team_map["DEF"] = p
-                else:
-                    bench.append(p)
-            else:
-                bench.append(p)
+    # Load bye week data from the shared ADP rankings
+    bye_weeks: Dict[str, int] = {}
+    try:
+        bye_weeks = get_best_available().bye_weeks
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    team_table = "## Starters\n"
+
+    lineup, bench_indices = assign_slots(
+        [p.metadata.position if p.metadata else None for p in picks], league_type
+    )
+    pos = list(lineup)
+    team_map: Dict[str, Optional[DraftPickData]] = {
+        slot: picks[i] if i is not None else None for slot, i in lineup.items()
+    }
+    bench: List[DraftPickData] = [picks[i] for i in bench_indices]
 
     for position in pos:
         player = team_map[position]
@@ -445,7 +977,11 @@ def make_team_table(picks: List[DraftPickData], league_type: str = "standard") -
             if player.metadata:
                 name = f"{player.metadata.first_name} {player.metadata.last_name}"
                 team = player.metadata.team or "None"
-                bye = str(bye_weeks.get(player.player_id, "-"))
+                bye = (
+                    str(bye_weeks.get(player.player_id, "-"))
+                    if player.player_id
+                    else "-"
+                )
             else:
                 name = "Unknown"
                 team = "None"
@@ -466,7 +1002,7 @@ def make_team_table(picks: List[DraftPickData], league_type: str = "standard") -
             name = f"{player.metadata.first_name} {player.metadata.last_name}"
             position = player.metadata.position or "None"
             team = player.metadata.team or "None"
-            bye = str(bye_weeks.get(player.player_id, "-")) if player else "-"
+            bye = str(bye_weeks.get(player.player_id, "-")) if player.player_id else "-"
         else:
             name = "Unknown"
             position = "None"
@@ -479,16 +1015,11 @@ def make_team_table(picks: List[DraftPickData], league_type: str = "standard") -
 
 
 def render_draft_state(
-    player_id: str, draft_id: str, league_type: str = "standard"
+    player_id: str, draft_state: DraftState, league_type: str = "standard"
 ) -> Dict[str, str]:
-    api = SleeperAPI()
-    picks = api.get_draft_picks(draft_id)
-
-    player_ids: set[str] = set(p.picked_by for p in picks if p.picked_by)
     teams: Dict[str, str] = {}
 
-    for pid in player_ids:
-        player_picks = [p for p in picks if p.picked_by == pid]
+    for pid, player_picks in draft_state.picks_by_team.items():
         teams[pid] = make_team_table(player_picks, league_type)
 
     return teams
@@ -507,6 +1038,8 @@ def display_results(analysis: dict, results: List[dict], verbose: bool):
         print("=" * 80)
 
         for result in results:
+            if result.get("cancelled"):
+                continue
             print(f"\n--- Inference {result['inference_id']} ---")
             if "strategy_used" in result and result["strategy_used"]:
                 print(f"Strategy: {result['strategy_used']}")
@@ -524,7 +1057,9 @@ def display_results(analysis: dict, results: List[dict], verbose: bool):
 
     print("=" * 80)
 
-    if analysis["consensus_pick"]:
+    if analysis.get("fallback"):
+        print(f"⚠️ FALLBACK PICK (no consensus in time): {analysis['consensus_pick']}")
+    elif analysis["consensus_pick"]:
         print(f"🎯 CONSENSUS PICK: {analysis['consensus_pick']}")
         print(
             f"📊 CONFIDENCE: {analysis['confidence']:.1%} ({analysis['picks_count'][analysis['consensus_pick']]}/{analysis['successful_inferences']} votes)"
@@ -541,6 +1076,15 @@ def display_results(analysis: dict, results: List[dict], verbose: bool):
     else:
         print("❌ NO CONSENSUS: All inferences failed to produce valid picks")
 
+    fast_pick = analysis.get("fast_pick")
+    if fast_pick and not analysis.get("fallback"):
+        verdict = "confirmed" if fast_pick == analysis["consensus_pick"] else "replaced"
+        print(f"\n⚡ Fast pick {fast_pick} {verdict} by the consensus")
+
     print(
         f"\n✅ Success Rate: {analysis['successful_inferences']}/{analysis['total_inferences']}"
     )
+    if analysis.get("cancelled_inferences"):
+        print(
+            f"⏹ Stopped early: {analysis['cancelled_inferences']} inferences cancelled"
+        )
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Long-lived draft assistant that keeps data and clients warm between picks.
+
+Rankings, player bios, strategy files, the Sleeper HTTP pool and the OpenAI
+client are loaded once. draft_client.py sends newline-delimited JSON requests
+over a Unix socket and prints the rendered recommendation.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import socket
+from contextlib import redirect_stdout
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import chopped
+import normal
+from best_available import get_best_available
+from conversation import DraftConversation
+from draft_client import DEFAULT_SOCKET_PATH
+from draft_common import (
+    InferenceOptions,
+    add_governor_arguments,
+    display_results,
+    load_player_bios,
+    read_strategy,
+)
+from draft_state import DraftState
+from fast_pick import format_fast_pick, quick_pick
+from inference_client import configure_inference
+from sleeper_api import AsyncSleeperAPI
+from strategy_index import build_strategy_index
+
+# Sends an interim message to the client before the final response
+ProgressFn = Callable[[str], Awaitable[None]]
+
+
+class DraftDaemon:
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+        self.api: Optional[AsyncSleeperAPI] = None
+        self.player_bios: Dict[str, dict] = {}
+        # Response chains per (draft, player, league type) for chained requests
+        self.conversations: Dict[Tuple[str, str, str], DraftConversation] = {}
+        self.stopped = asyncio.Event()
+
+    async def load(self):
+        """Load (or reload) bios, rankings and the indexed standard strategy."""
+        self.player_bios = await asyncio.to_thread(load_player_bios)
+        ba = await asyncio.to_thread(get_best_available)
+        build_strategy_index(read_strategy(normal.STRATEGY_FILE))
+        print(f"Loaded {len(ba.adp_rankings)} ranked players")
+
+    async def recommend(self, request: dict, progress: ProgressFn) -> str:
+        """Run the recommendation pipeline and return the rendered results.
+
+        The fast pick goes to the client through progress as soon as it is
+        ready, ahead of the consensus.
+        """
+        assert self.api is not None
+        draft_id = request["draft_id"]
+        player_id = request["player_id"]
+        num_inferences = request.get("inferences", 1)
+        options = InferenceOptions(**request.get("options", {}))
+
+        draft, picks, traded_picks = await asyncio.gather(
+            self.api.get_draft(draft_id),
+            self.api.get_draft_picks(draft_id),
+            self.api.get_draft_traded_picks(draft_id),
+        )
+        draft_state = DraftState.from_picks(
+            draft_id, picks, draft=draft, traded_picks=traded_picks
+        )
+
+        if options.fast_pick:
+            pick = quick_pick(draft_state, player_id, self.player_bios)
+            if pick:
+                await progress(format_fast_pick(pick))
+
+        league_type = request.get("league_type", "standard")
+        conversation = None
+        if request.get("chain"):
+            key = (draft_id, player_id, league_type)
+            conversation = self.conversations.setdefault(
+                key, DraftConversation(player_id, league_type)
+            )
+
+        if league_type == "chopped":
+            analysis, results = await chopped.recommend_pick(
+                draft_state,
+                player_id,
+                self.player_bios,
+                num_inferences,
+                options,
+                conversation,
+            )
+        else:
+            analysis, results = await normal.recommend_pick(
+                draft_state,
+                player_id,
+                self.player_bios,
+                read_strategy(normal.STRATEGY_FILE),
+                num_inferences,
+                options,
+                conversation,
+            )
+
+        # display_results is synchronous, so no other request can interleave
+        output = io.StringIO()
+        with redirect_stdout(output):
+            display_results(analysis, results, request.get("verbose", False))
+        return output.getvalue()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def progress(output: str):
+            writer.write(json.dumps({"ok": True, "progress": output}).encode() + b"\n")
+            await writer.drain()
+
+        try:
+            request = json.loads(await reader.readline())
+            command = request.get("command")
+            print(f"Request: {command} {request.get('draft_id', '')}")
+
+            if command == "ping":
+                response = {"ok": True, "output": "pong"}
+            elif command == "reload":
+                await self.load()
+                output = f"Reloaded {len(self.player_bios)} player bios"
+                response = {"ok": True, "output": output}
+            elif command == "shutdown":
+                self.stopped.set()
+                response = {"ok": True, "output": "Draft daemon stopping"}
+            elif command == "recommend":
+                response = {
+                    "ok": True,
+                    "output": await self.recommend(request, progress),
+                }
+            else:
+                response = {"ok": False, "error": f"Unknown command: {command}"}
+        except Exception as e:
+            print(f"Request failed: {e}")
+            response = {"ok": False, "error": str(e)}
+
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    def _remove_stale_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(self.socket_path)
+            except ConnectionRefusedError:
+                os.remove(self.socket_path)
+                return
+        raise RuntimeError(f"A draft daemon is already listening on {self.socket_path}")
+
+    async def serve(self):
+        """Load everything once, then serve requests until shutdown."""
+        self._remove_stale_socket()
+
+        async with AsyncSleeperAPI() as api:
+            self.api = api
+            await self.load()
+
+            server = await asyncio.start_unix_server(self.handle, path=self.socket_path)
+            print(f"Draft daemon listening on {self.socket_path}")
+            try:
+                async with server:
+                    await self.stopped.wait()
+            finally:
+                if os.path.exists(self.socket_path):
+                    os.remove(self.socket_path)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Resident draft assistant daemon")
+    parser.add_argument(
+        "--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket to listen on"
+    )
+    add_governor_arguments(parser)
+    args = parser.parse_args()
+
+    configure_inference(
+        max_concurrency=args.max_concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        refresh=args.refresh,
+    )
+    await DraftDaemon(args.socket).serve()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,202 @@
+"""Snapshot of a draft's picks shared across the recommendation pipeline."""
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from sleeper_api import Draft, DraftPick, DraftPickData, DraftStatus, DraftType
+
+if TYPE_CHECKING:
+    from best_available import BestAvailable, BestAvailableIndex, RankedPlayer
+
+
+def slot_for_pick(
+    pick_no: int,
+    teams: int,
+    draft_type: DraftType = DraftType.SNAKE,
+    reversal_round: Optional[int] = None,
+) -> int:
+    """Get the draft slot (1-based) that owns an overall pick number."""
+    round_num = (pick_no - 1) // teams + 1
+    index = (pick_no - 1) % teams
+
+    if draft_type != DraftType.SNAKE:
+        return index + 1
+
+    # Snake order flips every round, except a third-round reversal repeats
+    forward = True
+    for r in range(2, round_num + 1):
+        if r != reversal_round:
+            forward = not forward
+
+    return index + 1 if forward else teams - index
+
+
+@dataclass
+class DraftState:
+    draft_id: str
+    picks: List[DraftPickData]
+    picks_by_team: Dict[str, List[DraftPickData]] = field(default_factory=dict)
+    taken_ids: Set[str] = field(default_factory=set)
+    draft: Optional[Draft] = None
+    traded_picks: List[DraftPick] = field(default_factory=list)
+    last_pick_no: int = 0
+    index: Optional["BestAvailableIndex"] = None
+    # Projected boards contain picks that haven't happened yet
+    speculative: bool = False
+
+    @classmethod
+    def from_picks(
+        cls,
+        draft_id: str,
+        picks: List[DraftPickData],
+        draft: Optional[Draft] = None,
+        traded_picks: Optional[List[DraftPick]] = None,
+    ) -> "DraftState":
+        """Build a snapshot from a single picks fetch, grouping picks in one pass."""
+        state = cls(
+            draft_id=draft_id,
+            picks=[],
+            draft=draft,
+            traded_picks=traded_picks or [],
+        )
+        for pick in sorted(picks, key=lambda p: p.pick_no):
+            state.add_pick(pick)
+        return state
+
+    def add_pick(self, pick: DraftPickData):
+        """Ingest a single new pick."""
+        self.picks.append(pick)
+        if pick.picked_by:
+            self.picks_by_team.setdefault(pick.picked_by, []).append(pick)
+        if pick.player_id:
+            self.taken_ids.add(pick.player_id)
+            if self.index is not None:
+                self.index.take(pick.player_id)
+        self.last_pick_no = max(self.last_pick_no, pick.pick_no)
+
+    def copy(self) -> "DraftState":
+        """Copy the snapshot so hypothetical picks can be added to it."""
+        return DraftState(
+            draft_id=self.draft_id,
+            picks=list(self.picks),
+            picks_by_team={k: list(v) for k, v in self.picks_by_team.items()},
+            taken_ids=set(self.taken_ids),
+            draft=self.draft,
+            traded_picks=self.traded_picks,
+            last_pick_no=self.last_pick_no,
+            index=self.index.copy() if self.index is not None else None,
+            speculative=self.speculative,
+        )
+
+    def index_for(self, rankings: "BestAvailable") -> "BestAvailableIndex":
+        """Get the incremental best-available index for these rankings.
+
+        The index is built on first use and then kept current by add_pick.
+        """
+        if self.index is None or self.index.source is not rankings.adp_rankings:
+            self.index = rankings.build_index(self.taken_ids)
+        return self.index
+
+    def best_available_by_position(
+        self, rankings: "BestAvailable", limit: int = 5
+    ) -> Dict[str, List["RankedPlayer"]]:
+        """Get best available players for each position."""
+        return self.index_for(rankings).best_available_by_position(limit)
+
+    def team_picks(self, player_slot: str) -> List[DraftPickData]:
+        """Get the picks made by a single team."""
+        return self.picks_by_team.get(player_slot, [])
+
+    @property
+    def next_pick_no(self) -> int:
+        """Overall number of the pick currently on the clock."""
+        return self.last_pick_no + 1
+
+    @property
+    def total_picks(self) -> int:
+        """Number of picks in the whole draft, or 0 if unknown."""
+        if not self.draft:
+            return 0
+        return self.draft.settings.teams * self.draft.settings.rounds
+
+    def roster_id_for_user(self, user_id: str) -> Optional[int]:
+        """Get the roster a user drafts for, from the draft order."""
+        if not self.draft or not self.draft.draft_order:
+            return None
+        slot = self.draft.draft_order.get(user_id)
+        if slot is None:
+            return None
+        return self._roster_for_slot(slot)
+
+    def _roster_for_slot(self, slot: int) -> int:
+        # Mock drafts have no rosters, so the slot stands in for the roster
+        if self.draft and self.draft.slot_to_roster_id:
+            return self.draft.slot_to_roster_id.get(str(slot), slot)
+        return slot
+
+    def roster_for_pick(self, pick_no: int) -> Optional[int]:
+        """Get the roster that owns a pick, following any traded picks."""
+        if not self.draft or self.draft.type == DraftType.AUCTION:
+            return None
+
+        settings = self.draft.settings
+        round_num = (pick_no - 1) // settings.teams + 1
+        slot = slot_for_pick(
+            pick_no, settings.teams, self.draft.type, settings.reversal_round
+        )
+        original_roster = self._roster_for_slot(slot)
+
+        for traded in self.traded_picks:
+            if traded.round == round_num and traded.roster_id == original_roster:
+                return traded.owner_id
+        return original_roster
+
+    def next_pick_for_user(self, user_id: str, after: Optional[int] = None) -> int:
+        """Get the next overall pick owned by a user, or 0 if none remain."""
+        roster_id = self.roster_id_for_user(user_id)
+        if roster_id is None:
+            return 0
+
+        start = self.next_pick_no if after is None else after + 1
+        for pick_no in range(start, self.total_picks + 1):
+            if self.roster_for_pick(pick_no) == roster_id:
+                return pick_no
+        return 0
+
+    def is_on_clock(self, user_id: str) -> bool:
+        """Check whether a user owns the pick currently on the clock."""
+        roster_id = self.roster_id_for_user(user_id)
+        return (
+            roster_id is not None
+            and self.next_pick_no <= self.total_picks
+            and self.roster_for_pick(self.next_pick_no) == roster_id
+        )
+
+    def pick_deadline(self) -> Optional[float]:
+        """Epoch seconds when the current pick's timer runs out, if it has one.
+
+        The clock starts at the previous pick (or the draft start for pick 1)
+        and only runs while drafting. A deadline already in the past means the
+        clock is stale (e.g. a resumed draft), so there is no deadline to meet.
+        """
+        if (
+            not self.draft
+            or self.draft.status != DraftStatus.DRAFTING
+            or not self.draft.settings.pick_timer
+        ):
+            return None
+        clock_start = self.draft.last_picked if self.picks else self.draft.start_time
+        if not clock_start:
+            return None
+        deadline = clock_start / 1000 + self.draft.settings.pick_timer
+        if deadline <= time.time():
+            return None
+        return deadline
+
+    def seconds_left(self) -> Optional[float]:
+        """Seconds until the current pick's timer runs out, if it has one."""
+        deadline = self.pick_deadline()
+        if deadline is None:
+            return None
+        return deadline - time.time()
@@ -0,0 +1,120 @@
+"""Watch a live Sleeper draft and fire the assistant when it's my pick."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+import httpx
+
+from draft_state import DraftState
+from sleeper_api import AsyncSleeperAPI, DraftPickData, DraftStatus
+
+
+class DraftWatcher:
+    def __init__(
+        self,
+        api: AsyncSleeperAPI,
+        draft_id: str,
+        player_id: str,
+        interval: float = 1.0,
+    ):
+        self.api = api
+        self.draft_id = draft_id
+        self.player_id = player_id
+        self.interval = interval
+        self.state = DraftState(draft_id=draft_id, picks=[])
+
+    async def poll(self) -> List[DraftPickData]:
+        """Fetch the draft and return only picks made since the last poll."""
+        draft, picks, traded_picks = await asyncio.gather(
+            self.api.get_draft(self.draft_id),
+            self.api.get_draft_picks(self.draft_id),
+            self.api.get_draft_traded_picks(self.draft_id),
+        )
+
+        # A commissioner undo removes or replaces picks I already have (an undo
+        # plus a new pick between polls keeps the count), so start over
+        if self.rolled_back(picks):
+            print("Draft picks were rolled back, rebuilding draft state")
+            self.state = DraftState(draft_id=self.draft_id, picks=[])
+
+        self.state.draft = draft
+        self.state.traded_picks = traded_picks
+
+        new_picks = sorted(
+            (p for p in picks if p.pick_no > self.state.last_pick_no),
+            key=lambda p: p.pick_no,
+        )
+        for pick in new_picks:
+            self.state.add_pick(pick)
+
+        return new_picks
+
+    def rolled_back(self, picks: List[DraftPickData]) -> bool:
+        """Check whether any pick I've already seen is gone or was changed."""
+        fetched = {pick.pick_no: pick.player_id for pick in picks}
+        return any(
+            fetched.get(pick.pick_no, "") != pick.player_id for pick in self.state.picks
+        )
+
+    def is_my_turn(self) -> bool:
+        """Check whether the draft is live and my slot is on the clock."""
+        draft = self.state.draft
+        return (
+            draft is not None
+            and draft.status == DraftStatus.DRAFTING
+            and self.state.is_on_clock(self.player_id)
+        )
+
+    async def watch(
+        self,
+        on_my_turn: Callable[[DraftState], Awaitable[object]],
+        on_update: Optional[Callable[[DraftState], object]] = None,
+    ):
+        """Poll until the draft completes, calling on_my_turn for each of my picks.
+
+        on_update, if given, is called whenever opponents make new picks.
+        """
+        print(f"Watching draft {self.draft_id} every {self.interval:.1f}s...")
+        fired_for = 0
+
+        while True:
+            # A blip from Sleeper mid-draft shouldn't end the watch
+            try:
+                new_picks = await self.poll()
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
+                print(f"⚠️ Poll failed ({e!r}), retrying in {self.interval:.1f}s")
+                await asyncio.sleep(self.interval)
+                continue
+            for pick in new_picks:
+                print(format_pick(pick))
+
+            draft = self.state.draft
+            if draft and draft.status == DraftStatus.COMPLETE:
+                print("Draft complete, stopping watch")
+                return
+
+            pick_no = self.state.next_pick_no
+            if self.is_my_turn() and fired_for != pick_no:
+                fired_for = pick_no
+                print(f"\n⏰ ON THE CLOCK - pick {pick_no} ({time.strftime('%X')})")
+                await on_my_turn(self.state)
+                continue
+
+            if new_picks and on_update:
+                on_update(self.state)
+
+            await asyncio.sleep(self.interval)
+
+
+def format_pick(pick: DraftPickData) -> str:
+    """Format a single pick as a one-line log entry."""
+    if pick.metadata:
+        name = f"{pick.metadata.first_name} {pick.metadata.last_name}"
+        details = f"{pick.metadata.position}, {pick.metadata.team or 'FA'}"
+    else:
+        name = pick.player_id or "Unknown"
+        details = "?"
+    return (
+        f"Pick {pick.pick_no} (R{pick.round}): {name} ({details}) -> {pick.picked_by}"
+    )
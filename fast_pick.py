@@ -0,0 +1,121 @@
+"""Instant local pick from ADP value, roster needs and bios.
+
+Shown while the high-reasoning consensus runs, and kept if it never returns.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from best_available import BestAvailable, RankedPlayer, get_best_available
+from draft_common import remove_sources, starter_needs
+from draft_state import DraftState
+
+# Share of a player's ADP rank forgiven when they fill an open starting slot
+NEED_BONUS = 0.15
+# Extra rank charged for a backup at a one-starter position
+BACKUP_PENALTY = 0.25
+# Extra rank charged when the bio flags an injury
+INJURY_PENALTY = 0.05
+# Positions not worth drafting until the last rounds
+LATE_POSITIONS = {"K", "DST"}
+CANDIDATES_PER_POSITION = 3
+
+
+@dataclass
+class FastPick:
+    player: RankedPlayer
+    score: float
+    reason: str
+
+
+def _bio_mentions_injury(bio: Optional[dict]) -> bool:
+    if not bio:
+        return False
+    text = " ".join([bio.get("summary", "")] + bio.get("bear_case", []))
+    return "injur" in text.lower()
+
+
+def score_player(
+    player: RankedPlayer,
+    needs: Dict[str, int],
+    bio: Optional[dict] = None,
+) -> float:
+    """Lower is better: ADP rank adjusted for roster need and injury risk."""
+    score = float(player.rank)
+    if needs.get(player.position, 0) > 0:
+        score *= 1 - NEED_BONUS
+    elif player.position in ("QB", "TE"):
+        score *= 1 + BACKUP_PENALTY
+    if _bio_mentions_injury(bio):
+        score *= 1 + INJURY_PENALTY
+    return score
+
+
+def quick_pick(
+    draft_state: DraftState,
+    player_slot: str,
+    player_bios: Dict[str, dict],
+    rankings: Optional[BestAvailable] = None,
+) -> Optional[FastPick]:
+    """Score the top few available players at each position and take the best."""
+    ba = rankings or get_best_available()
+    index = draft_state.index_for(ba)
+    needs = starter_needs(draft_state, player_slot)
+
+    rounds_left = 0
+    if draft_state.draft:
+        rounds_left = draft_state.draft.settings.rounds - len(
+            draft_state.team_picks(player_slot)
+        )
+    late_slots = sum(needs.get(pos, 0) for pos in LATE_POSITIONS)
+
+    candidates: List[RankedPlayer] = []
+    for position in index.by_position:
+        # Kickers and defenses only once the remaining rounds are needed for them
+        if position in LATE_POSITIONS and rounds_left > late_slots:
+            continue
+        candidates.extend(index.top(position, k=CANDIDATES_PER_POSITION))
+    if not candidates:
+        return None
+
+    best = min(
+        candidates,
+        key=lambda p: score_player(p, needs, player_bios.get(p.sleeper_id)),
+    )
+    bio = player_bios.get(best.sleeper_id)
+    if bio and bio.get("bottom_line"):
+        reason = remove_sources(bio["bottom_line"])
+    elif needs.get(best.position, 0):
+        reason = f"best ADP value at an open {best.position} slot"
+    else:
+        reason = "best ADP value on the board"
+
+    return FastPick(
+        player=best,
+        score=score_player(best, needs, bio),
+        reason=reason,
+    )
+
+
+def format_fast_pick(pick: FastPick) -> str:
+    return (
+        f"⚡ FAST PICK: {pick.player.name} ({pick.player.position}, "
+        f"{pick.player.team}, ADP #{pick.player.rank}) - {pick.reason}"
+    )
+
+
+def announce_fast_pick(
+    draft_state: DraftState, player_slot: str, player_bios: Dict[str, dict]
+) -> Optional[str]:
+    """Print the instant pick and return its name for the consensus to check.
+
+    Projected boards get none; the pick is announced once the real board
+    arrives.
+    """
+    if draft_state.speculative:
+        return None
+    pick = quick_pick(draft_state, player_slot, player_bios)
+    if pick is None:
+        return None
+    print("\n" + format_fast_pick(pick), flush=True)
+    return pick.player.name
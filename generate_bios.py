@@ -3,9 +3,10 @@ import asyncio
 import re
 from typing import List, Optional
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel
 
+from inference_client import configure_inference, get_inference_client
+
 # Constants
 DEFAULT_NUM_PLAYERS = 10
 DEFAULT_MAX_RETRIES = 3
@@ -112,7 +113,7 @@ async def get_player_analysis_with_retry(
 ) -> Optional[PlayerAnalysis]:
     """Get player analysis with retry logic if parsing fails."""
 
-    client = AsyncOpenAI()
+    client = get_inference_client()
 
     for attempt in range(max_retries):
         print(f"[{player_name}] Attempt {attempt + 1}/{max_retries}...")
@@ -124,7 +125,7 @@ async def get_player_analysis_with_retry(
                 else f"{prompt}\n\nIMPORTANT: Please follow the exact format specified above with proper markdown headers (# and ##) and bullet points (-)."
             )
 
-            response = await client.responses.create(
+            response = await client.create_response(
                 model="gpt-5",
                 tools=[{"type": "web_search_preview"}],
                 input=enhanced_prompt,
@@ -356,8 +357,15 @@ if __name__ == "__main__":
         default=3,
         help="Number of concurrent analysis tasks (default: 3)",
     )
+    parser.add_argument("--rpm", type=int, help="OpenAI requests-per-minute budget")
+    parser.add_argument("--tpm", type=int, help="OpenAI tokens-per-minute budget")
 
     args = parser.parse_args()
+    configure_inference(
+        max_concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+    )
 
     results = asyncio.run(
         analyze_top_players(
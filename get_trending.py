@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 """Get the top 10 trending players with their names."""
 
-import json
-
+from player_store import load_player_store
 from sleeper_api import SleeperAPI
 
 
@@ -13,10 +12,9 @@ def get_top_trending_players():
     print("Fetching top 10 trending players...")
     trending = api.get_trending_players(sport="nfl", type="add")[:10]
 
-    # Load players from local file
-    print("Loading player database from players.json...")
-    with open("players.json", "r") as f:
-        all_players = json.load(f)
+    # Load players from the local compact store
+    print("Loading player database...")
+    all_players = load_player_store()
 
     print("\nTop 10 Trending Players (by adds):\n")
     print(f"{'Rank':<5} {'Name':<25} {'Position':<8} {'Team':<6} {'Adds':<10}")
@@ -26,13 +24,11 @@ def get_top_trending_players():
         player_data = all_players.get(player.player_id)
 
         if player_data:
-            first_name = player_data.get("first_name", "")
-            last_name = player_data.get("last_name", "")
-            name = f"{first_name} {last_name}".strip()
+            name = player_data.full_name
             if not name:
                 name = "Unknown"
-            position = player_data.get("position") or "N/A"
-            team = player_data.get("team") or "FA"
+            position = player_data.position or "N/A"
+            team = player_data.team or "FA"
         else:
             name = f"Player ID: {player.player_id}"
             position = "N/A"
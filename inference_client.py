@@ -0,0 +1,221 @@
+"""Process-wide OpenAI client with a global concurrency and rate governor."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+DEFAULT_MAX_CONCURRENCY = 8
+# Reasoning output is not known up front, so budget this much per request
+DEFAULT_OUTPUT_TOKENS = 4000
+DEFAULT_RESULT_CACHE_DIR = ".inference_cache"
+DEFAULT_RESULT_MAX_AGE = 24 * 60 * 60
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (about 4 characters per token)."""
+    return len(text) // 4
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+class RateLimiter:
+    """Token bucket that refills continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.available = min(
+            self.capacity, self.available + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    async def acquire(self, amount: float = 1):
+        """Wait until amount units fit in the bucket, then take them."""
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            self._refill()
+            while self.available < amount:
+                await asyncio.sleep((amount - self.available) / self.rate)
+                self._refill()
+            self.available -= amount
+
+    def adjust(self, amount: float):
+        """Return (positive) or charge (negative) units after the fact."""
+        self._refill()
+        self.available = min(self.capacity, self.available + amount)
+
+
+class ResultCache:
+    """On-disk cache of parsed inference results keyed by the full request."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_RESULT_CACHE_DIR,
+        max_age: float = DEFAULT_RESULT_MAX_AGE,
+        refresh: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        # Skip lookups but still store, so a refreshed run repopulates the cache
+        self.refresh = refresh
+
+    @staticmethod
+    def key(request: dict) -> str:
+        """Hash of the model, settings and fully assembled prompt."""
+        encoded = json.dumps(request, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a fresh cached result, or None."""
+        if self.refresh:
+            return None
+        try:
+            with open(self._path(key), "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if time.time() - entry["created_at"] > self.max_age:
+            return None
+        return entry["result"]
+
+    def set(self, key: str, result: dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"created_at": time.time(), "result": result}, f)
+        os.replace(tmp_path, path)
+
+
+class InferenceClient:
+    """Shared AsyncOpenAI client that bounds in-flight requests and RPM/TPM."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 4,
+        result_cache: Optional[ResultCache] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.result_cache = result_cache
+        self.client = AsyncOpenAI(
+            max_retries=max_retries,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                ),
+                timeout=httpx.Timeout(600.0, connect=10.0),
+            ),
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.request_limiter = (
+            RateLimiter(requests_per_minute) if requests_per_minute else None
+        )
+        self.token_limiter = (
+            RateLimiter(tokens_per_minute) if tokens_per_minute else None
+        )
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold one concurrency slot after waiting for the RPM/TPM budget."""
+        async with self.semaphore:
+            if self.request_limiter:
+                await self.request_limiter.acquire(1)
+            if self.token_limiter:
+                await self.token_limiter.acquire(estimated_tokens)
+            yield
+
+    def record_usage(self, estimated_tokens: int, response: Any):
+        """Correct the token budget once the real usage is known."""
+        usage = getattr(response, "usage", None)
+        if self.token_limiter and usage is not None:
+            self.token_limiter.adjust(estimated_tokens - usage.total_tokens)
+
+    @staticmethod
+    def _estimate(kwargs: dict) -> int:
+        return estimate_tokens(str(kwargs.get("input", ""))) + DEFAULT_OUTPUT_TOKENS
+
+    async def create_response(self, **kwargs) -> Any:
+        """Call responses.create under the global governor."""
+        estimated_tokens = self._estimate(kwargs)
+        async with self.slot(estimated_tokens):
+            response = await self.client.responses.create(**kwargs)
+        self.record_usage(estimated_tokens, response)
+        return response
+
+    async def stream_response(self, **kwargs) -> AsyncGenerator[Any, None]:
+        """Stream responses.create events, holding a slot until the stream ends.
+
+        Wrap in contextlib.aclosing() so an abandoned stream frees its slot.
+        """
+        estimated_tokens = self._estimate(kwargs)
+        async with self.slot(estimated_tokens):
+            stream = await self.client.responses.create(stream=True, **kwargs)
+            async with stream:
+                async for event in stream:
+                    if event.type == "response.completed":
+                        self.record_usage(estimated_tokens, event.response)
+                    yield event
+
+
+_inference_client: Optional[InferenceClient] = None
+
+
+def configure_inference(
+    max_concurrency: Optional[int] = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    refresh: bool = False,
+) -> InferenceClient:
+    """Create the process-wide client, falling back to INFERENCE_* env vars.
+
+    refresh bypasses cached results (they are still written back).
+    """
+    global _inference_client
+    _inference_client = InferenceClient(
+        max_concurrency=max_concurrency
+        or _env_int("INFERENCE_MAX_CONCURRENCY")
+        or DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute=requests_per_minute or _env_int("INFERENCE_RPM"),
+        tokens_per_minute=tokens_per_minute or _env_int("INFERENCE_TPM"),
+        result_cache=ResultCache(refresh=refresh),
+    )
+    return _inference_client
+
+
+def set_inference_client(client: InferenceClient):
+    """Swap in another client, such as the offline one backtests replay with.
+
+    Anything with result_cache, create_response and stream_response will do.
+    """
+    global _inference_client
+    _inference_client = client
+
+
+def get_inference_client() -> InferenceClient:
+    """Get the process-wide client, creating it with defaults on first use."""
+    if _inference_client is None:
+        return configure_inference()
+    return _inference_client
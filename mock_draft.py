@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""Mock snake drafts against ADP-with-noise bots.
+
+Every opponent takes the best noisy ADP value its roster still has room for.
+My seat is played by the local fast-pick scorer (or by the bots' own logic as
+a baseline), so thousands of mocks run across a process pool. The full
+recommendation pipeline can also drive my seat, one mock at a time.
+Roster rules come from ROSTER_FORMATS, the same table make_team_table uses.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from availability import player_spread
+from best_available import BestAvailable, RankedPlayer, get_best_available
+from draft_common import ROSTER_FORMATS, InferenceOptions, assign_slots
+from draft_state import DraftState
+from fast_pick import quick_pick
+from sleeper_api import (
+    Draft,
+    DraftPickData,
+    DraftSettings,
+    DraftStatus,
+    DraftType,
+    PlayerMetadata,
+    SeasonType,
+)
+
+DEFAULT_MOCKS = 1000
+# Mocks per process pool task; each task returns one aggregate
+MOCKS_PER_TASK = 50
+# Bots choose among this many of the best available players overall
+BOT_LOOKAHEAD = 12
+# Players a bot rosters beyond a position's dedicated starting slots
+BOT_EXTRA = {"QB": 1, "TE": 1}
+# Positions bots leave for the rounds that must fill their dedicated slots
+LATE_POSITIONS = {"K", "DEF"}
+SEATS = ["fast", "adp", "pipeline"]
+
+
+def sleeper_position(position: str) -> str:
+    # The rankings call defenses DST, Sleeper and the roster formats call them DEF
+    return "DEF" if position == "DST" else position
+
+
+# sleeper_id -> pick metadata, shared by every mock in the process
+_metadata: Dict[str, PlayerMetadata] = {}
+
+
+def mock_pick(
+    player: RankedPlayer, user_id: str, draft_id: str, pick_no: int, teams: int
+) -> DraftPickData:
+    """A pick shaped like Sleeper's, so the real pipeline can read the board."""
+    metadata = _metadata.get(player.sleeper_id)
+    if metadata is None:
+        first_name, _, last_name = player.name.partition(" ")
+        metadata = _metadata[player.sleeper_id] = PlayerMetadata(
+            first_name=first_name,
+            last_name=last_name,
+            position=sleeper_position(player.position),
+            team=player.team,
+        )
+    # model_construct skips validation; thousands of mocks build these
+    return DraftPickData.model_construct(
+        player_id=player.sleeper_id,
+        picked_by=user_id,
+        roster_id=None,
+        round=(pick_no - 1) // teams + 1,
+        draft_slot=(pick_no - 1) % teams + 1,
+        pick_no=pick_no,
+        metadata=metadata,
+        is_keeper=None,
+        draft_id=draft_id,
+    )
+
+
+def drafted_player(pick: DraftPickData) -> Tuple[str, str]:
+    """The player id and position of a pick made by mock_pick, which sets both."""
+    assert pick.player_id is not None and pick.metadata and pick.metadata.position
+    return pick.player_id, pick.metadata.position
+
+
+def mock_settings(league_type: str, teams: int) -> DraftSettings:
+    roster = ROSTER_FORMATS[league_type]
+    dedicated = {pos: roster.dedicated_slots(pos) for pos in roster.fills}
+    return DraftSettings(
+        teams=teams,
+        rounds=roster.rounds,
+        slots_qb=dedicated.get("QB", 0),
+        slots_rb=dedicated.get("RB", 0),
+        slots_wr=dedicated.get("WR", 0),
+        slots_te=dedicated.get("TE", 0),
+        slots_k=dedicated.get("K", 0),
+        slots_def=dedicated.get("DEF", 0),
+        slots_flex=len(roster.slots) - sum(dedicated.values()),
+        slots_bn=roster.bench,
+    )
+
+
+class MockDraft:
+    def __init__(
+        self,
+        rankings: BestAvailable,
+        spreads: Dict[str, float],
+        league_type: str = "standard",
+        teams: int = 12,
+        my_slot: int = 1,
+        seed: int = 0,
+    ):
+        self.rankings = rankings
+        self.spreads = spreads
+        self.league_type = league_type
+        self.roster = ROSTER_FORMATS[league_type]
+        self.dedicated = {
+            pos: self.roster.dedicated_slots(pos) for pos in self.roster.fills
+        }
+        self.teams = teams
+        self.rng = random.Random(seed)
+        self.user_ids = [f"mock_{slot}" for slot in range(1, teams + 1)]
+        self.my_user = self.user_ids[my_slot - 1]
+        self.counts: Dict[str, Counter] = {user: Counter() for user in self.user_ids}
+
+        draft_id = f"mock-{seed}"
+        draft = Draft(
+            type=DraftType.SNAKE,
+            status=DraftStatus.DRAFTING,
+            sport="nfl",
+            settings=mock_settings(league_type, teams),
+            season_type=SeasonType.REGULAR,
+            season="mock",
+            draft_id=draft_id,
+            draft_order={user: slot for slot, user in enumerate(self.user_ids, 1)},
+        )
+        self.state = DraftState.from_picks(draft_id, [], draft=draft)
+        self.index = self.state.index_for(rankings)
+
+    def on_clock(self) -> Optional[str]:
+        """The user whose pick it is, or None once the draft is over."""
+        pick_no = self.state.next_pick_no
+        if pick_no > self.state.total_picks:
+            return None
+        roster_id = self.state.roster_for_pick(pick_no)
+        if roster_id is None:
+            return None
+        return self.user_ids[roster_id - 1]
+
+    def allowed_positions(self, user_id: str) -> Set[str]:
+        """Positions a bot may take, filling dedicated slots before time runs out."""
+        counts = self.counts[user_id]
+        rounds_left = self.roster.rounds - sum(counts.values())
+        unfilled = {pos: n - counts[pos] for pos, n in self.dedicated.items()}
+        if rounds_left <= sum(max(0, n) for n in unfilled.values()):
+            return {pos for pos, n in unfilled.items() if n > 0}
+
+        allowed = set()
+        for pos, dedicated in self.dedicated.items():
+            if pos in LATE_POSITIONS:
+                continue
+            if pos in BOT_EXTRA and counts[pos] >= dedicated + BOT_EXTRA[pos]:
+                continue
+            allowed.add(pos)
+        return allowed
+
+    def bot_choice(self, user_id: str) -> RankedPlayer:
+        """The best noisy ADP value among players the bot has room for."""
+        allowed = self.allowed_positions(user_id)
+        candidates = [
+            p
+            for p in self.index.top(None, k=BOT_LOOKAHEAD)
+            if sleeper_position(p.position) in allowed
+        ]
+        if not candidates:
+            # The index uses the rankings' DST, the roster Sleeper's DEF
+            index_positions = ["DST" if pos == "DEF" else pos for pos in allowed]
+            candidates = [
+                p for position in index_positions for p in self.index.top(position, k=1)
+            ]
+        if not candidates:
+            candidates = self.index.top(None, k=1)
+        gauss = self.rng.gauss
+        return min(
+            candidates,
+            key=lambda p: p.avg_rank + self.spreads[p.sleeper_id] * gauss(0.0, 1.0),
+        )
+
+    def make_pick(self, user_id: str, player: RankedPlayer):
+        pick = mock_pick(
+            player,
+            user_id,
+            self.state.draft_id,
+            self.state.next_pick_no,
+            self.teams,
+        )
+        self.state.add_pick(pick)
+        self.counts[user_id][sleeper_position(player.position)] += 1
+
+    def seat_choice(self, seat: str) -> RankedPlayer:
+        """My pick from the local scorer, or the bots' logic for the baseline."""
+        if seat == "fast":
+            pick = quick_pick(self.state, self.my_user, {}, self.rankings)
+            if pick is not None:
+                return pick.player
+        return self.bot_choice(self.my_user)
+
+    def run(self, seat: str = "fast") -> "MockDraft":
+        while (user_id := self.on_clock()) is not None:
+            if user_id == self.my_user:
+                player = self.seat_choice(seat)
+            else:
+                player = self.bot_choice(user_id)
+            self.make_pick(user_id, player)
+        return self
+
+
+@dataclass
+class TeamTotals:
+    """Outcome sums over a group of drafted teams."""
+
+    teams: int = 0
+    counts: Counter = field(default_factory=Counter)
+    first_round: Counter = field(default_factory=Counter)
+    first_taken: Counter = field(default_factory=Counter)
+    # Pick number minus ADP, summed; positive means players came later than ADP
+    value: float = 0.0
+    picks: int = 0
+    starter_adp: float = 0.0
+    starters: int = 0
+    empty_starters: int = 0
+
+    def add(self, picks: List[DraftPickData], league_type: str, adp: Dict[str, float]):
+        self.teams += 1
+        drafted = [drafted_player(p) for p in picks]
+        player_ids = [player_id for player_id, _ in drafted]
+        positions: List[Optional[str]] = [pos for _, pos in drafted]
+        self.counts.update(positions)
+        for pos in set(positions):
+            first = next(p.round for p, p_pos in zip(picks, positions) if p_pos == pos)
+            self.first_round[pos] += first
+            self.first_taken[pos] += 1
+        for pick, player_id in zip(picks, player_ids):
+            self.value += pick.pick_no - adp[player_id]
+        self.picks += len(picks)
+
+        lineup, _ = assign_slots(positions, league_type)
+        for i in lineup.values():
+            if i is None:
+                self.empty_starters += 1
+            else:
+                self.starter_adp += adp[player_ids[i]]
+                self.starters += 1
+
+    def merge(self, other: "TeamTotals"):
+        self.teams += other.teams
+        self.counts.update(other.counts)
+        self.first_round.update(other.first_round)
+        self.first_taken.update(other.first_taken)
+        self.value += other.value
+        self.picks += other.picks
+        self.starter_adp += other.starter_adp
+        self.starters += other.starters
+        self.empty_starters += other.empty_starters
+
+
+@dataclass
+class MockStats:
+    mocks: int = 0
+    mine: TeamTotals = field(default_factory=TeamTotals)
+    # Every bot team, pooled
+    others: TeamTotals = field(default_factory=TeamTotals)
+
+    def record(self, mock: MockDraft, adp: Dict[str, float]):
+        self.mocks += 1
+        for user_id in mock.user_ids:
+            totals = self.mine if user_id == mock.my_user else self.others
+            totals.add(mock.state.team_picks(user_id), mock.league_type, adp)
+
+    def merge(self, other: "MockStats"):
+        self.mocks += other.mocks
+        self.mine.merge(other.mine)
+        self.others.merge(other.others)
+
+
+def draft_spreads(rankings: BestAvailable) -> Dict[str, float]:
+    return {p.sleeper_id: player_spread(p) for p in rankings.adp_rankings}
+
+
+def run_batch(
+    seeds: range, league_type: str, teams: int, my_slot: Optional[int], seat: str
+) -> MockStats:
+    """Run a batch of mocks in one process and return their aggregate."""
+    rankings = get_best_available()
+    spreads = draft_spreads(rankings)
+    adp = {p.sleeper_id: p.avg_rank for p in rankings.adp_rankings}
+    stats = MockStats()
+    for seed in seeds:
+        slot = my_slot or random.Random(seed).randint(1, teams)
+        mock = MockDraft(rankings, spreads, league_type, teams, slot, seed)
+        stats.record(mock.run(seat), adp)
+    return stats
+
+
+def run_mocks(
+    mocks: int,
+    league_type: str = "standard",
+    teams: int = 12,
+    my_slot: Optional[int] = None,
+    seat: str = "fast",
+    workers: Optional[int] = None,
+    seed: int = 0,
+) -> MockStats:
+    """Run mocks across a process pool and merge the per-batch aggregates.
+
+    Rankings are loaded here first, so forked workers share the parent's
+    read-only copy instead of each parsing the file.
+    """
+    get_best_available()
+    batches = [
+        range(start, min(start + MOCKS_PER_TASK, seed + mocks))
+        for start in range(seed, seed + mocks, MOCKS_PER_TASK)
+    ]
+    stats = MockStats()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_batch, batch, league_type, teams, my_slot, seat)
+            for batch in batches
+        ]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+async def run_pipeline_mocks(
+    mocks: int,
+    league_type: str,
+    teams: int,
+    my_slot: Optional[int],
+    num_inferences: int,
+    options: InferenceOptions,
+    seed: int = 0,
+) -> MockStats:
+    """Let the full recommendation pipeline draft my seat, one mock at a time."""
+    import chopped
+    import normal
+    from draft_common import load_player_bios, read_strategy
+
+    rankings = get_best_available()
+    spreads = draft_spreads(rankings)
+    adp = {p.sleeper_id: p.avg_rank for p in rankings.adp_rankings}
+    player_bios = await asyncio.to_thread(load_player_bios)
+    stats = MockStats()
+
+    for mock_seed in range(seed, seed + mocks):
+        slot = my_slot or random.Random(mock_seed).randint(1, teams)
+        mock = MockDraft(rankings, spreads, league_type, teams, slot, mock_seed)
+        while (user_id := mock.on_clock()) is not None:
+            if user_id != mock.my_user:
+                mock.make_pick(user_id, mock.bot_choice(user_id))
+                continue
+
+            if league_type == "chopped":
+                analysis, _ = await chopped.recommend_pick(
+                    mock.state, user_id, player_bios, num_inferences, options
+                )
+            else:
+                analysis, _ = await normal.recommend_pick(
+                    mock.state,
+                    user_id,
+                    player_bios,
+                    read_strategy(normal.STRATEGY_FILE),
+                    num_inferences,
+                    options,
+                )
+            player = rankings.find_by_name(analysis["consensus_pick"] or "")
+            if player is None or not mock.index.is_available(player.sleeper_id):
+                player = mock.seat_choice("fast")
+                print(f"⚠️ No usable consensus, taking the fast pick: {player.name}")
+            print(f"Mock {mock_seed} pick {mock.state.next_pick_no}: {player.name}")
+            mock.make_pick(user_id, player)
+        stats.record(mock, adp)
+    return stats
+
+
+def display_stats(stats: MockStats, elapsed: float, description: str):
+    mine, rest = stats.mine, stats.others
+    print(f"\n📊 {stats.mocks:,} mock drafts ({description}) in {elapsed:.1f}s\n")
+    print("| Position | My count | Field count | My first round | Field first round |")
+    print("|----------|----------|-------------|----------------|-------------------|")
+
+    def first(totals: TeamTotals, pos: str) -> str:
+        if not totals.first_taken[pos]:
+            return "-"
+        return f"{totals.first_round[pos] / totals.first_taken[pos]:.1f}"
+
+    for pos in ["QB", "RB", "WR", "TE", "K", "DEF"]:
+        if not mine.counts[pos] and not rest.counts[pos]:
+            continue
+        print(
+            f"| {pos} | {mine.counts[pos] / max(1, mine.teams):.2f} "
+            f"| {rest.counts[pos] / max(1, rest.teams):.2f} "
+            f"| {first(mine, pos)} | {first(rest, pos)} |"
+        )
+
+    def average(total: float, count: int) -> float:
+        return total / count if count else 0.0
+
+    print(
+        f"\nStarter ADP (lower is better): mine {average(mine.starter_adp, mine.starters):.1f}"
+        f" vs field {average(rest.starter_adp, rest.starters):.1f}"
+    )
+    print(
+        f"Value vs ADP per pick: mine {average(mine.value, mine.picks):+.1f}"
+        f" vs field {average(rest.value, rest.picks):+.1f}"
+    )
+    print(
+        f"Empty starting slots per team: mine {average(mine.empty_starters, mine.teams):.2f}"
+        f" vs field {average(rest.empty_starters, rest.teams):.2f}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Mock drafts against ADP bots")
+    parser.add_argument(
+        "--mocks",
+        type=int,
+        default=DEFAULT_MOCKS,
+        help=f"Number of mock drafts to run (default: {DEFAULT_MOCKS})",
+    )
+    parser.add_argument(
+        "--league",
+        choices=sorted(ROSTER_FORMATS),
+        default="standard",
+        help="Roster format to draft for (default: standard)",
+    )
+    parser.add_argument(
+        "--teams",
+        type=int,
+        default=12,
+        choices=[12, 13, 14],
+        help="Teams in the draft (default: 12)",
+    )
+    parser.add_argument(
+        "--slot", type=int, help="My draft slot (default: random for each mock)"
+    )
+    parser.add_argument(
+        "--seat",
+        choices=SEATS,
+        default="fast",
+        help="Who drafts my seat: the fast-pick scorer, an ADP bot as a "
+        "baseline, or the full recommendation pipeline (default: fast)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="First mock's seed")
+    parser.add_argument(
+        "--inferences",
+        type=int,
+        default=1,
+        help="With --seat pipeline, inferences per pick (default: 1)",
+    )
+    args = parser.parse_args()
+
+    if args.slot is not None and not 1 <= args.slot <= args.teams:
+        parser.error(f"--slot must be between 1 and {args.teams}")
+
+    description = (
+        f"{args.league}, {args.teams} teams, "
+        f"{'slot ' + str(args.slot) if args.slot else 'random slot'}, {args.seat} seat"
+    )
+    started = time.perf_counter()
+    if args.seat == "pipeline":
+        stats = await run_pipeline_mocks(
+            args.mocks,
+            args.league,
+            args.teams,
+            args.slot,
+            args.inferences,
+            InferenceOptions(),
+            args.seed,
+        )
+    else:
+        stats = await asyncio.to_thread(
+            run_mocks,
+            args.mocks,
+            args.league,
+            args.teams,
+            args.slot,
+            args.seat,
+            args.workers,
+            args.seed,
+        )
+    display_stats(stats, time.perf_counter() - started, description)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,50 +4,114 @@
 import argparse
 import asyncio
 import os
+from functools import partial
+from typing import List, Optional, Tuple
 
-from best_available import format_best_available_summary
+from availability import forecast_availability, format_wait_signals
+from conversation import DraftConversation
 from draft_common import (
-    analyze_inference_results,
+    FINAL_INSTRUCTION,
+    InferenceOptions,
+    add_governor_arguments,
+    add_inference_arguments,
+    add_watch_arguments,
     display_results,
-    format_best_available_with_bios,
+    format_available_order,
+    format_player_profiles,
+    gather_inferences,
     get_draft_recommendation,
+    inference_options,
     load_player_bios,
+    profile_token_budget,
+    read_strategy,
     render_draft_state,
+    report_shared_prefix,
+    resolve_consensus,
+    with_pick_deadline,
 )
-from sleeper_api import SleeperAPI
+from draft_state import DraftState
+from draft_watch import DraftWatcher
+from fast_pick import announce_fast_pick
+from inference_client import configure_inference
+from sleeper_api import AsyncSleeperAPI
+from speculation import Speculator
+from strategy_index import focus_sections
+
+STRATEGY_FILE = "standard_league_strategy.md"
 
 
 async def run_multiple_inferences_shuffled(
-    message_template: str,
+    base_message: str,
     num_inferences: int,
-    picks,
+    draft_state: DraftState,
     player_id: str,
     player_bios,
     standard_strategy: str,
+    options: Optional[InferenceOptions] = None,
+    conversation: Optional[DraftConversation] = None,
 ) -> list:
     """Run multiple inferences with shuffled player orders."""
     print(f"\nRunning {num_inferences} inference{'s' if num_inferences > 1 else ''}...")
 
+    # Strategy, instructions, roster and bios are identical for every seed
+    player_bios = player_bios or {}
+    strategy_sections: List[str] = []
+    if options and options.focus_strategy:
+        strategy_sections = focus_sections(standard_strategy, draft_state, player_id)
+        standard_strategy = "\n\n".join(strategy_sections)
+    head = "# STANDARD FANTASY FOOTBALL DRAFT\n\n" + standard_strategy + "\n\n"
+    forecast = (
+        forecast_availability(draft_state, player_id)
+        if options and options.forecast
+        else None
+    )
+    wait_signals = format_wait_signals(forecast) if forecast else ""
+    # Every seed's ordering is the same size, so any one reserves its share
+    token_budget = profile_token_budget(
+        options,
+        head,
+        base_message,
+        wait_signals,
+        format_available_order(draft_state, player_bios, None, forecast),
+        FINAL_INSTRUCTION,
+    )
+    shared_prefix = (
+        head
+        + base_message
+        + format_player_profiles(draft_state, player_id, player_bios, token_budget)
+        + wait_signals
+    )
+
     tasks = []
+    messages = []
     for i in range(num_inferences):
-        # Generate shuffled best available summary with unique seed per inference
-        shuffle_seed = i + 2000  # Different seed range from chopped
-        if player_bios:
-            best_available_summary = format_best_available_with_bios(
-                picks, player_id, player_bios, shuffle_seed=shuffle_seed
+        previous = conversation.previous(i + 1, draft_state) if conversation else None
+        if conversation and previous:
+            message = conversation.delta_message(
+                previous, draft_state, player_bios, strategy_sections, wait_signals
             )
-        else:
-            best_available_summary = format_best_available_summary(
-                picks, player_id, shuffle_seed=shuffle_seed
+            print(
+                f"[Inference {i+1}] Continuing conversation "
+                f"(turn {previous.turns + 1}, {len(message):,} chars)"
             )
+            tasks.append(
+                partial(
+                    get_draft_recommendation,
+                    message,
+                    i + 1,
+                    previous_response_id=previous.response_id,
+                )
+            )
+            continue
 
-        # Build full message with shuffled players
+        # Only the shuffled ordering differs per seed, so it goes last
+        shuffle_seed = i + 2000  # Different seed range from chopped
         message = (
-            "# STANDARD FANTASY FOOTBALL DRAFT\n\n"
-            + standard_strategy
-            + "\n\n"
-            + message_template.replace("{BEST_AVAILABLE}", best_available_summary)
+            shared_prefix
+            + format_available_order(draft_state, player_bios, shuffle_seed, forecast)
+            + FINAL_INSTRUCTION
         )
+        messages.append(message)
 
         # Log the first inference's full message
         if i == 0:
@@ -58,85 +122,34 @@ async def run_multiple_inferences_shuffled(
             print("=" * 80 + "\n")
 
         # Create task
-        task = get_draft_recommendation(message, i + 1)
+        task = partial(get_draft_recommendation, message, i + 1)
         tasks.append(task)
 
     if not tasks:
         return []
 
-    # Run all inferences concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Handle any exceptions
-    processed_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            processed_results.append(
-                {
-                    "inference_id": i + 1,
-                    "full_response": f"Exception: {result}",
-                    "parsed_selection": None,
-                    "success": False,
-                    "error": str(result),
-                }
-            )
-        else:
-            processed_results.append(result)  # type: ignore[arg-type]
-
-    return processed_results
-
-
-async def main():
-    """Main async function to handle draft recommendations for standard leagues."""
-    parser = argparse.ArgumentParser(
-        description="AI Fantasy Football Draft Assistant - Standard League"
-    )
-    parser.add_argument("draft_id", help="Sleeper draft ID")
-    parser.add_argument(
-        "--inferences",
-        type=int,
-        default=1,
-        help="Number of parallel inferences to run (default: 1)",
-    )
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Show all inference responses, not just consensus",
-    )
-
-    args = parser.parse_args()
-
-    draft_id = args.draft_id
-    num_inferences = args.inferences
-    verbose = args.verbose
-    player_id = os.getenv("PLAYER_ID")
-
-    if not player_id:
-        print("ERROR: PLAYER_ID environment variable not set")
-        return
-
-    # Load player bios
-    player_bios = load_player_bios()
-
-    # Load standard league strategy
-    with open("standard_league_strategy.md", "r") as f:
-        standard_strategy = f.read()
+    report_shared_prefix(messages)
+    results = await gather_inferences(tasks, options)
+    if conversation:
+        # Every seed shares the one focused strategy
+        conversation.record(
+            results,
+            draft_state,
+            player_bios,
+            dict.fromkeys(range(1, num_inferences + 1), strategy_sections),
+        )
+    return results
 
-    # Get draft state
-    api = SleeperAPI()
-    picks = api.get_draft_picks(draft_id)
-    state = render_draft_state(player_id, draft_id, "standard")
 
-    # Create message template with placeholder for shuffled best available
-    message_template = (
+def build_message_template(team_table: str) -> str:
+    """Create the static instructions that follow the strategy in every prompt."""
+    return (
         "# 🚨 LIVE DRAFT - MY PICK IS NOW! 🚨\n\n"
         + "I am currently on the clock in a LIVE DRAFT. I need to make my selection IMMEDIATELY.\n"
         + "All players shown as available ARE currently available - no one else can pick before me.\n"
         + "This is MY TURN to pick RIGHT NOW.\n\n"
         + "# Current Team:\n\n"
-        + state.get(player_id, "")
-        + "{BEST_AVAILABLE}"  # Placeholder for shuffled best available
+        + team_table
         + "\n\n## IMMEDIATE DRAFT DECISION REQUIRED\n\n"
         + "**IMPORTANT: Please use web search to find the most current 2025 NFL information including:**\n"
         + "- Recent injuries, health updates, or player status changes\n"
@@ -157,24 +170,145 @@ async def main():
         + "- All listed players ARE available for me to pick\n"
         + "- No one can 'snipe' these players - it's MY turn\n\n"
         + "Use web search to quickly verify current player situations, then give me the BEST PICK "
-        + "from the AVAILABLE PLAYERS shown above. "
-        + "Give your final selection in [[Player Name]] format."
+        + "from the BEST AVAILABLE PLAYERS listed at the end.\n"
+    )
+
+
+async def recommend_pick(
+    draft_state: DraftState,
+    player_id: str,
+    player_bios,
+    standard_strategy: str,
+    num_inferences: int,
+    options: Optional[InferenceOptions] = None,
+    conversation: Optional[DraftConversation] = None,
+) -> Tuple[dict, List[dict]]:
+    """Run the recommendation pipeline for the current board."""
+    options = with_pick_deadline(options, draft_state)
+    fast_pick = (
+        announce_fast_pick(draft_state, player_id, player_bios or {})
+        if options.fast_pick
+        else None
     )
+    state = render_draft_state(player_id, draft_state, "standard")
+    base_message = build_message_template(state.get(player_id, ""))
 
     print("\n" + "=" * 80)
 
     # Run multiple inferences with shuffled player orders
     results = await run_multiple_inferences_shuffled(
-        message_template,
+        base_message,
         num_inferences,
-        picks,
+        draft_state,
         player_id,
         player_bios,
         standard_strategy,
+        options,
+        conversation,
     )
 
-    # Analyze results
-    analysis = analyze_inference_results(results)
+    # Analyze results, falling back to ADP if the pick timer ran out
+    analysis = resolve_consensus(results, draft_state, player_id, options, fast_pick)
+
+    return analysis, results
+
+
+async def main():
+    """Main async function to handle draft recommendations for standard leagues."""
+    parser = argparse.ArgumentParser(
+        description="AI Fantasy Football Draft Assistant - Standard League"
+    )
+    parser.add_argument("draft_id", help="Sleeper draft ID")
+    add_inference_arguments(parser)
+    add_watch_arguments(parser)
+    add_governor_arguments(parser)
+
+    args = parser.parse_args()
+    configure_inference(
+        max_concurrency=args.max_concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        refresh=args.refresh,
+    )
+
+    draft_id = args.draft_id
+    num_inferences = args.inferences
+    verbose = args.verbose
+    options = inference_options(args)
+    player_id = os.getenv("PLAYER_ID")
+
+    if not player_id:
+        print("ERROR: PLAYER_ID environment variable not set")
+        return
+
+    # Load standard league strategy
+    standard_strategy = read_strategy(STRATEGY_FILE)
+
+    async with AsyncSleeperAPI() as api:
+        if args.watch:
+            player_bios = await asyncio.to_thread(load_player_bios)
+            conversation = (
+                DraftConversation(player_id, "standard") if args.chain else None
+            )
+
+            def recommend(draft_state: DraftState):
+                return recommend_pick(
+                    draft_state,
+                    player_id,
+                    player_bios,
+                    standard_strategy,
+                    num_inferences,
+                    options,
+                    conversation,
+                )
+
+            def announce(draft_state: DraftState) -> Optional[str]:
+                return announce_fast_pick(draft_state, player_id, player_bios)
+
+            speculator = (
+                Speculator(
+                    player_id,
+                    recommend,
+                    safety_margin=args.safety_margin,
+                    fast_pick=announce if args.fast else None,
+                )
+                if args.speculate
+                else None
+            )
+
+            async def on_my_turn(draft_state: DraftState):
+                if speculator:
+                    analysis, results = await speculator.recommend(draft_state)
+                else:
+                    analysis, results = await recommend(draft_state)
+                display_results(analysis, results, verbose)
+
+            watcher = DraftWatcher(api, draft_id, player_id, interval=args.interval)
+            await watcher.watch(
+                on_my_turn, on_update=speculator.update if speculator else None
+            )
+            return
+
+        # Fetch the draft and its picks while player bios load from disk
+        draft, picks, traded_picks, player_bios = await asyncio.gather(
+            api.get_draft(draft_id),
+            api.get_draft_picks(draft_id),
+            api.get_draft_traded_picks(draft_id),
+            asyncio.to_thread(load_player_bios),
+        )
+
+    # Get draft state
+    draft_state = DraftState.from_picks(
+        draft_id, picks, draft=draft, traded_picks=traded_picks
+    )
+    analysis, results = await recommend_pick(
+        draft_state,
+        player_id,
+        player_bios,
+        standard_strategy,
+        num_inferences,
+        options,
+    )
 
     # Display results
     display_results(analysis, results, verbose)
@@ -4,7 +4,10 @@
 import json
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from player_store import PlayerStore, load_player_store
+from rankings_store import binary_path, write_rankings_binary
 
 
 @dataclass
@@ -93,152 +96,139 @@ def parse_adp_file(filename: str = "data") -> List[ADPPlayer]:
     return players
 
 
-def load_sleeper_players() -> Dict:
+def load_sleeper_players() -> PlayerStore:
     """Load Sleeper players database."""
-    with open("players.json", "r") as f:
-        return json.load(f)
+    return load_player_store()
+
+
+# Map team names to Sleeper DST IDs
+DST_MAPPINGS = {
+    "Denver Broncos": "DEN",
+    "Philadelphia Eagles": "PHI",
+    "Pittsburgh Steelers": "PIT",
+    "Baltimore Ravens": "BAL",
+    "Minnesota Vikings": "MIN",
+    "Buffalo Bills": "BUF",
+    "Kansas City Chiefs": "KC",
+    "New Orleans Saints": "NO",
+    "Houston Texans": "HOU",
+    "Cincinnati Bengals": "CIN",
+    "Cleveland Browns": "CLE",
+    "Seattle Seahawks": "SEA",
+    "New York Jets": "NYJ",
+    "Green Bay Packers": "GB",
+    "Indianapolis Colts": "IND",
+    "Los Angeles Chargers": "LAC",
+    "San Francisco 49ers": "SF",
+    "Chicago Bears": "CHI",
+    "Washington Football Team": "WAS",
+    "Washington Commanders": "WAS",
+    "Tampa Bay Buccaneers": "TB",
+    "Dallas Cowboys": "DAL",
+    "Detroit Lions": "DET",
+    "Miami Dolphins": "MIA",
+    "New York Giants": "NYG",
+    "Arizona Cardinals": "ARI",
+    "Atlanta Falcons": "ATL",
+    "Carolina Panthers": "CAR",
+    "Jacksonville Jaguars": "JAC",
+    "Las Vegas Raiders": "LV",
+    "Los Angeles Rams": "LAR",
+    "New England Patriots": "NE",
+    "Tennessee Titans": "TEN",
+}
+
+# Hardcoded player IDs for known mismatches
+DIRECT_ID_MAPPINGS = {
+    ("Michael Pittman Jr.", "WR", "IND"): "6819",
+    ("Kyle Pitts Sr.", "TE", "ATL"): "7553",
+    ("Luther Burden III", "WR", "CHI"): "12519",
+    ("Cam Ward", "QB", "TEN"): "12522",  # Cameron Ward
+    ("Michael Penix Jr.", "QB", "ATL"): "11559",
+    ("Tre' Harris", "WR", "LAC"): "12509",
+    ("Marquise Brown", "WR", "KC"): "5848",  # Hollywood Brown
+    ("Anthony Richardson Sr.", "QB", "IND"): "9229",
+    ("Dont'e Thornton Jr.", "WR", "LV"): "12541",
+    ("Ollie Gordon II", "RB", "MIA"): "12495",
+    ("Ray-Ray McCloud III", "WR", "ATL"): "5096",
+    ("Harold Fannin Jr.", "TE", "CLE"): "12506",
+    ("Efton Chism III", "WR", "NE"): "12542",
+    ("Chris Rodriguez Jr.", "RB", "WAS"): "10219",
+    ("Oronde Gadsden II", "TE", "LAC"): "12493",
+    ("Chris Tyree", "RB", "NO"): "13043",  # Listed as WR in DB but RB in ADP
+    # Free agents without team info in ADP data
+    ("Zack Moss", "RB", "FA"): "6845",
+    ("Amari Cooper", "WR", "FA"): "2309",
+}
+
+NAME_SUFFIXES = {"jr", "jr.", "sr", "sr.", "ii", "iii", "iv", "v"}
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a name, collapse whitespace and strip generational suffixes."""
+    parts = name.lower().split()
+    while len(parts) > 1 and parts[-1] in NAME_SUFFIXES:
+        parts.pop()
+    return " ".join(parts)
+
+
+class SleeperNameIndex:
+    """One-time name index over the Sleeper players database."""
+
+    def __init__(self, sleeper_db: PlayerStore):
+        # Full name -> candidates in database order, checked for team/position
+        self.by_full_name: Dict[str, List[Tuple[str, str, str]]] = {}
+        # (first, last, position) -> first matching player
+        self.by_first_last: Dict[Tuple[str, str, str], str] = {}
+
+        for player in sleeper_db:
+            first_name = normalize_name(player.first_name)
+            last_name = normalize_name(player.last_name)
+            player_team = player.team or ""
+            player_position = player.position or ""
+
+            full_name = normalize_name(f"{first_name} {last_name}")
+            self.by_full_name.setdefault(full_name, []).append(
+                (player.player_id, player_team, player_position)
+            )
+            self.by_first_last.setdefault(
+                (first_name, last_name, player_position), player.player_id
+            )
 
 
-def match_player_to_sleeper(adp_player: ADPPlayer, sleeper_db: Dict) -> Optional[str]:
+def match_player_to_sleeper(
+    adp_player: ADPPlayer, name_index: SleeperNameIndex
+) -> Optional[str]:
     """Match an ADP player to a Sleeper player ID."""
 
     # Handle DST/Defense specially
     if adp_player.position == "DST":
-        # Map team names to Sleeper DST IDs
-        dst_mappings = {
-            "Denver Broncos": "DEN",
-            "Philadelphia Eagles": "PHI",
-            "Pittsburgh Steelers": "PIT",
-            "Baltimore Ravens": "BAL",
-            "Minnesota Vikings": "MIN",
-            "Buffalo Bills": "BUF",
-            "Kansas City Chiefs": "KC",
-            "New Orleans Saints": "NO",
-            "Houston Texans": "HOU",
-            "Cincinnati Bengals": "CIN",
-            "Cleveland Browns": "CLE",
-            "Seattle Seahawks": "SEA",
-            "New York Jets": "NYJ",
-            "Green Bay Packers": "GB",
-            "Indianapolis Colts": "IND",
-            "Los Angeles Chargers": "LAC",
-            "San Francisco 49ers": "SF",
-            "Chicago Bears": "CHI",
-            "Washington Football Team": "WAS",
-            "Washington Commanders": "WAS",
-            "Tampa Bay Buccaneers": "TB",
-            "Dallas Cowboys": "DAL",
-            "Detroit Lions": "DET",
-            "Miami Dolphins": "MIA",
-            "New York Giants": "NYG",
-            "Arizona Cardinals": "ARI",
-            "Atlanta Falcons": "ATL",
-            "Carolina Panthers": "CAR",
-            "Jacksonville Jaguars": "JAC",
-            "Las Vegas Raiders": "LV",
-            "Los Angeles Rams": "LAR",
-            "New England Patriots": "NE",
-            "Tennessee Titans": "TEN",
-        }
-
-        if adp_player.name in dst_mappings:
-            return dst_mappings[adp_player.name]
-
-    # Clean up name for matching
-    name = adp_player.name.strip()
-
-    # Handle special cases
-    name_mappings = {
-        "Patrick Mahomes II": "Patrick Mahomes",
-        "Aaron Jones Sr.": "Aaron Jones",
-        "Deebo Samuel Sr.": "Deebo Samuel",
-        "Travis Etienne Jr.": "Travis Etienne",
-        "Brian Robinson Jr.": "Brian Robinson",
-        "Tyrone Tracy Jr.": "Tyrone Tracy",
-        "Marvin Harrison Jr.": "Marvin Harrison",
-        "Kenneth Walker III": "Kenneth Walker",
-        "Brian Thomas Jr.": "Brian Thomas",
-        "Michael Pittman Jr.": "Michael Pittman",
-        "Kyle Pitts Sr.": "Kyle Pitts",
-        "Luther Burden III": "Luther Burden",
-        "Marvin Mims Jr.": "Marvin Mims",
-        "Michael Wilson Jr.": "Michael Wilson",
-        "Odell Beckham Jr.": "Odell Beckham",
-        "Cedric Tillman Jr.": "Cedric Tillman",
-        "Roman Wilson Jr.": "Roman Wilson",
-        "Keaton Mitchell Jr.": "Keaton Mitchell",
-        "Calvin Austin III": "Calvin Austin",
-        "Greg Dortch Jr.": "Greg Dortch",
-    }
-
-    # Also handle hardcoded player IDs for known mismatches
-    direct_id_mappings = {
-        ("Michael Pittman Jr.", "WR", "IND"): "6819",
-        ("Kyle Pitts Sr.", "TE", "ATL"): "7553",
-        ("Luther Burden III", "WR", "CHI"): "12519",
-        ("Cam Ward", "QB", "TEN"): "12522",  # Cameron Ward
-        ("Michael Penix Jr.", "QB", "ATL"): "11559",
-        ("Tre' Harris", "WR", "LAC"): "12509",
-        ("Marquise Brown", "WR", "KC"): "5848",  # Hollywood Brown
-        ("Anthony Richardson Sr.", "QB", "IND"): "9229",
-        ("Dont'e Thornton Jr.", "WR", "LV"): "12541",
-        ("Ollie Gordon II", "RB", "MIA"): "12495",
-        ("Ray-Ray McCloud III", "WR", "ATL"): "5096",
-        ("Harold Fannin Jr.", "TE", "CLE"): "12506",
-        ("Efton Chism III", "WR", "NE"): "12542",
-        ("Chris Rodriguez Jr.", "RB", "WAS"): "10219",
-        ("Oronde Gadsden II", "TE", "LAC"): "12493",
-        ("Chris Tyree", "RB", "NO"): "13043",  # Listed as WR in DB but RB in ADP
-        # Free agents without team info in ADP data
-        ("Zack Moss", "RB", "FA"): "6845",
-        ("Amari Cooper", "WR", "FA"): "2309",
-    }
+        if adp_player.name in DST_MAPPINGS:
+            return DST_MAPPINGS[adp_player.name]
 
     # Check direct mappings first
     key = (adp_player.name, adp_player.position, adp_player.team)
-    if key in direct_id_mappings:
-        return direct_id_mappings[key]
+    if key in DIRECT_ID_MAPPINGS:
+        return DIRECT_ID_MAPPINGS[key]
 
-    if name in name_mappings:
-        name = name_mappings[name]
-
-    # Split name into parts
-    name_parts = name.split()
+    name = normalize_name(adp_player.name)
 
     # Try exact match first
-    for player_id, player_data in sleeper_db.items():
-        first_name = player_data.get("first_name", "")
-        last_name = player_data.get("last_name", "")
-        player_team = player_data.get("team", "")
-        player_position = player_data.get("position", "")
-
-        # Check for exact name match
-        full_name = f"{first_name} {last_name}".strip()
-
-        if full_name.lower() == name.lower():
-            # Verify team matches (handle team changes)
-            if player_team == adp_player.team or not player_team:
-                # Verify position matches
-                if player_position == adp_player.position:
-                    return player_id
-
-    # Try partial matches
-    for player_id, player_data in sleeper_db.items():
-        first_name = (player_data.get("first_name") or "").lower()
-        last_name = (player_data.get("last_name") or "").lower()
-        player_team = player_data.get("team", "")
-        player_position = player_data.get("position", "")
-
-        # Match by first and last name
-        if len(name_parts) >= 2:
-            if (
-                first_name == name_parts[0].lower()
-                and last_name == name_parts[-1].lower()
-            ):
-                # Verify position
-                if player_position == adp_player.position:
-                    # Team might not match due to trades/signings
-                    return player_id
+    for player_id, player_team, player_position in name_index.by_full_name.get(
+        name, []
+    ):
+        # Verify team matches (handle team changes) and position matches
+        if player_team == adp_player.team or not player_team:
+            if player_position == adp_player.position:
+                return player_id
+
+    # Try partial match by first and last name
+    # Team might not match due to trades/signings
+    name_parts = name.split()
+    if len(name_parts) >= 2:
+        return name_index.by_first_last.get(
+            (name_parts[0], name_parts[-1], adp_player.position)
+        )
 
     return None
 
@@ -252,6 +242,7 @@ def create_rankings_json():
 
     print("Loading Sleeper database...")
     sleeper_db = load_sleeper_players()
+    name_index = SleeperNameIndex(sleeper_db)
 
     print("Matching players to Sleeper IDs...")
     matched = 0
@@ -260,7 +251,7 @@ def create_rankings_json():
     rankings = []
 
     for player in adp_players:
-        sleeper_id = match_player_to_sleeper(player, sleeper_db)
+        sleeper_id = match_player_to_sleeper(player, name_index)
 
         if sleeper_id:
             player.sleeper_id = sleeper_id
@@ -297,6 +288,12 @@ def create_rankings_json():
 
     print("\nSaved rankings to adp_rankings.json")
 
+    # Save the compact binary artifact the draft scripts memory-map
+    bin_file = binary_path("adp_rankings.json")
+    write_rankings_binary(rankings, bin_file)
+
+    print(f"Saved binary rankings to {bin_file}")
+
     return rankings
 
 
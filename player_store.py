@@ -0,0 +1,203 @@
+"""Compact store for the Sleeper players database."""
+
+import json
+import os
+import sqlite3
+import sys
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional
+
+from sleeper_api import Player
+
+PLAYERS_JSON_FILE = "players.json"
+PLAYER_STORE_FILE = "players.db"
+
+
+class PlayerRecord:
+    """The handful of fields most callers need for a single player."""
+
+    __slots__ = ("player_id", "first_name", "last_name", "position", "team", "status")
+
+    def __init__(
+        self,
+        player_id: str,
+        first_name: str,
+        last_name: str,
+        position: Optional[str],
+        team: Optional[str],
+        status: Optional[str],
+    ):
+        self.player_id = player_id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.position = position
+        self.team = team
+        self.status = status
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+class PlayerStore:
+    """Columnar player store with an ID -> row index.
+
+    Only name, position, team and status are held in memory. Full Player models
+    are validated on first access, either from the raw API payload or from the
+    SQLite file the store was loaded from.
+    """
+
+    def __init__(self):
+        self.player_ids: List[str] = []
+        self.first_names: List[str] = []
+        self.last_names: List[str] = []
+        self.positions: List[Optional[str]] = []
+        self.teams: List[Optional[str]] = []
+        self.statuses: List[Optional[str]] = []
+        self.index: Dict[str, int] = {}
+        self._raw: Optional[Dict[str, dict]] = None
+        self._db_path: Optional[str] = None
+        self._players: Dict[str, Player] = {}
+
+    def _append(self, player_id, first_name, last_name, position, team, status):
+        self.index[player_id] = len(self.player_ids)
+        self.player_ids.append(player_id)
+        self.first_names.append(first_name or "")
+        self.last_names.append(last_name or "")
+        # Positions, teams and statuses repeat heavily, so share one string each
+        self.positions.append(_intern(position))
+        self.teams.append(_intern(team))
+        self.statuses.append(_intern(status))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, dict]) -> "PlayerStore":
+        """Build a store from the raw /players payload."""
+        store = cls()
+        for player_id, player_data in data.items():
+            store._append(
+                player_id,
+                player_data.get("first_name"),
+                player_data.get("last_name"),
+                player_data.get("position"),
+                player_data.get("team"),
+                player_data.get("status"),
+            )
+        store._raw = data
+        return store
+
+    @classmethod
+    def load(cls, path: str = PLAYER_STORE_FILE) -> "PlayerStore":
+        """Load the compact columns from a saved store, leaving full data on disk."""
+        store = cls()
+        with closing(sqlite3.connect(path)) as conn:
+            rows = conn.execute(
+                "SELECT player_id, first_name, last_name, position, team, status "
+                "FROM players ORDER BY rowid"
+            )
+            for row in rows:
+                store._append(*row)
+        store._db_path = path
+        return store
+
+    def save(self, path: str = PLAYER_STORE_FILE):
+        """Persist the store to SQLite, including full data for lazy models."""
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        with closing(sqlite3.connect(tmp_path)) as conn:
+            conn.execute(
+                "CREATE TABLE players (player_id TEXT PRIMARY KEY, first_name TEXT, "
+                "last_name TEXT, position TEXT, team TEXT, status TEXT, data TEXT)"
+            )
+            conn.executemany(
+                "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        player_id,
+                        self.first_names[row],
+                        self.last_names[row],
+                        self.positions[row],
+                        self.teams[row],
+                        self.statuses[row],
+                        json.dumps(self._raw_data(player_id)),
+                    )
+                    for player_id, row in self.index.items()
+                ),
+            )
+            conn.commit()
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self.index
+
+    def __iter__(self) -> Iterator[PlayerRecord]:
+        for row in range(len(self.player_ids)):
+            yield self._record(row)
+
+    def _record(self, row: int) -> PlayerRecord:
+        return PlayerRecord(
+            self.player_ids[row],
+            self.first_names[row],
+            self.last_names[row],
+            self.positions[row],
+            self.teams[row],
+            self.statuses[row],
+        )
+
+    def get(self, player_id: str) -> Optional[PlayerRecord]:
+        """Get the compact record for a player."""
+        row = self.index.get(player_id)
+        if row is None:
+            return None
+        return self._record(row)
+
+    def _raw_data(self, player_id: str) -> Optional[dict]:
+        if self._raw is not None:
+            return self._raw.get(player_id)
+        if self._db_path is None:
+            return None
+
+        with closing(sqlite3.connect(self._db_path)) as conn:
+            row = conn.execute(
+                "SELECT data FROM players WHERE player_id = ?", (player_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def player(self, player_id: str) -> Optional[Player]:
+        """Get the full Player model, validating it on first access."""
+        if player_id in self._players:
+            return self._players[player_id]
+        if player_id not in self.index:
+            return None
+
+        data = self._raw_data(player_id)
+        if data is None:
+            return None
+
+        player = Player(**{"player_id": player_id, **data})
+        self._players[player_id] = player
+        return player
+
+
+def load_player_store(
+    json_file: str = PLAYERS_JSON_FILE, store_file: str = PLAYER_STORE_FILE
+) -> PlayerStore:
+    """Load the saved store, rebuilding it when players.json is newer."""
+    if os.path.exists(store_file) and (
+        not os.path.exists(json_file)
+        or os.path.getmtime(store_file) >= os.path.getmtime(json_file)
+    ):
+        return PlayerStore.load(store_file)
+
+    with open(json_file, "r") as f:
+        store = PlayerStore.from_dict(json.load(f))
+    store.save(store_file)
+    return store
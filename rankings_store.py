@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Compact columnar binary format for ADP rankings.
+
+Layout (little-endian, every section padded to 8 bytes):
+    header        magic "ADPR", version, player count, string count
+    string table  (count + 1) u32 offsets followed by one UTF-8 blob
+    columns       one contiguous array per field in COLUMNS order
+
+Names, teams, positions and Sleeper IDs are interned in the string table, so
+the file is read with a handful of bulk copies and no JSON decoding.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+MAGIC = b"ADPR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+
+# (field, struct format, is interned string)
+COLUMNS: List[Tuple[str, str, bool]] = [
+    ("sleeper_id", "I", True),
+    ("name", "I", True),
+    ("team", "I", True),
+    ("position", "I", True),
+    ("rank", "i", False),
+    ("position_rank", "i", False),
+    ("bye_week", "i", False),
+    ("yahoo_rank", "i", False),
+    ("sleeper_rank", "i", False),
+    ("rtsports_rank", "i", False),
+    ("avg_rank", "d", False),
+]
+
+STRING_FIELDS = {field for field, _, is_string in COLUMNS if is_string}
+
+# Missing source ranks use the same sentinel as parse_adp
+DEFAULTS = {"bye_week": 0, "yahoo_rank": 999, "sleeper_rank": 999, "rtsports_rank": 999}
+
+
+def binary_path(rankings_file: str) -> str:
+    """Get the binary artifact path that sits next to a rankings JSON file."""
+    return os.path.splitext(rankings_file)[0] + ".bin"
+
+
+def _padded(size: int) -> int:
+    return size + (-size % 8)
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (_padded(len(data)) - len(data))
+
+
+def write_rankings_binary(rankings: List[dict], path: str):
+    """Write rankings dicts (as stored in adp_rankings.json) to the binary format."""
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    columns = []
+    for field, fmt, is_string in COLUMNS:
+        if is_string:
+            values = [intern(str(item[field])) for item in rankings]
+        else:
+            values = [item.get(field, DEFAULTS.get(field, 0)) for item in rankings]
+        columns.append(_pad(struct.pack(f"<{len(values)}{fmt}", *values)))
+
+    encoded = [s.encode() for s in strings]
+    offsets = [0]
+    for raw in encoded:
+        offsets.append(offsets[-1] + len(raw))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(rankings), len(strings)))
+        f.write(_pad(struct.pack(f"<{len(offsets)}I", *offsets)))
+        f.write(_pad(b"".join(encoded)))
+        for column in columns:
+            f.write(column)
+    os.replace(tmp_path, path)
+
+
+class RankingsTable:
+    """Columns of a binary rankings file, copied out of a short-lived mmap.
+
+    Each column is one bulk array copy and strings are decoded on demand, so
+    opening the table allocates nothing per player.
+    """
+
+    def __init__(self, path: str):
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            magic, version, _, self.count, n_strings = HEADER.unpack_from(mapped)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} rankings file")
+
+            pos = HEADER.size
+            self.offsets = self._column(mapped, pos, "I", n_strings + 1)
+            pos += _padded(4 * (n_strings + 1))
+
+            self.blob = mapped[pos : pos + self.offsets[-1]]
+            pos += _padded(self.offsets[-1])
+
+            self.columns: Dict[str, array] = {}
+            for field, fmt, _ in COLUMNS:
+                self.columns[field] = self._column(mapped, pos, fmt, self.count)
+                pos += _padded(struct.calcsize(fmt) * self.count)
+        self._string_columns: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _column(mapped: mmap.mmap, offset: int, fmt: str, count: int) -> array:
+        values = array(fmt)
+        values.frombytes(mapped[offset : offset + struct.calcsize(fmt) * count])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    def __len__(self) -> int:
+        return self.count
+
+    def string(self, string_id: int) -> str:
+        return self.blob[self.offsets[string_id] : self.offsets[string_id + 1]].decode()
+
+    def value(self, field: str, row: int):
+        """Get one field of one row, resolving interned strings."""
+        value = self.columns[field][row]
+        if field in STRING_FIELDS:
+            return self.string(value)
+        return value
+
+    def column(self, field: str) -> Sequence:
+        """Get one field for every row; string columns are decoded once."""
+        if field not in STRING_FIELDS:
+            return self.columns[field]
+        if field not in self._string_columns:
+            self._string_columns[field] = [
+                self.string(string_id) for string_id in self.columns[field]
+            ]
+        return self._string_columns[field]
+
+    def row(self, row: int) -> dict:
+        """Get one row as a dict with the same keys as adp_rankings.json."""
+        return {field: self.value(field, row) for field, _, _ in COLUMNS}
+
+    def rows(self) -> Iterator[dict]:
+        """Iterate rows as dicts with the same keys as adp_rankings.json."""
+        for row in range(self.count):
+            yield self.row(row)
+
+
+def build_rankings_binary(rankings_file: str = "adp_rankings.json") -> str:
+    """Build the binary artifact from an existing rankings JSON file."""
+    with open(rankings_file, "r") as f:
+        rankings = json.load(f)
+
+    path = binary_path(rankings_file)
+    write_rankings_binary(rankings, path)
+    return path
+
+
+if __name__ == "__main__":
+    path = build_rankings_binary()
+    table = RankingsTable(path)
+    print(f"Wrote {len(table)} players to {path} ({os.path.getsize(path):,} bytes)")
@@ -1,9 +1,20 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import httpx
 import requests
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from player_store import PlayerStore
+
 
 class LeagueStatus(str, Enum):
     PRE_DRAFT = "pre_draft"
@@ -167,6 +178,7 @@ class DraftSettings(BaseModel):
     slots_bn: Optional[int] = None
     rounds: int
     pick_timer: Optional[int] = None
+    reversal_round: Optional[int] = None
 
 
 class DraftMetadata(BaseModel):
@@ -260,18 +272,135 @@ class TrendingPlayer(BaseModel):
     count: int
 
 
+DEFAULT_CACHE_DIR = ".sleeper_cache"
+
+# Freshness rules for cached responses in seconds, first match wins.
+# Endpoints with a TTL of 0 (or no match) always go to the network.
+CACHE_TTLS: List[Tuple[str, int]] = [
+    (r"^/players/[^/]+/trending/", 10 * 60),
+    (r"^/players/[^/]+$", 24 * 60 * 60),
+    (r"^/state/", 60 * 60),
+    (r"^/user/", 60 * 60),
+    (r"^/league/[^/]+/(users|drafts)$", 5 * 60),
+    (r"^/league/[^/]+$", 5 * 60),
+    (r"^/league/", 60),
+    (r"^/draft/[^/]+/traded_picks$", 5),
+    (r"^/draft/[^/]+/picks$", 0),
+    (r"^/draft/[^/]+$", 0),
+]
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """On-disk cache of raw Sleeper API responses with per-endpoint TTLs."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttls: Optional[List[Tuple[str, int]]] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls or CACHE_TTLS]
+        self.hits = 0
+        self.misses = 0
+        # Entries already read from disk, so large payloads are decoded once
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Get the freshness window for an endpoint in seconds."""
+        for pattern, ttl in self.ttls:
+            if pattern.search(endpoint):
+                return ttl
+        return 0
+
+    def _path(self, endpoint: str) -> str:
+        key = hashlib.sha1(endpoint.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load(self, endpoint: str) -> Optional[Tuple[float, Any]]:
+        if endpoint in self._memory:
+            return self._memory[endpoint]
+        try:
+            with open(self._path(endpoint), "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        cached = (entry["fetched_at"], entry["data"])
+        self._memory[endpoint] = cached
+        return cached
+
+    def get(self, endpoint: str) -> Any:
+        """Return the cached response, or _MISSING if absent or stale."""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return _MISSING
+
+        cached = self._load(endpoint)
+        if cached is not None and time.time() - cached[0] < ttl:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        return _MISSING
+
+    def set(self, endpoint: str, data: Any):
+        """Store a response if the endpoint is cacheable."""
+        if self.ttl_for(endpoint) <= 0:
+            return
+
+        fetched_at = time.time()
+        self._memory[endpoint] = (fetched_at, data)
+
+        # Write to a temp file first so concurrent readers never see a partial file
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(endpoint)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"endpoint": endpoint, "fetched_at": fetched_at, "data": data}, f)
+        os.replace(tmp_path, path)
+
+    def invalidate(self, endpoint: str):
+        """Drop a single endpoint from the cache."""
+        self._memory.pop(endpoint, None)
+        try:
+            os.remove(self._path(endpoint))
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters for this cache."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
 class SleeperAPI:
     BASE_URL = "https://api.sleeper.app/v1"
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None, use_cache: bool = True):
         self.session = requests.Session()
+        self.cache = (cache or ResponseCache()) if use_cache else None
 
     def _get(self, endpoint: str) -> Any:
-        """Make a GET request to the Sleeper API."""
+        """Make a GET request to the Sleeper API, served from cache when fresh."""
+        if self.cache:
+            data = self.cache.get(endpoint)
+            if data is not _MISSING:
+                return data
+
         url = f"{self.BASE_URL}{endpoint}"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        if self.cache:
+            self.cache.set(endpoint, data)
+        return data
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get response cache hit/miss counters."""
+        if not self.cache:
+            return {"hits": 0, "misses": 0}
+        return self.cache.stats()
 
     # User endpoints
     def get_user(self, username_or_id: str) -> User:
@@ -359,9 +488,169 @@ class SleeperAPI:
             player_id: Player(**player_data) for player_id, player_data in data.items()
         }
 
+    def get_player_store(self, sport: str = "nfl") -> "PlayerStore":
+        """Get all players as a compact store, validating full models lazily."""
+        from player_store import PlayerStore
+
+        return PlayerStore.from_dict(self._get(f"/players/{sport}"))
+
     def get_trending_players(
         self, sport: str = "nfl", type: str = "add"
     ) -> List[TrendingPlayer]:
         """Get trending players based on add/drop activity."""
         data = self._get(f"/players/{sport}/trending/{type}")
         return [TrendingPlayer(**player) for player in data]
+
+
+class AsyncSleeperAPI:
+    """Asyncio-native Sleeper client sharing one pooled keep-alive connection."""
+
+    BASE_URL = SleeperAPI.BASE_URL
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        max_connections: int = 10,
+    ):
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(30.0),
+        )
+        self.cache = (cache or ResponseCache()) if use_cache else None
+
+    async def __aenter__(self) -> "AsyncSleeperAPI":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def _get(self, endpoint: str) -> Any:
+        """Make a GET request to the Sleeper API, served from cache when fresh."""
+        # Cache files can be megabytes (/players), so read and write them off
+        # the event loop to keep concurrent fetches overlapping
+        if self.cache:
+            data = await asyncio.to_thread(self.cache.get, endpoint)
+            if data is not _MISSING:
+                return data
+
+        response = await self.client.get(endpoint)
+        response.raise_for_status()
+        data = response.json()
+
+        if self.cache:
+            await asyncio.to_thread(self.cache.set, endpoint, data)
+        return data
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get response cache hit/miss counters."""
+        if not self.cache:
+            return {"hits": 0, "misses": 0}
+        return self.cache.stats()
+
+    # User endpoints
+    async def get_user(self, username_or_id: str) -> User:
+        """Get user by username or user_id."""
+        data = await self._get(f"/user/{username_or_id}")
+        return User(**data)
+
+    # League endpoints
+    async def get_user_leagues(
+        self, user_id: str, sport: str = "nfl", season: str = "2024"
+    ) -> List[League]:
+        """Get all leagues for a user."""
+        data = await self._get(f"/user/{user_id}/leagues/{sport}/{season}")
+        return [League(**league) for league in data]
+
+    async def get_league(self, league_id: str) -> League:
+        """Get a specific league."""
+        data = await self._get(f"/league/{league_id}")
+        return League(**data)
+
+    async def get_league_rosters(self, league_id: str) -> List[Roster]:
+        """Get all rosters in a league."""
+        data = await self._get(f"/league/{league_id}/rosters")
+        return [Roster(**roster) for roster in data]
+
+    async def get_league_users(self, league_id: str) -> List[LeagueUser]:
+        """Get all users in a league."""
+        data = await self._get(f"/league/{league_id}/users")
+        return [LeagueUser(**user) for user in data]
+
+    async def get_league_matchups(self, league_id: str, week: int) -> List[Matchup]:
+        """Get matchups for a specific week."""
+        data = await self._get(f"/league/{league_id}/matchups/{week}")
+        return [Matchup(**matchup) for matchup in data]
+
+    async def get_transactions(self, league_id: str, week: int) -> List[Transaction]:
+        """Get transactions for a specific week."""
+        data = await self._get(f"/league/{league_id}/transactions/{week}")
+        return [Transaction(**transaction) for transaction in data]
+
+    async def get_traded_picks(self, league_id: str) -> List[DraftPick]:
+        """Get all traded picks in a league."""
+        data = await self._get(f"/league/{league_id}/traded_picks")
+        return [DraftPick(**pick) for pick in data]
+
+    # State endpoints
+    async def get_nfl_state(self) -> NFLState:
+        """Get current NFL state."""
+        data = await self._get("/state/nfl")
+        return NFLState(**data)
+
+    # Draft endpoints
+    async def get_user_drafts(
+        self, user_id: str, sport: str = "nfl", season: str = "2024"
+    ) -> List[Draft]:
+        """Get all drafts for a user."""
+        data = await self._get(f"/user/{user_id}/drafts/{sport}/{season}")
+        return [Draft(**draft) for draft in data]
+
+    async def get_league_drafts(self, league_id: str) -> List[Draft]:
+        """Get all drafts for a league."""
+        data = await self._get(f"/league/{league_id}/drafts")
+        return [Draft(**draft) for draft in data]
+
+    async def get_draft(self, draft_id: str) -> Draft:
+        """Get a specific draft."""
+        data = await self._get(f"/draft/{draft_id}")
+        return Draft(**data)
+
+    async def get_draft_picks(self, draft_id: str) -> List[DraftPickData]:
+        """Get all picks in a draft."""
+        data = await self._get(f"/draft/{draft_id}/picks")
+        return [DraftPickData(**pick) for pick in data]
+
+    async def get_draft_traded_picks(self, draft_id: str) -> List[DraftPick]:
+        """Get traded picks in a draft."""
+        data = await self._get(f"/draft/{draft_id}/traded_picks")
+        return [DraftPick(**pick) for pick in data]
+
+    # Player endpoints
+    async def get_all_players(self, sport: str = "nfl") -> Dict[str, Player]:
+        """Get all players. Use sparingly - this is a large response (~5MB)."""
+        data = await self._get(f"/players/{sport}")
+        return {
+            player_id: Player(**player_data) for player_id, player_data in data.items()
+        }
+
+    async def get_player_store(self, sport: str = "nfl") -> "PlayerStore":
+        """Get all players as a compact store, validating full models lazily."""
+        from player_store import PlayerStore
+
+        return PlayerStore.from_dict(await self._get(f"/players/{sport}"))
+
+    async def get_trending_players(
+        self, sport: str = "nfl", type: str = "add"
+    ) -> List[TrendingPlayer]:
+        """Get trending players based on add/drop activity."""
+        data = await self._get(f"/players/{sport}/trending/{type}")
+        return [TrendingPlayer(**player) for player in data]
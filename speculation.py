@@ -0,0 +1,243 @@
+"""Speculatively run the recommendation pipeline while opponents are picking."""
+
+import asyncio
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Set, TextIO, Tuple, cast
+
+from best_available import BestAvailable, RankedPlayer, get_best_available
+from draft_state import DraftState
+from sleeper_api import DraftPickData, PlayerMetadata
+
+RecommendFn = Callable[[DraftState], Awaitable[Tuple[dict, List[dict]]]]
+FastPickFn = Callable[[DraftState], Optional[str]]
+
+# Set inside speculative runs, whose output would interleave with the live board
+_quiet: ContextVar[bool] = ContextVar("speculation_quiet", default=False)
+
+
+class QuietStdout:
+    """Stdout wrapper that drops writes made from inside a speculative run.
+
+    Tasks and threads copy the context they start in, so everything a
+    speculative run prints is dropped while other tasks print as usual.
+    """
+
+    def __init__(self, stream: Any):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        if _quiet.get():
+            return len(text)
+        return self.stream.write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+def _retrieve_exception(task: asyncio.Task):
+    # Superseded speculations are never awaited, so read their errors here
+    if not task.cancelled():
+        task.exception()
+
+
+@dataclass
+class Speculation:
+    target_pick_no: int
+    predicted_taken: Set[str]
+    candidate_ids: Set[str]
+    task: asyncio.Task
+    started_at: float
+
+
+def predicted_pick(
+    player: RankedPlayer, draft_id: str, pick_no: int, teams: int
+) -> DraftPickData:
+    """Build a synthetic pick for a player expected to go before my turn."""
+    first_name, _, last_name = player.name.partition(" ")
+    return DraftPickData(
+        player_id=player.sleeper_id,
+        round=(pick_no - 1) // teams + 1,
+        draft_slot=(pick_no - 1) % teams + 1,
+        pick_no=pick_no,
+        draft_id=draft_id,
+        metadata=PlayerMetadata(
+            first_name=first_name,
+            last_name=last_name,
+            position=player.position,
+            team=player.team,
+        ),
+    )
+
+
+class Speculator:
+    """Pre-computes my next recommendation on the most likely board.
+
+    Opponents are assumed to draft straight down ADP. When my turn arrives the
+    speculative result is reused if its pick is still on the board and no
+    player the real prompt would show was missing from the speculative one.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        recommend: RecommendFn,
+        rankings: Optional[BestAvailable] = None,
+        limit: int = 10,
+        safety_margin: float = 10.0,
+        fast_pick: Optional[FastPickFn] = None,
+    ):
+        self.user_id = user_id
+        self.recommend_fn = recommend
+        # Announces the instant pick for a board the speculative run never saw
+        self.fast_pick_fn = fast_pick
+        self.rankings = rankings or get_best_available()
+        self.limit = limit
+        self.safety_margin = safety_margin
+        self.current: Optional[Speculation] = None
+
+    def _candidate_ids(self, state: DraftState) -> Set[str]:
+        best_by_position = state.best_available_by_position(
+            self.rankings, limit=self.limit
+        )
+        return {p.sleeper_id for players in best_by_position.values() for p in players}
+
+    def predict_state(self, state: DraftState) -> Optional[DraftState]:
+        """Project the board at my next pick assuming opponents follow ADP."""
+        target = state.next_pick_for_user(self.user_id)
+        if not target or not state.draft:
+            return None
+
+        teams = state.draft.settings.teams
+        predicted = state.copy()
+        predicted.speculative = True
+        index = predicted.index_for(self.rankings)
+
+        # The real clock for the target pick hasn't started yet
+        predicted.draft = state.draft.model_copy(
+            update={"last_picked": None, "start_time": None}
+        )
+
+        # Each projected pick is ingested, so the overall top moves down the board
+        for pick_no in range(state.next_pick_no, target):
+            top = index.top(k=1)
+            if not top:
+                break
+            predicted.add_pick(predicted_pick(top[0], state.draft_id, pick_no, teams))
+
+        return predicted
+
+    def _consensus_player(self, spec: Speculation) -> Optional[RankedPlayer]:
+        if not spec.task.done() or spec.task.cancelled() or spec.task.exception():
+            return None
+        analysis, _ = spec.task.result()
+        if not analysis["consensus_pick"]:
+            return None
+        return self.rankings.find_by_name(analysis["consensus_pick"])
+
+    async def _run_quietly(self, state: DraftState) -> Tuple[dict, List[dict]]:
+        _quiet.set(state.speculative)
+        return await self.recommend_fn(state)
+
+    def update(self, state: DraftState):
+        """Launch or refresh the speculation after opponents make picks."""
+        target = state.next_pick_for_user(self.user_id)
+        if not target or target == state.next_pick_no:
+            return
+
+        spec = self.current
+        if spec and spec.target_pick_no == target:
+            player = self._consensus_player(spec)
+            if player is None or player.sleeper_id not in state.taken_ids:
+                return
+            print(f"🔮 Speculative pick {player.name} was taken, re-speculating")
+
+        if spec:
+            spec.task.cancel()
+
+        predicted = self.predict_state(state)
+        if predicted is None:
+            return
+
+        print(
+            f"🔮 Speculating on pick {target} "
+            f"({target - state.next_pick_no} picks away)"
+        )
+        if not isinstance(sys.stdout, QuietStdout):
+            # A proxy rather than a TextIO subclass, so every other attribute
+            # still reaches the real stream
+            sys.stdout = cast(TextIO, QuietStdout(sys.stdout))
+        task = asyncio.create_task(self._run_quietly(predicted))
+        task.add_done_callback(_retrieve_exception)
+        self.current = Speculation(
+            target_pick_no=target,
+            predicted_taken=set(predicted.taken_ids),
+            candidate_ids=self._candidate_ids(predicted),
+            task=task,
+            started_at=time.time(),
+        )
+
+    async def take(self, state: DraftState) -> Optional[Tuple[dict, List[dict]]]:
+        """Return the speculative result for the current pick if still valid."""
+        spec = self.current
+        self.current = None
+        if not spec:
+            return None
+
+        if spec.target_pick_no != state.next_pick_no:
+            spec.task.cancel()
+            return None
+
+        # Players the real prompt would show that the model never considered
+        fallers = self._candidate_ids(state) - spec.candidate_ids
+        if fallers:
+            print(f"🔮 Board diverged ({len(fallers)} unexpected fallers), rerunning")
+            spec.task.cancel()
+            return None
+
+        if spec.predicted_taken == state.taken_ids:
+            print("🔮 Board matches speculation exactly")
+
+        # The speculative run skipped the fast pick, so show one for the real
+        # board before waiting on it
+        fast_pick = self.fast_pick_fn(state) if self.fast_pick_fn else None
+
+        seconds_left = state.seconds_left()
+        timeout = None
+        if seconds_left is not None:
+            timeout = max(0.0, seconds_left - self.safety_margin)
+
+        try:
+            result = await asyncio.wait_for(spec.task, timeout)
+        except asyncio.TimeoutError:
+            print("🔮 Speculative run did not finish before the pick timer")
+            return None
+        except Exception as e:
+            print(f"🔮 Speculative run failed: {e}")
+            return None
+
+        player = self._consensus_player(spec)
+        if player is None:
+            print("🔮 Could not verify the speculative pick, rerunning")
+            return None
+        if player.sleeper_id in state.taken_ids:
+            print(f"🔮 Speculative pick {player.name} is gone, rerunning")
+            return None
+
+        print(
+            f"🔮 Reusing speculative recommendation "
+            f"(started {time.time() - spec.started_at:.0f}s ago)"
+        )
+        if fast_pick:
+            analysis, results = result
+            return {**analysis, "fast_pick": fast_pick}, results
+        return result
+
+    async def recommend(self, state: DraftState) -> Tuple[dict, List[dict]]:
+        """Recommend for the current pick, reusing speculation when possible."""
+        result = await self.take(state)
+        if result is not None:
+            return result
+        return await self.recommend_fn(state)
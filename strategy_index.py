@@ -0,0 +1,276 @@
+"""Round-aware retrieval over the strategy markdown.
+
+Strategy guides are split into heading sections once and indexed with BM25.
+Each pick then sends the core philosophy, the sections for the current round
+and the few sections that best match my roster needs and the scarce positions,
+instead of the whole document.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from best_available import BestAvailable, get_best_available
+from draft_common import estimate_tokens, starter_needs
+from draft_state import DraftState
+
+# Sections whose heading (or a parent heading) matches are always sent
+CORE_HEADING = re.compile(
+    r"core|philosophy|critical|tl;dr|golden rule|winning formula|checklist", re.I
+)
+# "Rounds 3-5", "Round 1", "R11–15"
+ROUND_RANGE = re.compile(r"\bR(?:ounds?\s*)?(\d+)(?:\s*[-–]\s*R?(\d+))?", re.I)
+HEADING = re.compile(r"^(#{1,6})\s+(.*)")
+# "1) Core philosophy" style headings, and "- Rounds 1–2" style bullets
+NUMBERED_HEADING = re.compile(r"^\d+\)\s+\S")
+ROUND_BULLET = re.compile(r"^[-*]\s+(\**R(?:ounds?\s*)?\d+.*)", re.I)
+WORD = re.compile(r"[a-z0-9]+")
+
+POSITION_TERMS = {
+    "QB": "qb quarterback",
+    "RB": "rb running back",
+    "WR": "wr wide receiver",
+    "TE": "te tight end",
+}
+PHASE_TERMS = [
+    (3, "early foundation stud anchor elite"),
+    (9, "core starter depth flex value tier"),
+    (99, "late upside lottery handcuff insurance bye"),
+]
+# Extra sections retrieved by keyword on top of the core and round sections
+TOP_SECTIONS = 4
+# A position is scarce when this few of its players are in the next two rounds
+SCARCE_PLAYERS = 2
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return WORD.findall(text.lower())
+
+
+@dataclass
+class Section:
+    title: str
+    level: int
+    text: str
+    parent: Optional[int]
+    core: bool = False
+    rounds: Optional[Tuple[int, int]] = None
+    terms: Counter = field(default_factory=Counter)
+
+    def covers(self, round_num: int) -> bool:
+        return self.rounds is not None and self.rounds[0] <= round_num <= self.rounds[1]
+
+
+def _is_label(lines: List[str], i: int) -> bool:
+    """Plain-text labels like "Round 4" that head a bullet list act as headings."""
+    line = lines[i].strip()
+    return (
+        0 < len(line) <= 40
+        and line[0] not in "-*#|>"
+        and line[-1] not in ":.!?"
+        and (i == 0 or not lines[i - 1].strip())
+        and i + 1 < len(lines)
+        and lines[i + 1].lstrip().startswith("- ")
+    )
+
+
+def split_sections(markdown: str) -> List[Section]:
+    """Split a strategy document into heading sections, in document order.
+
+    Besides markdown headings, "N) Title" lines after a blank line and short
+    labels count as headings, and each "- Rounds 3-5" bullet with its
+    indented sub-bullets becomes a section of its own.
+    """
+    lines = markdown.splitlines()
+    sections: List[Section] = []
+    texts: List[List[str]] = []
+    # Open section index per heading level
+    stack: List[Tuple[int, int]] = []
+    markdown_level = 0
+    heading_level = 0
+    # Section that plain lines go to; a round bullet's text ends at the
+    # first unindented line, which goes back to the enclosing section
+    target: Optional[int] = None
+    in_round_bullet = False
+
+    def open_section(level: int, title: str, line: str) -> int:
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        parent = stack[-1][1] if stack else None
+        sections.append(Section(title, level, "", parent))
+        texts.append([line])
+        stack.append((level, len(sections) - 1))
+        return len(sections) - 1
+
+    for i, line in enumerate(lines):
+        match = HEADING.match(line)
+        bullet = ROUND_BULLET.match(line)
+        if match:
+            markdown_level = heading_level = len(match.group(1))
+            target = open_section(heading_level, match.group(2).strip(), line)
+            in_round_bullet = False
+        elif NUMBERED_HEADING.match(line) and (i == 0 or not lines[i - 1].strip()):
+            heading_level = markdown_level + 1
+            target = open_section(heading_level, line.strip(), line)
+            in_round_bullet = False
+        elif bullet and target is not None:
+            # Nested under the section it sits in, which keeps any later text
+            open_section(sections[target].level + 1, bullet.group(1).strip("* "), line)
+            in_round_bullet = True
+        elif _is_label(lines, i):
+            # Labels sit one level below the last heading
+            target = open_section(heading_level + 1, line.strip(), line)
+            in_round_bullet = False
+        else:
+            if in_round_bullet and line.strip() and not line[0].isspace():
+                in_round_bullet = False
+            if target is None:
+                sections.append(Section("", 0, "", None))
+                texts.append([])
+                target = 0
+            texts[-1 if in_round_bullet else target].append(line)
+
+    for section, text in zip(sections, texts):
+        section.text = "\n".join(text).strip("\n")
+
+    for i, section in enumerate(sections):
+        match = ROUND_RANGE.search(section.title)
+        if match:
+            start = int(match.group(1))
+            section.rounds = (start, int(match.group(2) or start))
+        # The title and intro are core; round sections never are, whatever
+        # their heading says, and core parents below the title pass it down
+        parent = section.parent
+        section.core = section.rounds is None and (
+            i == 0
+            or bool(CORE_HEADING.search(section.title))
+            or (parent is not None and parent != 0 and sections[parent].core)
+        )
+        section.terms = Counter(tokenize(section.text))
+    return sections
+
+
+class StrategyIndex:
+    """Sections of one strategy document with BM25 statistics."""
+
+    def __init__(self, markdown: str):
+        self.sections = split_sections(markdown)
+        self.avg_length = sum(sum(s.terms.values()) for s in self.sections) / max(
+            1, len(self.sections)
+        )
+        document_frequency: Counter = Counter()
+        for section in self.sections:
+            document_frequency.update(section.terms.keys())
+        n = len(self.sections)
+        self.idf: Dict[str, float] = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def score(self, section: Section, query: List[str]) -> float:
+        length = sum(section.terms.values())
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / max(1.0, self.avg_length))
+        total = 0.0
+        for term in query:
+            tf = section.terms.get(term, 0)
+            if tf:
+                total += self.idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+        return total
+
+    def select(
+        self, round_num: int, query: List[str], k: int = TOP_SECTIONS
+    ) -> Set[int]:
+        """Core sections, the current round's sections and the top-k matches."""
+        chosen = {
+            i for i, s in enumerate(self.sections) if s.core or s.covers(round_num)
+        }
+        # Sections for other rounds never qualify on keywords alone
+        candidates = [
+            i
+            for i, s in enumerate(self.sections)
+            if i not in chosen and s.rounds is None
+        ]
+        scored = sorted(
+            ((self.score(self.sections[i], query), i) for i in candidates), reverse=True
+        )
+        chosen.update(i for score, i in scored[:k] if score > 0)
+        return chosen
+
+    def render_sections(self, chosen: Set[int]) -> List[str]:
+        """Texts of the chosen sections and their parents, in document order."""
+        keep = set()
+        for i in chosen:
+            section: Optional[int] = i
+            while section is not None and section not in keep:
+                keep.add(section)
+                section = self.sections[section].parent
+        return [self.sections[i].text for i in sorted(keep) if self.sections[i].text]
+
+    def render(self, chosen: Set[int]) -> str:
+        """Rebuild the document from the chosen sections and their parents."""
+        return "\n\n".join(self.render_sections(chosen))
+
+
+@lru_cache(maxsize=32)
+def build_strategy_index(markdown: str) -> StrategyIndex:
+    """Parse and index a strategy document once per distinct text."""
+    return StrategyIndex(markdown)
+
+
+def scarce_positions(
+    draft_state: DraftState, rankings: Optional[BestAvailable] = None
+) -> List[str]:
+    """Positions with only a few players left among the next two rounds' worth."""
+    teams = draft_state.draft.settings.teams if draft_state.draft else 12
+    index = draft_state.index_for(rankings or get_best_available())
+    window = Counter(p.position for p in index.top(None, k=2 * teams))
+    return [pos for pos in POSITION_TERMS if window[pos] <= SCARCE_PLAYERS]
+
+
+def pick_query(round_num: int, needs: Dict[str, int], scarce: List[str]) -> List[str]:
+    """Keywords for this pick: the draft phase, open starting slots, scarcity."""
+    words = next(terms for last_round, terms in PHASE_TERMS if round_num <= last_round)
+    for pos, unfilled in needs.items():
+        if unfilled and pos in POSITION_TERMS:
+            words += " " + POSITION_TERMS[pos]
+    for pos in scarce:
+        words += f" {POSITION_TERMS[pos]} run scarcity tier"
+    return tokenize(words)
+
+
+def focus_sections(
+    strategy: str,
+    draft_state: DraftState,
+    player_slot: str,
+    rankings: Optional[BestAvailable] = None,
+) -> List[str]:
+    """The strategy sections that matter for this pick, in document order."""
+    index = build_strategy_index(strategy)
+    round_num = len(draft_state.team_picks(player_slot)) + 1
+    query = pick_query(
+        round_num,
+        starter_needs(draft_state, player_slot),
+        scarce_positions(draft_state, rankings),
+    )
+    sections = index.render_sections(index.select(round_num, query))
+    focused_tokens = sum(estimate_tokens(section) for section in sections)
+    print(
+        f"📚 Strategy focused on round {round_num}: "
+        f"~{focused_tokens:,} of ~{estimate_tokens(strategy):,} tokens"
+    )
+    return sections
+
+
+def focus_strategy(
+    strategy: str,
+    draft_state: DraftState,
+    player_slot: str,
+    rankings: Optional[BestAvailable] = None,
+) -> str:
+    """Trim a strategy document to the sections that matter for this pick."""
+    return "\n\n".join(focus_sections(strategy, draft_state, player_slot, rankings))
@@ -0,0 +1,61 @@
+"""Tests for the availability forecast around traded picks."""
+
+import json
+
+import pytest
+
+from availability import forecast_availability, picks_before_next
+from best_available import BestAvailable
+from test_draft_state import ROUND_2_TRADE, make_state
+
+
+@pytest.fixture
+def rankings(tmp_path):
+    """Twelve players whose sleeper ids match the pick numbers that take them."""
+    path = tmp_path / "adp_rankings.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "sleeper_id": str(rank),
+                    "name": f"Player {rank}",
+                    "position": "RB" if rank % 2 else "WR",
+                    "team": "FA",
+                    "rank": rank,
+                    "avg_rank": float(rank),
+                    "position_rank": (rank + 1) // 2,
+                }
+                for rank in range(1, 13)
+            ]
+        )
+    )
+    return BestAvailable(str(path))
+
+
+def test_picks_before_next_without_trades():
+    # Pick #7 is on the clock; snake order gives slot 1 #8 and slot 3 #11
+    state = make_state(picks_made=6)
+    assert picks_before_next(state, "user_1") == (8, 1)
+    assert picks_before_next(state, "user_3") == (11, 4)
+
+
+def test_picks_before_next_with_a_traded_pick():
+    # Roster 13 (user_3) now owns #8, so user_1 waits until #9
+    state = make_state(traded_picks=ROUND_2_TRADE, picks_made=6)
+    assert picks_before_next(state, "user_1") == (9, 2)
+    assert picks_before_next(state, "user_3") == (8, 1)
+
+
+def test_forecast_uses_the_traded_pick(rankings):
+    state = make_state(traded_picks=ROUND_2_TRADE, picks_made=6)
+    for user_id, next_pick, picks_before in (("user_3", 8, 1), ("user_1", 9, 2)):
+        forecast = forecast_availability(
+            state, user_id, simulations=200, rankings=rankings
+        )
+        assert forecast.next_pick_no == next_pick
+        assert forecast.picks_before == picks_before
+        # Players 1-6 are gone, and each continuation takes exactly the
+        # opponents' picks out of the sampled pool
+        assert "1" not in forecast.survival
+        taken = sum(1 - chance for chance in forecast.survival.values())
+        assert taken == pytest.approx(picks_before)
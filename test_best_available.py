@@ -0,0 +1,81 @@
+"""Tests for the incremental best-available index."""
+
+from best_available import BestAvailableIndex, RankedPlayer
+
+
+def player(sleeper_id: str, position: str, rank: int) -> RankedPlayer:
+    return RankedPlayer(
+        sleeper_id=sleeper_id,
+        name=f"Player {sleeper_id}",
+        position=position,
+        team="FA",
+        rank=rank,
+        avg_rank=float(rank),
+        position_rank=rank,
+    )
+
+
+# Deliberately out of rank order
+PLAYERS = [
+    player("rb2", "RB", 4),
+    player("wr1", "WR", 2),
+    player("rb1", "RB", 1),
+    player("qb1", "QB", 3),
+    player("wr2", "WR", 5),
+    player("rb3", "RB", 6),
+]
+
+
+def ids(players):
+    return [p.sleeper_id for p in players]
+
+
+def test_top_is_rank_ordered_overall_and_by_position():
+    index = BestAvailableIndex(PLAYERS)
+    assert ids(index.top(k=3)) == ["rb1", "wr1", "qb1"]
+    assert ids(index.top("RB", k=5)) == ["rb1", "rb2", "rb3"]
+    assert index.top("TE") == []
+
+
+def test_taken_players_are_skipped():
+    index = BestAvailableIndex(PLAYERS)
+    index.ingest(["rb1", "rb2"])
+    assert ids(index.top("RB", k=2)) == ["rb3"]
+    assert ids(index.top(k=2)) == ["wr1", "qb1"]
+    assert not index.is_available("rb1")
+    assert index.is_available("wr1")
+
+
+def test_taking_a_player_inside_the_remaining_board():
+    index = BestAvailableIndex(PLAYERS)
+    assert ids(index.top("RB", k=1)) == ["rb1"]
+    # Taken behind the cursor's leading run, so it has to be skipped in place
+    index.take("rb2")
+    assert ids(index.top("RB", k=2)) == ["rb1", "rb3"]
+
+
+def test_unranked_players_are_ignored():
+    index = BestAvailableIndex(PLAYERS)
+    assert not index.take("nobody")
+    assert not index.is_available("nobody")
+    assert ids(index.top(k=1)) == ["rb1"]
+
+
+def test_copy_has_its_own_taken_board():
+    index = BestAvailableIndex(PLAYERS)
+    index.take("rb1")
+    clone = index.copy()
+    clone.take("wr1")
+    assert ids(index.top(k=1)) == ["wr1"]
+    assert ids(clone.top(k=1)) == ["qb1"]
+
+
+def test_best_available_by_position_limits_each_position():
+    index = BestAvailableIndex(PLAYERS)
+    index.take("wr1")
+    best = index.best_available_by_position(limit=2)
+    assert {pos: ids(players) for pos, players in best.items()} == {
+        "RB": ["rb1", "rb2"],
+        "QB": ["qb1"],
+        "WR": ["wr2"],
+    }
@@ -0,0 +1,56 @@
+"""Tests for continuing inference lanes with a delta prompt."""
+
+from conversation import DraftConversation, Lane
+from test_draft_state import make_state
+
+WAIT_SIGNALS = "\n\n## CAN I WAIT? (next pick #8, 3 picks away)\n"
+
+
+def lane(**fields) -> Lane:
+    return Lane(
+        response_id="resp_1",
+        last_pick_no=0,
+        taken_ids=set(),
+        shown_ids=set(),
+        **fields,
+    )
+
+
+def test_delta_adds_unseen_strategy_sections_and_wait_signals():
+    conversation = DraftConversation("user_1", "standard")
+    message = conversation.delta_message(
+        lane(strategy_sections={"## Core\nWin the week."}),
+        make_state(picks_made=3),
+        {},
+        ["## Core\nWin the week.", "### Rounds 3-5\n- Take WRs."],
+        WAIT_SIGNALS,
+    )
+    assert "### Rounds 3-5\n- Take WRs." in message
+    assert "Win the week." not in message
+    assert WAIT_SIGNALS in message
+
+
+def test_delta_without_focus_or_forecast_adds_neither():
+    conversation = DraftConversation("user_1", "standard")
+    message = conversation.delta_message(lane(), make_state(picks_made=3), {})
+    assert "STRATEGY" not in message
+    assert "CAN I WAIT" not in message
+
+
+def test_record_accumulates_sections_sent_to_a_lane():
+    conversation = DraftConversation("user_1", "standard")
+    state = make_state(picks_made=3)
+    conversation.lanes[1] = lane(strategy_sections={"core"})
+    result = {
+        "inference_id": 1,
+        "success": True,
+        "response_id": "resp_2",
+        "continued": True,
+    }
+    conversation.record([result], state, {}, {1: ["core", "rounds 3-5"]})
+    assert conversation.lanes[1].strategy_sections == {"core", "rounds 3-5"}
+    assert conversation.lanes[1].turns == 2
+
+    # A fresh conversation only knows what its own prompt held
+    conversation.record([{**result, "continued": False}], state, {}, {1: ["core"]})
+    assert conversation.lanes[1].strategy_sections == {"core"}
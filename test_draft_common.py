@@ -0,0 +1,58 @@
+"""Tests for early-stop consensus tracking."""
+
+import pytest
+
+from draft_common import ConsensusTracker, InferenceOptions, estimate_time_saved
+
+
+def tracker(total: int, *selections, **options) -> ConsensusTracker:
+    consensus = ConsensusTracker(total, InferenceOptions(early_stop=True, **options))
+    for inference_id, selection in enumerate(selections, 1):
+        consensus.record(inference_id, selection)
+    return consensus
+
+
+def test_nothing_recorded_is_not_locked():
+    assert not tracker(5).is_locked()
+
+
+def test_locked_once_remaining_votes_cannot_catch_up():
+    # 3-0 with 2 left: the runner-up can reach 2 at most
+    assert tracker(5, "A", "A", "A").is_locked()
+    # 2-0 with 3 left could still end 2-3
+    assert not tracker(5, "A", "A").is_locked()
+
+
+def test_a_possible_tie_is_not_locked():
+    # 3-1 with 1 left could end 3-2, still a lead; 2-1 with 2 left could end 2-3
+    assert tracker(5, "A", "B", "A", "A").is_locked()
+    assert not tracker(5, "A", "B", "A").is_locked()
+
+
+def test_failed_inferences_count_as_finished_without_a_vote():
+    # 2-0 with one failure leaves 2 to go, so B could still tie
+    assert not tracker(5, "A", None, "A").is_locked()
+    assert tracker(5, "A", None, "A", None).is_locked()
+
+
+def test_a_streamed_pick_replaced_by_the_final_parse():
+    consensus = tracker(3, "A", "A")
+    consensus.record(2, "B")
+    assert consensus.finished == 2
+    assert not consensus.is_locked()
+
+
+def test_min_confidence_needs_enough_votes():
+    assert not tracker(10, "A", "A", min_confidence=0.6).is_locked()
+    assert tracker(10, "A", "A", "B", "A", "A", min_confidence=0.6).is_locked()
+    assert not tracker(10, "A", "B", "C", "A", "B", min_confidence=0.6).is_locked()
+
+
+def test_time_saved_extrapolates_the_completion_gap():
+    # Finished 2s apart on average, so two more would have taken ~4s
+    assert estimate_time_saved([9.0, 5.0, 7.0], 2) == pytest.approx(4.0)
+
+
+def test_time_saved_needs_two_completions():
+    assert estimate_time_saved([5.0], 2) is None
+    assert estimate_time_saved([5.0, 7.0], 0) is None
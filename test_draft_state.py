@@ -0,0 +1,158 @@
+"""Tests for DraftState: pick ownership (snake order, trades) and the pick clock."""
+
+import time
+from typing import List, Optional
+
+import pytest
+
+from draft_state import DraftState, slot_for_pick
+from sleeper_api import (
+    Draft,
+    DraftPick,
+    DraftPickData,
+    DraftSettings,
+    DraftStatus,
+    DraftType,
+    SeasonType,
+)
+
+# Roster 11 (slot 1) traded its round 2 pick, overall #8, to roster 13 (slot 3)
+ROUND_2_TRADE = [
+    DraftPick(season="2025", round=2, roster_id=11, previous_owner_id=11, owner_id=13)
+]
+
+
+def make_state(
+    teams: int = 4,
+    rounds: int = 4,
+    draft_type: DraftType = DraftType.SNAKE,
+    reversal_round: Optional[int] = None,
+    traded_picks: Optional[List[DraftPick]] = None,
+    picks_made: int = 0,
+) -> DraftState:
+    """A draft where user_N sits in slot N and drafts for roster 10 + N."""
+    draft = Draft(
+        type=draft_type,
+        status=DraftStatus.DRAFTING,
+        sport="nfl",
+        settings=DraftSettings(
+            teams=teams, rounds=rounds, reversal_round=reversal_round
+        ),
+        season_type=SeasonType.REGULAR,
+        season="2025",
+        draft_id="d1",
+        draft_order={f"user_{slot}": slot for slot in range(1, teams + 1)},
+        slot_to_roster_id={str(slot): 10 + slot for slot in range(1, teams + 1)},
+    )
+    picks = [
+        DraftPickData(
+            player_id=str(pick_no),
+            round=(pick_no - 1) // teams + 1,
+            draft_slot=1,
+            pick_no=pick_no,
+            draft_id="d1",
+        )
+        for pick_no in range(1, picks_made + 1)
+    ]
+    return DraftState.from_picks(
+        "d1", picks, draft=draft, traded_picks=traded_picks or []
+    )
+
+
+def test_snake_order_flips_every_round():
+    slots = [slot_for_pick(pick_no, 4) for pick_no in range(1, 13)]
+    assert slots == [1, 2, 3, 4, 4, 3, 2, 1, 1, 2, 3, 4]
+
+
+def test_linear_order_never_flips():
+    slots = [slot_for_pick(pick_no, 3, DraftType.LINEAR) for pick_no in range(1, 7)]
+    assert slots == [1, 2, 3, 1, 2, 3]
+
+
+def test_third_round_reversal_repeats_round_two_order():
+    slots = [slot_for_pick(pick_no, 3, reversal_round=3) for pick_no in range(1, 13)]
+    assert slots == [1, 2, 3, 3, 2, 1, 3, 2, 1, 1, 2, 3]
+
+
+def test_roster_for_pick_maps_slots_to_rosters():
+    state = make_state()
+    assert [state.roster_for_pick(pick_no) for pick_no in (1, 4, 5, 8)] == [
+        11,
+        14,
+        14,
+        11,
+    ]
+
+
+def test_roster_for_pick_follows_traded_picks():
+    state = make_state(traded_picks=ROUND_2_TRADE)
+    assert state.roster_for_pick(8) == 13
+    # Other rounds stay with the original roster
+    assert state.roster_for_pick(1) == 11
+    assert state.roster_for_pick(9) == 11
+
+
+def test_next_pick_for_user_snake():
+    state = make_state(picks_made=1)
+    assert state.next_pick_for_user("user_1") == 8
+    assert state.next_pick_for_user("user_4") == 4
+    assert state.next_pick_for_user("user_4", after=4) == 5
+    assert state.next_pick_for_user("unknown") == 0
+
+
+def test_next_pick_for_user_with_reversal():
+    # With the reversal, slot 1 picks last in rounds 2 and 3: #8, then #12
+    state = make_state(reversal_round=3, picks_made=8)
+    assert state.next_pick_for_user("user_1") == 12
+    assert state.next_pick_for_user("user_4") == 9
+
+
+def test_next_pick_for_user_skips_traded_away_picks():
+    state = make_state(traded_picks=ROUND_2_TRADE, picks_made=1)
+    assert state.next_pick_for_user("user_1") == 9
+    assert state.next_pick_for_user("user_3") == 3
+    assert state.next_pick_for_user("user_3", after=3) == 6
+    assert state.next_pick_for_user("user_3", after=6) == 8
+
+
+def test_is_on_clock_follows_trades():
+    state = make_state(traded_picks=ROUND_2_TRADE, picks_made=7)
+    assert state.is_on_clock("user_3")
+    assert not state.is_on_clock("user_1")
+
+
+def test_no_picks_left_after_the_last_round():
+    state = make_state(picks_made=16)
+    assert state.next_pick_for_user("user_1") == 0
+    assert not state.is_on_clock("user_1")
+
+
+def timed_state(
+    status: DraftStatus = DraftStatus.DRAFTING, seconds_ago: float = 30
+) -> DraftState:
+    """One pick in, with a 90s pick timer that started some seconds ago."""
+    state = make_state(picks_made=1)
+    assert state.draft is not None
+    state.draft.status = status
+    state.draft.settings.pick_timer = 90
+    state.draft.last_picked = int((time.time() - seconds_ago) * 1000)
+    return state
+
+
+def test_pick_deadline_runs_from_the_last_pick():
+    state = timed_state()
+    assert state.pick_deadline() == pytest.approx(time.time() + 60, abs=1)
+    assert state.seconds_left() == pytest.approx(60, abs=1)
+
+
+def test_no_pick_deadline_unless_drafting():
+    assert timed_state(DraftStatus.PAUSED).pick_deadline() is None
+    assert timed_state(DraftStatus.COMPLETE).pick_deadline() is None
+    assert timed_state(DraftStatus.PRE_DRAFT).seconds_left() is None
+
+
+def test_stale_clock_has_no_pick_deadline():
+    # A resumed draft whose last pick was long before the timer's length
+    state = timed_state(seconds_ago=3600)
+    assert state.pick_deadline() is None
+    assert state.seconds_left() is None
@@ -0,0 +1,26 @@
+"""Tests for ADP name normalization."""
+
+from parse_adp import normalize_name
+
+
+def test_lowercases_and_collapses_whitespace():
+    assert normalize_name("  Ja'Marr   Chase ") == "ja'marr chase"
+
+
+def test_strips_generational_suffixes():
+    assert normalize_name("Kenneth Walker III") == "kenneth walker"
+    assert normalize_name("Marvin Harrison Jr.") == "marvin harrison"
+    assert normalize_name("Odell Beckham Jr") == "odell beckham"
+
+
+def test_strips_stacked_suffixes():
+    assert normalize_name("John Smith Jr. II") == "john smith"
+
+
+def test_keeps_a_name_that_is_only_a_suffix():
+    assert normalize_name("V") == "v"
+    assert normalize_name("Jr.") == "jr."
+
+
+def test_suffix_words_inside_a_name_are_kept():
+    assert normalize_name("Ii Jones") == "ii jones"
@@ -0,0 +1,138 @@
+"""Tests for splitting strategy documents into round-aware sections."""
+
+from strategy_index import StrategyIndex, split_sections
+
+MARKDOWN_GUIDE = """# Draft Guide
+
+Intro line.
+
+## Core Philosophy
+Win the week.
+
+### Rounds 3-5: Core Starters
+- Take WRs.
+
+## Late Rounds
+
+Round 10
+- Handcuffs.
+
+## Final Checklist
+- R1–2: Two studs.
+- R3–4: Fill RB2.
+- After the draft: set lineups.
+
+Good luck.
+"""
+
+NUMBERED_GUIDE = """The Ultimate Superflex Guide
+
+Use this as a playbook.
+
+1) Core philosophy: how SUPER_FLEX changes everything in a two quarterback room
+- QBs score the most.
+
+2) Round‑by‑round draft map (16 rounds)
+Short intro.
+- Rounds 1–2
+  - Take an elite QB.
+  - Or an elite WR.
+- Rounds 3–5
+  - Two QBs by here.
+
+3) Bye‑week management
+Checklist:
+1) Two QBs by Round 3.
+2) Take K last.
+
+Rules of thumb
+- Stagger QB byes.
+"""
+
+
+def by_title(sections):
+    return {s.title: s for s in sections}
+
+
+def test_markdown_headings_and_labels_nest():
+    sections = split_sections(MARKDOWN_GUIDE)
+    titles = [s.title for s in sections]
+    assert titles[:5] == [
+        "Draft Guide",
+        "Core Philosophy",
+        "Rounds 3-5: Core Starters",
+        "Late Rounds",
+        "Round 10",
+    ]
+    found = by_title(sections)
+    assert sections[found["Round 10"].parent].title == "Late Rounds"
+    assert found["Round 10"].rounds == (10, 10)
+
+
+def test_round_sections_are_never_core():
+    found = by_title(split_sections(MARKDOWN_GUIDE))
+    assert found["Draft Guide"].core
+    assert found["Core Philosophy"].core
+    assert found["Rounds 3-5: Core Starters"].rounds == (3, 5)
+    assert not found["Rounds 3-5: Core Starters"].core
+    assert not found["Late Rounds"].core
+
+
+def test_round_bullets_split_out_and_later_text_returns_to_parent():
+    found = by_title(split_sections(MARKDOWN_GUIDE))
+    checklist = found["Final Checklist"]
+    assert checklist.core
+    assert "After the draft" in checklist.text
+    assert "Good luck." in checklist.text
+
+    studs = found["R1–2: Two studs."]
+    assert studs.rounds == (1, 2)
+    assert not studs.core
+    assert studs.text == "- R1–2: Two studs."
+    assert found["R3–4: Fill RB2."].rounds == (3, 4)
+
+
+def test_numbered_headings_of_any_length():
+    sections = split_sections(NUMBERED_GUIDE)
+    found = by_title(sections)
+    assert sections[0].title == ""
+    assert "Use this as a playbook." in sections[0].text
+    core = found[
+        "1) Core philosophy: how SUPER_FLEX changes everything in a two quarterback room"
+    ]
+    assert core.core
+    assert "QBs score the most." in core.text
+    assert "Take an elite QB." not in sections[0].text
+
+
+def test_round_bullets_keep_their_sub_bullets():
+    found = by_title(split_sections(NUMBERED_GUIDE))
+    early = found["Rounds 1–2"]
+    assert early.rounds == (1, 2)
+    assert "Take an elite QB." in early.text
+    assert "Or an elite WR." in early.text
+    assert "Two QBs by here." not in early.text
+    assert found["Rounds 3–5"].rounds == (3, 5)
+    draft_map = found["2) Round‑by‑round draft map (16 rounds)"]
+    assert "Short intro." in draft_map.text
+    assert early.parent == found["Rounds 3–5"].parent
+
+
+def test_numbered_list_items_are_not_headings():
+    sections = split_sections(NUMBERED_GUIDE)
+    found = by_title(sections)
+    assert "1) Two QBs by Round 3." not in found
+    assert "2) Take K last." in found["3) Bye‑week management"].text
+    rules = found["Rules of thumb"]
+    assert sections[rules.parent].title == "3) Bye‑week management"
+    assert "Stagger QB byes." in rules.text
+
+
+def test_select_sends_core_and_current_round_only():
+    index = StrategyIndex(NUMBERED_GUIDE)
+    text = index.render(index.select(1, [], k=0))
+    assert "Take an elite QB." in text
+    assert "Two QBs by here." not in text
+    # The round section's parent heading comes along for context
+    assert "Short intro." in text
+    assert "QBs score the most." in text